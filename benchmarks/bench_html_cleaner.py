@@ -0,0 +1,72 @@
+"""
+HTML 정제 마이크로 벤치마크
+
+기존 BeautifulSoup 기반 _clean_html과 html_cleaner.clean_html의 처리 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_html_cleaner
+"""
+import re
+import timeit
+from bs4 import BeautifulSoup
+from src.collectors.html_cleaner import clean_html
+
+
+def clean_html_beautifulsoup(html_content: str) -> str:
+    """기존 구현 (BeautifulSoup 트리 생성 후 텍스트 추출)"""
+    if not html_content:
+        return ""
+    soup = BeautifulSoup(html_content, "html.parser")
+    text = soup.get_text(separator=" ", strip=True)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def make_truth_social_post() -> str:
+    """Truth Social summary 형태의 짧은 HTML"""
+    return (
+        "<p>THE GREAT STATE OF TEXAS HAS DONE IT AGAIN!&nbsp;Thank you to all of the "
+        "incredible Patriots who came out today. <a href=\"https://truthsocial.com/tags/MAGA\">"
+        "#MAGA</a></p><p>President DJT</p>"
+    )
+
+
+def make_white_house_article(paragraphs: int = 120) -> str:
+    """백악관 content:encoded 형태의 긴 HTML (수십 KB)"""
+    parts = ["<div class=\"wp-block-group\">"]
+    for i in range(paragraphs):
+        parts.append(
+            f"<p>Section {i}: The Administration today announced new measures &#8212; "
+            f"including <strong>expanded</strong> <em>support</em> for "
+            f"<a href=\"https://www.whitehouse.gov/briefings/{i}\">American workers</a>, "
+            f"families &amp; small businesses.</p>\n"
+        )
+        if i % 10 == 0:
+            parts.append("<ul><li>First point</li><li>Second point</li></ul><br/>\n")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def bench(name: str, html_content: str, number: int):
+    """두 구현의 결과 동일성 확인 후 평균 처리 시간 비교"""
+    assert clean_html(html_content) == clean_html_beautifulsoup(html_content)
+
+    baseline = timeit.timeit(lambda: clean_html_beautifulsoup(html_content), number=number) / number
+    current = timeit.timeit(lambda: clean_html(html_content), number=number) / number
+
+    print(
+        f"{name:<14} size={len(html_content):>7,}B  "
+        f"beautifulsoup={baseline * 1e6:>9.1f}us  "
+        f"html_cleaner={current * 1e6:>9.1f}us  "
+        f"speedup={baseline / current:>5.2f}x"
+    )
+
+
+def main():
+    bench("truth_social", make_truth_social_post(), number=5000)
+    bench("white_house", make_white_house_article(), number=100)
+    bench("plain_text", "No markup here,  just   text.\n" * 10, number=20000)
+
+
+if __name__ == "__main__":
+    main()
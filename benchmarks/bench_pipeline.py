@@ -0,0 +1,220 @@
+"""
+수집 파이프라인 벤치마크
+
+외부 네트워크/DB 없이 단계별 처리량(items/sec)과 지연(p50/p99)을 측정합니다.
+- RSS 피드: 생성된 고정 피드를 로컬 HTTP 서버로 제공
+- Redis: fakeredis (없으면 REDIS_CONFIG의 로컬 Redis)
+- Database: 메모리 대체 구현
+
+측정 단계:
+- fetch: HTTP 피드 호출
+- parse: feedparser 파싱
+- clean: 항목별 HTML 정제
+- collect: Collector.collect_raw_data 전체
+- db_save: Database.save_raw_data_batch (대체 구현)
+- publish: MessageQueue.publish_batch
+- run: Orchestrator 채널 파이프라인 전체 (checkpoint 조회 → 수집 → 저장 → 발행)
+
+실행:
+    python -m benchmarks.bench_pipeline --entries 100 --iterations 30
+    python -m benchmarks.bench_pipeline --output benchmarks/results/baseline.json
+
+결과는 JSON으로 저장되며, 커밋 간 비교로 성능 회귀를 확인할 수 있습니다.
+"""
+import argparse
+import json
+import math
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+import feedparser
+import httpx
+from benchmarks.fixtures import make_rss_feed
+from benchmarks.stubs import FeedServer, InMemoryDatabase, create_redis_client
+from src.collectors.html_cleaner import clean_html
+from src.collectors.truth_social import TruthSocialCollector
+from src.collectors.white_house import WhiteHouseCollector
+from src.infrastructure.message_queue import MessageQueue
+from src.infrastructure.state_store import StateStore
+from src.logger import setup_logging
+from src.orchestrator import Orchestrator
+
+DEFAULT_OUTPUT_DIR = Path("benchmarks/results")
+
+# 채널별 Collector와 피드 형태
+CHANNELS = {
+    "truth_social": (TruthSocialCollector, False),
+    "white_house": (WhiteHouseCollector, True),
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """nearest-rank 방식 백분위수"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(func: Callable[[], int], iterations: int, setup: Callable[[], None] = None) -> Dict:
+    """
+    func를 반복 실행하여 처리량과 지연 측정
+
+    Args:
+        func: 한 번 실행 후 처리한 항목 수를 반환하는 함수
+        iterations: 반복 횟수
+        setup: 매 반복 전에 실행할 준비 함수 (측정에서 제외)
+
+    Returns:
+        단계별 측정 결과
+    """
+    latencies = []
+    items = 0
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        items += func()
+        latencies.append(time.perf_counter() - started)
+
+    total = sum(latencies)
+    return {
+        "iterations": iterations,
+        "items": items,
+        "items_per_sec": round(items / total, 1) if total else None,
+        "mean_ms": round(total / iterations * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def bench_channel(name: str, feed_url: str, feed_body: bytes, iterations: int, redis_client) -> Dict[str, Dict]:
+    """한 채널의 단계별 벤치마크"""
+    collector_class, content_encoded = CHANNELS[name]
+
+    collector = collector_class()
+    collector.RSS_FEED_URL = feed_url
+
+    feed = feedparser.parse(feed_body)
+    entry_count = len(feed.entries)
+    contents = [
+        entry.content[0].value if content_encoded and hasattr(entry, "content") else entry.get("summary", "")
+        for entry in feed.entries
+    ]
+    # Orchestrator와 같이 저장 / 발행은 RawRecord로 측정
+    collected = [raw_data.to_record() for raw_data in collector.collect_raw_data(None)]
+
+    state_store = StateStore(redis_client=redis_client)
+    # 반복마다 Checkpoint를 지우므로 캐시 없이 매번 Redis에서 조회
+    state_store.cache_ttl_seconds = 0
+    state_store.foreign_cache_ttl_seconds = 0
+    database = InMemoryDatabase()
+    message_queue = MessageQueue(redis_client=redis_client)
+    orchestrator = Orchestrator(
+        collectors=[collector],
+        state_store=state_store,
+        database=database,
+        message_queue=message_queue,
+    )
+    channel = collector.get_channel()
+
+    def reset_state():
+        redis_client.delete(f"checkpoint:{channel.value}", f"validators:{channel.value}")
+        collector.validators = {}
+
+    def fetch():
+        httpx.get(feed_url).raise_for_status()
+        return entry_count
+
+    def parse():
+        return len(feedparser.parse(feed_body).entries)
+
+    def clean():
+        for content in contents:
+            clean_html(content)
+        return len(contents)
+
+    def collect():
+        return len(collector.collect_raw_data(None))
+
+    def db_save():
+        return len(database.save_raw_data_batch(collected))
+
+    def publish():
+        return len(message_queue.publish_batch(collected))
+
+    def run():
+        return orchestrator._run_collector(collector)
+
+    return {
+        f"{name}.fetch": measure(fetch, iterations),
+        f"{name}.parse": measure(parse, iterations),
+        f"{name}.clean": measure(clean, iterations),
+        f"{name}.collect": measure(collect, iterations),
+        f"{name}.db_save": measure(db_save, iterations),
+        f"{name}.publish": measure(publish, iterations),
+        f"{name}.run": measure(run, iterations, setup=reset_state),
+    }
+
+
+def git_commit() -> str:
+    """현재 커밋 해시 (git이 없으면 unknown)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 파이프라인 벤치마크")
+    parser.add_argument("--entries", type=int, default=100, help="피드 항목 수")
+    parser.add_argument("--content-bytes", type=int, default=2000, help="항목별 HTML 본문 크기")
+    parser.add_argument("--iterations", type=int, default=30, help="단계별 반복 횟수")
+    parser.add_argument("--channel", choices=[*CHANNELS, "all"], default="all", help="측정할 채널")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    setup_logging(level="WARNING")
+
+    channels = list(CHANNELS) if args.channel == "all" else [args.channel]
+    feeds = {
+        f"/{name}": make_rss_feed(args.entries, args.content_bytes, content_encoded=CHANNELS[name][1])
+        for name in channels
+    }
+    redis_client = create_redis_client()
+
+    stages = {}
+    with FeedServer(feeds) as server:
+        for name in channels:
+            stages.update(bench_channel(name, server.url(f"/{name}"), feeds[f"/{name}"], args.iterations, redis_client))
+
+    commit = git_commit()
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "params": {
+            "entries": args.entries,
+            "content_bytes": args.content_bytes,
+            "iterations": args.iterations,
+            "redis": type(redis_client).__module__.split(".")[0],
+        },
+        "stages": stages,
+    }
+
+    for stage, stats in stages.items():
+        print(
+            f"{stage:<24} {stats['items_per_sec'] or 0:>12,.1f} items/s  "
+            f"p50={stats['p50_ms']:>9.3f}ms  p99={stats['p99_ms']:>9.3f}ms"
+        )
+
+    output = args.output or DEFAULT_OUTPUT_DIR / f"pipeline-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
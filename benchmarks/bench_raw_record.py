@@ -0,0 +1,130 @@
+"""
+RawData / RawRecord 마이크로 벤치마크
+
+100k건 기준으로 항목 생성, 직렬화(to_dict + json.dumps), 상호 변환 시간과
+항목을 보관하는 데 필요한 메모리를 비교합니다.
+
+- pydantic: RawData(...) 검증 생성 + model_dump(mode='json')
+- record: RawRecord(...) 생성 + RawRecord.to_dict()
+- to_record / from_record: RawData ↔ RawRecord 변환 (검증 없음)
+  (from_record는 같은 값으로 RawData(...)를 검증 생성하는 것과 비교)
+
+실행:
+    python -m benchmarks.bench_raw_record [--items 100000]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
+
+BASE_TIME = datetime(2025, 11, 21, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_fields(count: int) -> List[tuple]:
+    """항목 필드 (content, link, published_at, channel, id)"""
+    return [
+        (
+            f"Post number {index} with some representative text content.",
+            f"https://example.com/posts/{index}",
+            BASE_TIME - timedelta(seconds=index),
+            Channel.TRUTH_SOCIAL,
+            index,
+        )
+        for index in range(count)
+    ]
+
+
+def build_pydantic(fields: List[tuple]) -> list:
+    return [
+        RawData(content=content, link=link, published_at=published_at, channel=channel, id=id)
+        for content, link, published_at, channel, id in fields
+    ]
+
+
+def build_record(fields: List[tuple]) -> list:
+    return [RawRecord(content, link, published_at, channel, id) for content, link, published_at, channel, id in fields]
+
+
+def serialize_pydantic(items: list) -> int:
+    return sum(len(json.dumps(item.model_dump(mode="json"), ensure_ascii=False)) for item in items)
+
+
+def serialize_record(items: list) -> int:
+    return sum(len(json.dumps(item.to_dict(), ensure_ascii=False)) for item in items)
+
+
+def timed(func: Callable, *args) -> float:
+    """실행 시간 (초)"""
+    gc.collect()
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+def retained_bytes(build: Callable, fields: List[tuple]) -> int:
+    """
+    생성한 항목을 보관하는 데 필요한 메모리 (tracemalloc 기준)
+
+    RawRecord는 입력 문자열을 그대로 참조하고, RawData는 검증 중 문자열을 새로 만듭니다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    items = build(fields)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RawData / RawRecord 벤치마크")
+    parser.add_argument("--items", type=int, default=100_000, help="항목 수")
+    args = parser.parse_args()
+
+    fields = make_fields(args.items)
+
+    # 두 직렬화 결과가 같은지 먼저 확인
+    sample = build_pydantic(fields[:100])
+    assert [item.model_dump(mode="json") for item in sample] == [item.to_record().to_dict() for item in sample]
+
+    pydantic_items = build_pydantic(fields)
+    record_items = build_record(fields)
+
+    results = {
+        "build": (timed(build_pydantic, fields), timed(build_record, fields)),
+        "serialize": (timed(serialize_pydantic, pydantic_items), timed(serialize_record, record_items)),
+        "to_record": (None, timed(lambda items: [item.to_record() for item in items], pydantic_items)),
+        "from_record": (
+            timed(build_pydantic, [(r.content, r.link, r.published_at, r.channel, r.id) for r in record_items]),
+            timed(lambda items: [RawData.from_record(item) for item in items], record_items),
+        ),
+    }
+
+    print(f"items={args.items:,}")
+    for stage, (baseline, current) in results.items():
+        if baseline is None:
+            print(f"{stage:<12} {current * 1e9 / args.items:>9.0f}ns/item")
+            continue
+        print(
+            f"{stage:<12} pydantic={baseline * 1e9 / args.items:>7.0f}ns/item  "
+            f"record={current * 1e9 / args.items:>7.0f}ns/item  "
+            f"speedup={baseline / current:>5.2f}x"
+        )
+
+    pydantic_bytes = retained_bytes(build_pydantic, fields)
+    record_bytes = retained_bytes(build_record, fields)
+    print(
+        f"{'memory':<12} pydantic={pydantic_bytes / args.items:>7.0f}B/item  "
+        f"record={record_bytes / args.items:>7.0f}B/item  "
+        f"ratio={pydantic_bytes / record_bytes:>5.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
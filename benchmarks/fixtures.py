@@ -0,0 +1,68 @@
+"""
+벤치마크용 RSS 피드 생성
+
+실제 피드와 같은 구조(최신 항목이 먼저 오는 RSS 2.0)를 원하는 크기로 만듭니다.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+
+# 항목 발행 시간 기준 (가장 최신 항목)
+BASE_TIME = datetime(2025, 11, 21, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_html_body(index: int, content_bytes: int) -> str:
+    """content_bytes 내외 크기의 HTML 본문"""
+    paragraph = (
+        f"<p>Item {index}: The Administration today announced new measures &#8212; "
+        f"including <strong>expanded</strong> support for "
+        f"<a href=\"https://example.com/{index}\">American workers</a> &amp; families.</p>"
+    )
+    repeat = max(1, content_bytes // len(paragraph))
+    return paragraph * repeat
+
+
+def make_rss_feed(entries: int, content_bytes: int = 500, content_encoded: bool = False) -> bytes:
+    """
+    RSS 2.0 피드 생성 (발행 시간 내림차순)
+
+    Args:
+        entries: 항목 수
+        content_bytes: 항목별 HTML 본문 크기 (대략)
+        content_encoded: True면 본문을 content:encoded에 넣음 (백악관 형태),
+            False면 description에 넣음 (Truth Social 형태)
+
+    Returns:
+        UTF-8로 인코딩된 RSS 문서
+    """
+    items = []
+    for index in range(entries):
+        published_at = BASE_TIME - timedelta(minutes=index)
+        body = make_html_body(index, content_bytes)
+        if content_encoded:
+            content = (
+                f"<description>Summary {index}</description>"
+                f"<content:encoded><![CDATA[{body}]]></content:encoded>"
+            )
+        else:
+            content = f"<description>{escape(body)}</description>"
+
+        items.append(
+            "<item>"
+            f"<title>Item {index}</title>"
+            f"<link>https://example.com/posts/{index}</link>"
+            f"<guid>https://example.com/posts/{index}</guid>"
+            f"<pubDate>{format_datetime(published_at)}</pubDate>"
+            f"{content}"
+            "</item>"
+        )
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        "<channel><title>Benchmark Feed</title><link>https://example.com</link>"
+        "<description>Generated feed</description>"
+        f"{''.join(items)}"
+        "</channel></rss>"
+    )
+    return document.encode("utf-8")
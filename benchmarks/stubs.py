@@ -0,0 +1,87 @@
+"""
+벤치마크용 로컬 대체 구성요소
+
+- FeedServer: 고정 RSS 문서를 제공하는 프로세스 내 HTTP 서버
+- InMemoryDatabase: Database와 같은 인터페이스의 메모리 저장소
+- create_redis_client: fakeredis(설치된 경우) 또는 로컬 Redis 클라이언트
+"""
+import itertools
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+import redis
+from src.models.raw_data import RawData
+from config.redis import REDIS_CONFIG
+
+
+class FeedServer:
+    """경로별 RSS 문서를 제공하는 로컬 HTTP 서버"""
+
+    def __init__(self, feeds: Dict[str, bytes]):
+        """
+        Args:
+            feeds: 경로("/truth_social" 등) → 응답 본문
+        """
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = feeds.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        """경로에 해당하는 전체 URL"""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class InMemoryDatabase:
+    """Database 대체 (ID 할당만 수행)"""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self.rows: List[RawData] = []
+
+    def save_raw_data(self, raw_data: RawData) -> RawData:
+        raw_data.id = next(self._ids)
+        self.rows.append(raw_data)
+        return raw_data
+
+    def save_raw_data_batch(self, raw_data_list: List[RawData]) -> List[RawData]:
+        for raw_data in raw_data_list:
+            self.save_raw_data(raw_data)
+        return raw_data_list
+
+
+def create_redis_client() -> redis.Redis:
+    """fakeredis가 있으면 사용하고, 없으면 REDIS_CONFIG의 로컬 Redis에 연결"""
+    try:
+        import fakeredis
+    except ImportError:
+        return redis.Redis(
+            host=REDIS_CONFIG["host"],
+            port=REDIS_CONFIG["port"],
+            db=REDIS_CONFIG["db"],
+            decode_responses=True
+        )
+    return fakeredis.FakeRedis(decode_responses=True)
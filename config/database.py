@@ -14,3 +14,30 @@ DB_CONFIG = {
     "wallet_location": os.environ.get("DB_WALLET_LOCATION", "/path/to/wallet/directory"),
     "wallet_password": os.environ.get("DB_WALLET_PASSWORD", "YOUR_WALLET_PASSWORD"),
 }
+
+# Connection Pool 설정
+DB_POOL_CONFIG = {
+    # 최소/최대 연결 수 (최대값은 수집 동시 실행 수 SCHEDULER_CONFIG['max_workers'] 이상 권장)
+    "min": int(os.environ.get("DB_POOL_MIN", "2")),
+    "max": int(os.environ.get("DB_POOL_MAX", "4")),
+    "increment": int(os.environ.get("DB_POOL_INCREMENT", "1")),
+    # 연결별 SQL 문 캐시 크기
+    "stmtcachesize": int(os.environ.get("DB_POOL_STMTCACHESIZE", "20")),
+    # 모든 연결이 사용 중일 때 acquire 대기 한도 (밀리초, 초과 시 예외)
+    "wait_timeout_ms": int(os.environ.get("DB_POOL_WAIT_TIMEOUT_MS", "5000")),
+    # 유휴 연결을 이 시간(초) 이후 acquire할 때 연결 상태 확인 (음수면 확인 안 함)
+    "ping_interval": int(os.environ.get("DB_POOL_PING_INTERVAL", "60")),
+    # 시작 시 최소 연결 수만큼 미리 연결
+    "prewarm": os.environ.get("DB_POOL_PREWARM", "true").lower() == "true",
+}
+
+# Transactional outbox 설정
+OUTBOX_CONFIG = {
+    # raw_data 저장과 같은 트랜잭션에 raw_data_outbox 행을 기록하고,
+    # 수집 흐름에서 직접 발행하는 대신 OutboxRelay가 발행 (sql/ddl.sql의 raw_data_outbox 필요)
+    "enabled": os.environ.get("DB_OUTBOX_ENABLED", "false").lower() == "true",
+    # 한 트랜잭션에서 잠그고 발행할 최대 행 수
+    "batch_size": int(os.environ.get("DB_OUTBOX_BATCH_SIZE", "500")),
+    # relay 실행 주기 (초)
+    "relay_interval_seconds": int(os.environ.get("DB_OUTBOX_RELAY_INTERVAL_SECONDS", "5")),
+}
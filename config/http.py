@@ -0,0 +1,38 @@
+"""
+HTTP 클라이언트 설정
+
+비동기 수집 모드에서 모든 Collector가 공유하는 httpx.AsyncClient 설정과
+모든 Collector에 공통으로 적용되는 피드 요청 정책(타임아웃, 재시도, 서킷 브레이커)입니다.
+"""
+
+HTTP_CONFIG = {
+    # HTTP/2 사용 여부 (h2 패키지 필요)
+    "http2": True,
+    # Connection Pool 크기
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    # keep-alive 연결 유지 시간 (초)
+    "keepalive_expiry": 60.0,
+}
+
+# 피드 요청 정책 (BaseCollector._fetch / _fetch_async)
+FETCH_CONFIG = {
+    # 타임아웃 (초): 연결은 짧게, 응답 읽기는 피드 크기를 고려해 조금 길게
+    "connect_timeout": 3.0,
+    "read_timeout": 10.0,
+    "write_timeout": 5.0,
+    "pool_timeout": 5.0,
+
+    # 재시도: 연결 오류, 타임아웃, 429 / 5xx 응답만 재시도 (최초 요청 제외 횟수)
+    "max_retries": 2,
+    # 지수 백오프 (full jitter): random(0, min(max, base * 2^attempt))
+    "backoff_base_seconds": 0.5,
+    "backoff_max_seconds": 5.0,
+    # Retry-After가 이 값(초)보다 길면 재시도하지 않고 다음 수집 주기로 넘김
+    "retry_after_max_seconds": 30.0,
+
+    # 서킷 브레이커: 연속 실패가 threshold회 이상이면 cooldown 동안 요청 생략
+    # (실패: 재시도를 소진한 연결 오류 / 429 / 5xx, 재시도하지 않는 401 / 403 / 404 / 410)
+    "breaker_failure_threshold": 3,
+    "breaker_cooldown_seconds": 300.0,
+}
@@ -0,0 +1,14 @@
+"""
+메트릭 설정
+
+모든 값은 환경변수로 오버라이드 가능합니다.
+"""
+import os
+
+METRICS_CONFIG = {
+    # /metrics HTTP 엔드포인트 사용 여부
+    "enabled": os.environ.get("METRICS_ENABLED", "true").lower() == "true",
+    # 기본은 로컬에서만 접근 가능 (외부 scrape가 필요하면 METRICS_HOST=0.0.0.0 등으로 명시)
+    "host": os.environ.get("METRICS_HOST", "127.0.0.1"),
+    "port": int(os.environ.get("METRICS_PORT", "9100")),
+}
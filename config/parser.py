@@ -0,0 +1,17 @@
+"""
+피드 파싱 설정
+
+모든 값은 환경변수로 오버라이드 가능합니다.
+"""
+import os
+
+PARSER_CONFIG = {
+    # 파싱/정제 전용 프로세스 수 (0이면 수집 스레드에서 직접 파싱)
+    "process_workers": int(os.environ.get("PARSER_PROCESS_WORKERS", "0")),
+    # 이 크기 이상인 피드만 프로세스 풀로 넘김 (작은 피드는 전달 비용이 더 큼)
+    "min_offload_bytes": int(os.environ.get("PARSER_MIN_OFFLOAD_BYTES", str(64 * 1024))),
+    # 워커 프로세스 시작 방식 ("forkserver" 또는 "spawn")
+    # 수집 스레드가 도는 프로세스에서 fork하면 잠긴 lock까지 복제되므로 fork는 사용하지 않음
+    # (forkserver를 지원하지 않는 플랫폼에서는 spawn 사용)
+    "start_method": os.environ.get("PARSER_START_METHOD", "forkserver"),
+}
@@ -12,3 +12,65 @@ REDIS_CONFIG = {
     "port": int(os.environ.get("REDIS_PORT", "6379")),
     "db": int(os.environ.get("REDIS_DB", "0")),
 }
+
+# Redis Streams 발행 설정
+STREAM_CONFIG = {
+    "name": "trump-scan:data-collection:raw-data",
+    # 메시지 payload 인코딩 ("json" | "orjson" | "msgpack", orjson/msgpack은 별도 설치 필요)
+    # 소비자는 src.infrastructure.message_codec.decode_message()로 읽으며,
+    # msgpack은 바이너리이므로 decode_responses=False 클라이언트로 읽어야 함
+    "codec": os.environ.get("REDIS_STREAM_CODEC", "json"),
+    # payload 압축 ("none" | "zlib" | "zstd", zstd는 zstandard 별도 설치 필요)
+    # 압축된 payload는 바이너리이므로 decode_responses=False 클라이언트로 읽어야 함
+    "compression": os.environ.get("REDIS_STREAM_COMPRESSION", "none"),
+    # 이 크기(bytes) 이상인 payload만 압축
+    "compression_min_bytes": int(os.environ.get("REDIS_STREAM_COMPRESSION_MIN_BYTES", "4096")),
+    # 발행 내용 ("full" | "reference")
+    # - "full": content를 포함한 전체 메시지
+    # - "reference": id와 메타데이터만 발행, 소비자가 Database.get_raw_data_by_ids()로 content 조회
+    "payload": os.environ.get("REDIS_STREAM_PAYLOAD", "full"),
+    # 일괄 발행 시 메시지 XADD를 MULTI/EXEC로 묶을지 여부 (다른 클라이언트에 배치가 한 번에 보이도록)
+    # Checkpoint 등 상태 기록은 이 설정과 관계없이 모든 XADD가 성공한 뒤 별도 MULTI/EXEC로 기록됨
+    "transaction": os.environ.get("REDIS_STREAM_TRANSACTION", "false").lower() == "true",
+
+    # 보존 정책 (발행 시 근사 트리밍 적용)
+    # - "none": 트리밍 안 함 (기본값, 스트림 크기는 소비자 쪽에서 관리)
+    # - "maxlen": 최근 maxlen개 메시지만 유지 (XADD MAXLEN ~)
+    # - "minid": retention_seconds보다 오래된 메시지 제거 (XADD MINID ~)
+    # 주의: 트리밍은 소비자 그룹의 읽기 / ACK 여부를 보지 않음
+    # 느리거나 멈춘 소비자 그룹이 아직 읽지 않은 메시지나 pending(미ACK) 메시지도 삭제되어 유실됨
+    # 가장 느린 그룹의 lag(XINFO GROUPS)보다 충분히 큰 보존량으로만 켜고, lag를 모니터링할 것
+    "retention": os.environ.get("REDIS_STREAM_RETENTION", "none"),
+    "maxlen": int(os.environ.get("REDIS_STREAM_MAXLEN", "100000")),
+    "retention_seconds": int(os.environ.get("REDIS_STREAM_RETENTION_SECONDS", str(7 * 24 * 60 * 60))),
+    # 백그라운드 트리밍 주기 (초, 0이면 사용 안 함)
+    "trim_interval_seconds": int(os.environ.get("REDIS_STREAM_TRIM_INTERVAL_SECONDS", "0")),
+}
+
+# 중복 제거 인덱스 설정
+DEDUP_CONFIG = {
+    # 수집 항목 해시 보관 기간 (초)
+    "ttl_seconds": int(os.environ.get("REDIS_DEDUP_TTL_SECONDS", str(30 * 24 * 60 * 60))),
+}
+
+# Checkpoint 저장 설정
+CHECKPOINT_CONFIG = {
+    # 쓰기 지연 모드: Checkpoint를 메모리에 모았다가 주기적으로 한 번에 기록
+    # (발행이 끝난 Checkpoint만 모으며, 기록 전 종료 시 마지막 기록 지점부터 다시 수집)
+    # Redis에 반영되지 않은 구간은 최대 flush_interval_seconds:
+    # - start(): 기록 작업이 flush_interval_seconds마다 flush
+    # - run() / run_async(): 실행이 끝날 때 flush
+    # - shutdown(): 종료 전 flush
+    # 비정상 종료 시 이 구간의 항목은 다시 수집되며, 중복 제거 인덱스 / DB unique 인덱스가 걸러냄
+    "write_behind": os.environ.get("REDIS_CHECKPOINT_WRITE_BEHIND", "false").lower() == "true",
+    # 쓰기 지연 모드의 기록 주기 (초, 1 이상)
+    "flush_interval_seconds": int(os.environ.get("REDIS_CHECKPOINT_FLUSH_INTERVAL_SECONDS", "30")),
+    # 프로세스 내 Checkpoint 캐시 유효 시간 (초, 지나면 Redis에서 다시 확인)
+    # (이 인스턴스가 기록한 Checkpoint에만 적용, 기록 시 다른 기록자를 발견하면 아래 값으로 낮춤)
+    "cache_ttl_seconds": int(os.environ.get("REDIS_CHECKPOINT_CACHE_TTL_SECONDS", "300")),
+    # 다른 인스턴스가 기록한 Checkpoint의 캐시 유효 시간 (초)
+    # 시작 시 일괄 조회 결과를 첫 수집에 재사용할 정도로만 짧게 유지
+    "foreign_cache_ttl_seconds": int(os.environ.get("REDIS_CHECKPOINT_FOREIGN_CACHE_TTL_SECONDS", "5")),
+    # Checkpoint 기록자 식별자 (비어 있으면 호스트명:PID)
+    "instance_id": os.environ.get("REDIS_CHECKPOINT_INSTANCE_ID", ""),
+}
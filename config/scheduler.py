@@ -3,12 +3,23 @@
 """
 
 SCHEDULER_CONFIG = {
-    # 수집 작업 스케줄 설정
-    "trigger": "interval",
-    "minutes": 1,
-    "id": "collect_job",
+    # 수집 작업 이름 (채널별 작업 이름의 접두어)
     "name": "데이터 수집 작업",
 
+    # 채널별 수집 주기 기본값 (Collector가 선언하지 않은 경우 사용)
+    # 새 데이터가 있으면 최소 주기로 돌아가고, 없거나 실패하면 최대 주기까지 지수적으로 늘어남
+    "min_interval_seconds": 60,
+    "max_interval_seconds": 600,
+    "backoff_factor": 2.0,
+
+    # 실행 모드
+    # - "thread": Collector별 파이프라인을 스레드 풀에서 실행
+    # - "async": 단일 이벤트 루프에서 공유 HTTP 클라이언트로 실행
+    "mode": "thread",
+
+    # Collector 동시 실행 수 (채널별 수집 파이프라인을 병렬 실행)
+    "max_workers": 4,
+
     # 추가 스케줄러 옵션 (필요 시 사용)
     # "misfire_grace_time": 60,  # 실행 시간을 놓쳤을 때 몇 초까지 실행할지
     # "coalesce": True,  # 여러 번 누락된 실행을 하나로 합칠지
@@ -6,12 +6,17 @@
 import signal
 import sys
 from src.logger import setup_logging, get_logger
+from src.collectors.feed_parser import start_parse_executor
+from src.metrics import start_metrics_server
 from src.orchestrator import Orchestrator
 from src.collectors.truth_social import TruthSocialCollector
 from src.collectors.white_house import WhiteHouseCollector
 from src.infrastructure.state_store import StateStore
 from src.infrastructure.database import Database
+from src.infrastructure.async_database import AsyncDatabase
 from src.infrastructure.message_queue import MessageQueue
+from src.infrastructure.dedup_index import DedupIndex
+from config.scheduler import SCHEDULER_CONFIG
 
 
 def main():
@@ -22,10 +27,18 @@ def main():
 
     logger.info("Data Collection Layer Started")
 
+    # 파싱 프로세스 풀은 스레드(메트릭 서버, 스케줄러)를 만들기 전에 생성
+    start_parse_executor()
+
+    # 메트릭 엔드포인트 시작 (/metrics)
+    start_metrics_server()
+
     # 인프라 컴포넌트 생성
     state_store = StateStore()
-    database = Database()
+    # 비동기 모드에서는 이벤트 루프에서 직접 저장하는 AsyncDatabase 사용
+    database = AsyncDatabase() if SCHEDULER_CONFIG["mode"] == "async" else Database()
     message_queue = MessageQueue()
+    dedup_index = DedupIndex()
 
     # Collector 등록
     collectors = [
@@ -40,6 +53,7 @@ def main():
         state_store=state_store,
         database=database,
         message_queue=message_queue,
+        dedup_index=dedup_index,
     )
 
     # 시그널 핸들러 등록 (우아한 종료)
@@ -0,0 +1,199 @@
+"""
+원본 데이터 재발행(replay / backfill) 진입점
+
+Oracle DB의 raw_data를 발행 시간 순으로 읽어 Redis Streams에 다시 발행합니다.
+다음 레이어가 상태를 잃었을 때 원천 채널을 다시 수집하지 않고 복구하는 용도입니다.
+
+사용 예:
+    python replay.py --channel truth_social --since 2025-11-01T00:00:00+00:00 --rate 500
+    python replay.py --job nov-backfill --since 2025-11-01T00:00:00+00:00   # 중단 후 같은 명령으로 이어서 실행
+
+- DB는 keyset 페이지(batch_size)로 읽으므로 메모리 사용량이 일정합니다.
+- 페이지마다 단일 Redis pipeline으로 발행하고, 발행이 성공한 뒤 진행 위치를 기록합니다.
+  중단되면 마지막으로 발행한 페이지 다음부터 이어서 실행합니다 (최소 1회 전달).
+- 끝까지 실행한 작업은 완료로 표시되며, 같은 작업을 다시 실행하면 발행하지 않고 경고만 남깁니다.
+  다시 재발행하려면 --reset을 사용합니다.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+import redis
+from src.logger import setup_logging, get_logger
+from src.infrastructure.database import Database
+from src.infrastructure.message_queue import MessageQueue
+from src.models.channel import Channel
+
+PROGRESS_KEY_PREFIX = "replay:progress:"
+
+
+def parse_datetime(value: str) -> datetime:
+    """ISO 8601 문자열을 timezone-aware datetime으로 변환 (타임존 없으면 UTC)"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="raw_data를 Redis Streams에 재발행")
+    parser.add_argument(
+        "--channel", choices=[channel.value for channel in Channel], default=None, help="재발행할 채널 (기본: 전체)"
+    )
+    parser.add_argument("--since", type=parse_datetime, default=None, help="이 발행 시간 이후(포함)부터 (ISO 8601)")
+    parser.add_argument("--until", type=parse_datetime, default=None, help="이 발행 시간 이전(미포함)까지 (ISO 8601)")
+    parser.add_argument("--batch-size", type=int, default=500, help="DB 페이지 및 발행 pipeline 크기")
+    parser.add_argument("--rate", type=float, default=0, help="초당 최대 발행 건수 (0이면 제한 없음)")
+    parser.add_argument("--job", default=None, help="진행 위치를 저장할 작업 이름 (기본: 채널/구간으로 생성)")
+    parser.add_argument("--reset", action="store_true", help="저장된 진행 위치를 무시하고 처음부터 실행")
+    return parser.parse_args(argv)
+
+
+def default_job_name(args: argparse.Namespace) -> str:
+    """채널과 구간으로 작업 이름 생성"""
+    since = args.since.isoformat() if args.since else "begin"
+    until = args.until.isoformat() if args.until else "end"
+    return f"{args.channel or 'all'}:{since}:{until}"
+
+
+def load_progress(redis_client: redis.Redis, progress_key: str) -> Optional[Dict[str, str]]:
+    """
+    저장된 진행 위치 조회
+
+    Returns:
+        {"published_at", "id", "count"} (완료된 작업은 "completed_at" 포함) 또는 None
+    """
+    progress = redis_client.hgetall(progress_key)
+    return progress or None
+
+
+def replay(
+    database: Database,
+    message_queue: MessageQueue,
+    progress_key: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    channel: Optional[Channel] = None,
+    batch_size: int = 500,
+    rate: float = 0,
+    resume: bool = True,
+) -> int:
+    """
+    raw_data를 페이지 단위로 읽어 재발행
+
+    Args:
+        database: 원본 데이터 조회 인프라
+        message_queue: 재발행할 메시지 큐
+        progress_key: 진행 위치를 저장할 Redis 키
+        since: 이 발행 시간 이후(포함)부터
+        until: 이 발행 시간 이전(미포함)까지
+        channel: 특정 채널만 재발행 (없으면 전체)
+        batch_size: 페이지 크기
+        rate: 초당 최대 발행 건수 (0이면 제한 없음)
+        resume: 저장된 진행 위치부터 이어서 실행할지 여부
+
+    Returns:
+        이번 실행에서 발행한 건수 (이미 완료된 작업이면 0)
+    """
+    logger = get_logger(__name__)
+    redis_client = message_queue.redis_client
+
+    after_id = None
+    total = 0
+    progress = load_progress(redis_client, progress_key) if resume else None
+    if progress and "completed_at" in progress:
+        logger.warning(
+            "이미 완료된 작업 - 다시 재발행하려면 --reset 사용",
+            job=progress_key,
+            count=int(progress.get("count", 0)),
+            completed_at=progress["completed_at"]
+        )
+        return 0
+    if progress:
+        since = parse_datetime(progress["published_at"])
+        after_id = int(progress["id"])
+        total = int(progress.get("count", 0))
+        logger.info("저장된 위치부터 재발행", job=progress_key, published_at=since, id=after_id, count=total)
+    elif not resume:
+        redis_client.delete(progress_key)
+
+    published = 0
+    started = time.monotonic()
+
+    for page in database.iter_raw_data(
+        since=since, channel=channel, batch_size=batch_size, until=until, after_id=after_id
+    ):
+        last = page[-1]
+        total += len(page)
+
+        # 발행이 성공한 뒤에만 진행 위치 기록
+        def after_publish(pipe):
+            pipe.hset(
+                progress_key,
+                mapping={"published_at": last.published_at.isoformat(), "id": last.id, "count": total},
+            )
+
+        message_queue.publish_batch(page, after_publish=after_publish)
+        published += len(page)
+
+        logger.info("재발행 진행", job=progress_key, published=published, last_published_at=last.published_at)
+
+        # 속도 제한: 누적 발행 건수 기준으로 대기
+        if rate > 0:
+            wait = published / rate - (time.monotonic() - started)
+            if wait > 0:
+                time.sleep(wait)
+
+    # 완료 표시 (같은 작업을 다시 실행하면 발행하지 않음)
+    redis_client.hset(
+        progress_key, mapping={"count": total, "completed_at": datetime.now(timezone.utc).isoformat()}
+    )
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        "재발행 완료",
+        job=progress_key,
+        published=published,
+        total=total,
+        elapsed_seconds=round(elapsed, 3),
+        rate=round(published / elapsed, 1) if elapsed > 0 else None
+    )
+    return published
+
+
+def main(argv=None):
+    """재발행 명령 시작점"""
+    args = parse_args(argv)
+
+    setup_logging(level="INFO")
+    logger = get_logger(__name__)
+
+    progress_key = PROGRESS_KEY_PREFIX + (args.job or default_job_name(args))
+    logger.info("재발행 시작", job=progress_key, channel=args.channel, since=args.since, until=args.until)
+
+    database = Database()
+    message_queue = MessageQueue()
+
+    try:
+        replay(
+            database,
+            message_queue,
+            progress_key,
+            since=args.since,
+            until=args.until,
+            channel=Channel(args.channel) if args.channel else None,
+            batch_size=args.batch_size,
+            rate=args.rate,
+            resume=not args.reset,
+        )
+    except KeyboardInterrupt:
+        logger.info("재발행 중단 - 같은 명령으로 이어서 실행할 수 있습니다", job=progress_key)
+        sys.exit(130)
+    finally:
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ CREATE TABLE raw_data (
     link VARCHAR2(2000) NOT NULL,       -- 포스트 링크
     published_at TIMESTAMP WITH TIME ZONE NOT NULL,    -- 발행 시간 (원본 게시 시간)
     channel VARCHAR2(50) NOT NULL,      -- 수집 채널 (TRUTH_SOCIAL, NEWS 등)
+    content_hash VARCHAR2(64),          -- 중복 판별 해시 (채널 + 링크 + 정규화된 내용의 SHA-256)
 
     -- 메타 데이터
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL  -- 생성 시간 (시스템 기록)
@@ -16,6 +17,7 @@ CREATE TABLE raw_data (
 CREATE INDEX idx_raw_data_published_at ON raw_data(published_at);
 CREATE INDEX idx_raw_data_channel ON raw_data(channel);
 CREATE INDEX idx_raw_data_created_at ON raw_data(created_at);
+CREATE UNIQUE INDEX uq_raw_data_content_hash ON raw_data(content_hash);
 
 -- 테이블 코멘트
 COMMENT ON TABLE raw_data IS '트럼프 대통령 발언 원본 데이터';
@@ -24,4 +26,22 @@ COMMENT ON COLUMN raw_data.content IS '포스트 내용 (전체 텍스트)';
 COMMENT ON COLUMN raw_data.link IS '포스트 원본 링크 URL';
 COMMENT ON COLUMN raw_data.published_at IS '원본 게시 시간';
 COMMENT ON COLUMN raw_data.channel IS '수집 채널';
-COMMENT ON COLUMN raw_data.created_at IS '데이터 생성 시간 (시스템 기록)';
\ No newline at end of file
+COMMENT ON COLUMN raw_data.content_hash IS '중복 판별 해시 (SHA-256)';
+COMMENT ON COLUMN raw_data.created_at IS '데이터 생성 시간 (시스템 기록)';
+-- 기존 테이블 마이그레이션 (content_hash 추가)
+-- ALTER TABLE raw_data ADD (content_hash VARCHAR2(64));
+-- CREATE UNIQUE INDEX uq_raw_data_content_hash ON raw_data(content_hash);
+-- COMMENT ON COLUMN raw_data.content_hash IS '중복 판별 해시 (SHA-256)';
+
+-- Transactional outbox (OUTBOX_CONFIG["enabled"] = True일 때 사용)
+-- raw_data와 같은 트랜잭션에 기록되며, OutboxRelay가 Redis Streams에 발행한 뒤 삭제
+CREATE TABLE raw_data_outbox (
+    id NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    raw_data_id NUMBER NOT NULL REFERENCES raw_data(id),    -- 발행할 원본 데이터
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL  -- 기록 시간
+);
+
+COMMENT ON TABLE raw_data_outbox IS '발행 대기 중인 원본 데이터 (transactional outbox)';
+COMMENT ON COLUMN raw_data_outbox.id IS 'outbox 고유 ID (기록 순서)';
+COMMENT ON COLUMN raw_data_outbox.raw_data_id IS '발행할 raw_data ID';
+COMMENT ON COLUMN raw_data_outbox.created_at IS 'outbox 기록 시간';
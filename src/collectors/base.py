@@ -3,12 +3,40 @@ BaseCollector: Collector 인터페이스
 
 각 채널에서 데이터를 수집하는 인터페이스를 정의합니다.
 """
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+import httpx
+from src.collectors.feed_parser import ParsedFeed, get_parse_executor
+from src.collectors.fetch_policy import (
+    CircuitBreaker,
+    backoff_delay,
+    is_failed_response,
+    is_retryable_response,
+    parse_retry_after,
+)
 from src.logger import get_logger
+from src.metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CLEAN_SECONDS,
+    FETCH_RETRIES,
+    FETCH_SECONDS,
+    FETCH_SKIPPED,
+    ITEMS_FILTERED,
+    PARSE_SECONDS,
+)
 from src.models.raw_data import RawData
 from src.models.channel import Channel
+from config.http import FETCH_CONFIG
+
+# 서킷 브레이커 상태 → 메트릭 값
+_BREAKER_STATE_VALUES = {
+    CircuitBreaker.CLOSED: 0,
+    CircuitBreaker.OPEN: 1,
+    CircuitBreaker.HALF_OPEN: 2,
+}
 
 
 class BaseCollector(ABC):
@@ -17,13 +45,40 @@ class BaseCollector(ABC):
 
     책임: 특정 채널에서 데이터 수집만 담당
     - collect_raw_data(): 실제 데이터 수집 로직 (추상 메서드)
+    - collect_raw_data_async(): 비동기 수집 (기본 구현은 동기 수집을 스레드에서 실행)
+    - validators: 조건부 요청(Conditional GET)용 ETag / Last-Modified
+    - _fetch() / _fetch_async(): 공통 요청 정책 (짧은 타임아웃, 재시도, 서킷 브레이커)
     - get_channel_name(): 채널 이름 반환 (추상 메서드)
     """
 
+    # 채널별 수집 주기 범위 (None이면 config/scheduler.py 기본값 사용)
+    MIN_POLL_INTERVAL_SECONDS: Optional[int] = None
+    MAX_POLL_INTERVAL_SECONDS: Optional[int] = None
+    # 피드가 발행 시간 내림차순이면 True (checkpoint 이전 항목에서 검사 중단)
+    ORDERED_FEED = False
+
     def __init__(self):
         """BaseCollector 초기화"""
         self.logger = get_logger(self.__class__.__name__)
 
+        # 조건부 요청 검증자 (저장 및 발행이 끝난 응답 기준)
+        self.validators: Dict[str, str] = {}
+        # 이번 수집에서 받은 검증자 (commit_validators() 호출 전까지 보류)
+        self._pending_validators: Optional[Dict[str, str]] = None
+
+        # 피드 요청 정책
+        self.request_timeout = httpx.Timeout(
+            connect=FETCH_CONFIG["connect_timeout"],
+            read=FETCH_CONFIG["read_timeout"],
+            write=FETCH_CONFIG["write_timeout"],
+            pool=FETCH_CONFIG["pool_timeout"],
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=FETCH_CONFIG["breaker_failure_threshold"],
+            cooldown_seconds=FETCH_CONFIG["breaker_cooldown_seconds"],
+        )
+        CIRCUIT_BREAKER_STATE.labels(channel=self.get_channel().value).set(0)
+
     @abstractmethod
     def collect_raw_data(self, checkpoint: Optional[datetime]) -> List[RawData]:
         """
@@ -37,6 +92,296 @@ class BaseCollector(ABC):
         """
         pass
 
+    async def collect_raw_data_async(self, checkpoint: Optional[datetime], client: httpx.AsyncClient) -> List[RawData]:
+        """
+        비동기 데이터 수집
+
+        기본 구현은 동기 collect_raw_data()를 스레드에서 실행하는 어댑터입니다.
+        HTTP 기반 Collector는 공유 client를 사용하도록 오버라이드합니다.
+
+        Args:
+            checkpoint: 마지막으로 수집한 시간
+            client: 모든 Collector가 공유하는 HTTP 클라이언트 (Connection Pool)
+
+        Returns:
+            수집된 원본 데이터 리스트
+        """
+        return await asyncio.to_thread(self.collect_raw_data, checkpoint)
+
+    def commit_validators(self) -> Optional[Dict[str, str]]:
+        """
+        보류 중인 검증자를 확정
+
+        수집 데이터의 저장과 발행이 끝난 뒤에 호출해야 합니다.
+        확정 전에 실패하면 다음 요청은 이전 검증자를 사용하므로 데이터가 유실되지 않습니다.
+
+        Returns:
+            새로 확정된 검증자 (변경 없으면 None)
+        """
+        pending = self._pending_validators
+        self._pending_validators = None
+
+        if pending is None or pending == self.validators:
+            return None
+
+        self.validators = pending
+        return pending
+
+    def _fetch(self, url: str, headers: Dict[str, str]) -> Optional[httpx.Response]:
+        """
+        공통 요청 정책으로 GET 요청 (동기)
+
+        Args:
+            url: 요청 URL
+            headers: 요청 헤더
+
+        Returns:
+            응답 (재시도를 소진한 429 / 5xx 응답 포함) 또는 None (서킷이 열려 요청 생략)
+
+        Raises:
+            httpx.TransportError: 재시도를 소진한 연결 오류 / 타임아웃
+        """
+        if not self._allow_fetch(url):
+            return None
+
+        attempt = 0
+        while True:
+            response, error = None, None
+            try:
+                with FETCH_SECONDS.labels(channel=self.get_channel().value).time():
+                    response = httpx.get(url, headers=headers, timeout=self.request_timeout)
+            except httpx.TransportError as e:
+                error = e
+
+            delay = self._retry_delay(url, attempt, response, error)
+            if delay is None:
+                return self._fetch_result(url, response, error)
+
+            time.sleep(delay)
+            attempt += 1
+
+    async def _fetch_async(
+        self, client: httpx.AsyncClient, url: str, headers: Dict[str, str]
+    ) -> Optional[httpx.Response]:
+        """
+        공통 요청 정책으로 GET 요청 (공유 비동기 클라이언트)
+
+        Args:
+            client: 공유 비동기 HTTP 클라이언트
+            url: 요청 URL
+            headers: 요청 헤더
+
+        Returns:
+            응답 (재시도를 소진한 429 / 5xx 응답 포함) 또는 None (서킷이 열려 요청 생략)
+
+        Raises:
+            httpx.TransportError: 재시도를 소진한 연결 오류 / 타임아웃
+        """
+        if not self._allow_fetch(url):
+            return None
+
+        attempt = 0
+        while True:
+            response, error = None, None
+            try:
+                with FETCH_SECONDS.labels(channel=self.get_channel().value).time():
+                    response = await client.get(url, headers=headers, timeout=self.request_timeout)
+            except httpx.TransportError as e:
+                error = e
+
+            delay = self._retry_delay(url, attempt, response, error)
+            if delay is None:
+                return self._fetch_result(url, response, error)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _allow_fetch(self, url: str) -> bool:
+        """서킷 브레이커 확인 (열려 있으면 요청 생략)"""
+        channel = self.get_channel().value
+
+        if not self.circuit_breaker.allow_request():
+            FETCH_SKIPPED.labels(channel=channel).inc()
+            self.logger.info(
+                "서킷 브레이커 열림 - 요청 생략",
+                url=url,
+                remaining_cooldown_seconds=round(self.circuit_breaker.remaining_cooldown(), 1)
+            )
+            return False
+
+        if self.circuit_breaker.state == CircuitBreaker.HALF_OPEN:
+            CIRCUIT_BREAKER_STATE.labels(channel=channel).set(_BREAKER_STATE_VALUES[CircuitBreaker.HALF_OPEN])
+            self.logger.info("서킷 브레이커 half-open - 시험 요청", url=url)
+        return True
+
+    def _retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        response: Optional[httpx.Response],
+        error: Optional[httpx.TransportError],
+    ) -> Optional[float]:
+        """
+        재시도 지연 계산
+
+        Args:
+            url: 요청 URL
+            attempt: 지금까지의 재시도 횟수
+            response: 응답 (연결 오류 시 None)
+            error: 연결 오류 / 타임아웃 (응답을 받았으면 None)
+
+        Returns:
+            재시도 전 대기 시간(초) 또는 None (재시도하지 않음)
+        """
+        if error is None and not is_retryable_response(response):
+            return None
+        if attempt >= FETCH_CONFIG["max_retries"]:
+            return None
+
+        reason = type(error).__name__ if error is not None else str(response.status_code)
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            if retry_after > FETCH_CONFIG["retry_after_max_seconds"]:
+                self.logger.warning(
+                    "Retry-After가 너무 김 - 다음 수집 주기로 넘김", url=url, retry_after_seconds=retry_after
+                )
+                return None
+            delay = retry_after
+        else:
+            delay = backoff_delay(
+                attempt, FETCH_CONFIG["backoff_base_seconds"], FETCH_CONFIG["backoff_max_seconds"]
+            )
+
+        FETCH_RETRIES.labels(channel=self.get_channel().value, reason=reason).inc()
+        self.logger.warning(
+            "피드 요청 재시도", url=url, attempt=attempt + 1, reason=reason, delay_seconds=round(delay, 2)
+        )
+        return delay
+
+    def _fetch_result(
+        self,
+        url: str,
+        response: Optional[httpx.Response],
+        error: Optional[httpx.TransportError],
+    ) -> httpx.Response:
+        """
+        최종 요청 결과를 서킷 브레이커에 기록
+
+        재시도를 소진한 연결 오류 / 429 / 5xx와 지속적인 4xx(401 / 403 / 404 / 410)는 실패로,
+        그 외 응답(200, 304 등)은 성공으로 기록합니다.
+
+        Args:
+            url: 요청 URL
+            response: 마지막 응답 (연결 오류 시 None)
+            error: 마지막 연결 오류 / 타임아웃
+
+        Returns:
+            마지막 응답
+
+        Raises:
+            httpx.TransportError: 마지막 시도가 연결 오류 / 타임아웃인 경우
+        """
+        channel = self.get_channel().value
+
+        if error is None and not is_failed_response(response):
+            if self.circuit_breaker.record_success():
+                self.logger.info("서킷 브레이커 닫힘 - 요청 복구", url=url)
+            CIRCUIT_BREAKER_STATE.labels(channel=channel).set(_BREAKER_STATE_VALUES[CircuitBreaker.CLOSED])
+            return response
+
+        if self.circuit_breaker.record_failure():
+            self.logger.error(
+                "서킷 브레이커 열림 - 요청 중단",
+                url=url,
+                consecutive_failures=self.circuit_breaker.consecutive_failures,
+                cooldown_seconds=self.circuit_breaker.cooldown_seconds
+            )
+        CIRCUIT_BREAKER_STATE.labels(channel=channel).set(_BREAKER_STATE_VALUES[self.circuit_breaker.state])
+
+        if error is not None:
+            raise error
+        return response
+
+    def _conditional_headers(self) -> Dict[str, str]:
+        """
+        조건부 요청 헤더 생성 (If-None-Match / If-Modified-Since)
+
+        Returns:
+            요청에 추가할 헤더
+        """
+        self._pending_validators = None
+
+        headers = {}
+        if self.validators.get("etag"):
+            headers["If-None-Match"] = self.validators["etag"]
+        if self.validators.get("last_modified"):
+            headers["If-Modified-Since"] = self.validators["last_modified"]
+        return headers
+
+    def _remember_validators(self, response: httpx.Response) -> None:
+        """
+        응답의 ETag / Last-Modified를 보류 검증자로 기록
+
+        Args:
+            response: 200 응답
+        """
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["last_modified"] = response.headers["Last-Modified"]
+        self._pending_validators = validators
+
+    def _parse_feed(
+        self,
+        parse_function: Callable[[bytes, Optional[datetime], Optional[Dict[str, str]], bool], ParsedFeed],
+        response: httpx.Response,
+        checkpoint: Optional[datetime],
+    ) -> ParsedFeed:
+        """
+        응답 본문 파싱 및 정제 (큰 피드는 프로세스 풀에서 실행)
+
+        Args:
+            parse_function: 모듈 수준 파싱 함수 (프로세스 간 전달 가능해야 함)
+            response: RSS 피드 HTTP 응답 (200)
+            checkpoint: 마지막으로 수집한 시간
+
+        Returns:
+            파싱 결과
+        """
+        # response.text를 거치지 않고 본문 bytes를 그대로 전달 (디코딩된 사본을 만들지 않음)
+        feed_body = response.content
+        response_headers = {}
+        if response.headers.get("Content-Type"):
+            response_headers["content-type"] = response.headers["Content-Type"]
+
+        executor = get_parse_executor(len(feed_body))
+
+        if executor is None:
+            parsed = parse_function(feed_body, checkpoint, response_headers, self.ORDERED_FEED)
+        else:
+            parsed = executor.submit(
+                parse_function, feed_body, checkpoint, response_headers, self.ORDERED_FEED
+            ).result()
+
+        # 워커에서 측정한 값을 현재 프로세스의 메트릭에 반영
+        channel = self.get_channel().value
+        PARSE_SECONDS.labels(channel=channel).observe(parsed.parse_seconds)
+        CLEAN_SECONDS.labels(channel=channel).observe(parsed.clean_seconds)
+        for reason, count in parsed.filtered.items():
+            if count:
+                ITEMS_FILTERED.labels(channel=channel, reason=reason).inc(count)
+
+        if parsed.bozo_error:
+            self.logger.warning("RSS 파싱 경고", error=parsed.bozo_error)
+        if parsed.out_of_order:
+            self.logger.warning("피드가 발행 시간 내림차순이 아님 - 전체 항목 검사")
+        if parsed.filtered.get("no_date"):
+            self.logger.warning("발행 시간 파싱 실패", count=parsed.filtered["no_date"])
+
+        return parsed
+
     @abstractmethod
     def get_channel(self) -> Channel:
         """
@@ -0,0 +1,208 @@
+"""
+피드 파싱 공통 모듈
+
+Collector별 파싱 함수가 공유하는 결과 타입, 발행 시간 파싱,
+그리고 선택적인 파싱 전용 프로세스 풀을 제공합니다.
+
+파싱 함수는 프로세스 풀에서 실행될 수 있으므로 모듈 수준 함수로 정의하고
+RawData 대신 작은 튜플(ParsedEntry)을 반환합니다.
+"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.logger import get_logger
+from config.parser import PARSER_CONFIG
+
+
+class ParsedEntry(NamedTuple):
+    """파싱 및 정제가 끝난 피드 항목"""
+
+    content: str
+    link: str
+    published_at: datetime
+
+
+class ParsedFeed(NamedTuple):
+    """피드 파싱 결과"""
+
+    entries: List[ParsedEntry]
+    # 제외 사유별 항목 수 (no_date, checkpoint, invalid)
+    filtered: Dict[str, int]
+    # feedparser 파싱에 쓴 시간 (초)
+    parse_seconds: float
+    # HTML 정제에 쓴 시간 (초)
+    clean_seconds: float
+    # feedparser bozo 예외 메시지
+    bozo_error: Optional[str]
+    # 정렬 피드 모드에서 내림차순이 아닌 항목을 발견했는지 여부
+    out_of_order: bool = False
+
+
+def parse_published_date(entry) -> Optional[datetime]:
+    """
+    RSS entry의 발행 시간을 datetime으로 파싱
+
+    Args:
+        entry: feedparser의 entry 객체
+
+    Returns:
+        파싱된 datetime 객체 (UTC timezone-aware) 또는 None
+    """
+    # feedparser는 published_parsed (time.struct_time) 제공
+    if hasattr(entry, "published_parsed") and entry.published_parsed:
+        try:
+            timestamp = time.mktime(entry.published_parsed)
+            # UTC timezone 정보 추가
+            return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        except (ValueError, OverflowError, OSError) as e:
+            get_logger(__name__).warning("published_parsed 파싱 실패", error=str(e))
+
+    # 대안: published 문자열 직접 파싱 시도
+    if hasattr(entry, "published"):
+        try:
+            return datetime.fromisoformat(entry.published.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            pass
+
+    return None
+
+
+# 정렬 피드 모드에서 검사를 멈추기 전에 연속으로 만나야 하는 checkpoint 이전 항목 수
+# (상단 고정 게시물처럼 맨 앞의 오래된 항목 하나로 멈추지 않도록 2 이상)
+ORDERED_STOP_RUN = 2
+
+
+def select_new_entries(
+    entries: list, checkpoint: Optional[datetime], ordered: bool, filtered: Dict[str, int]
+) -> Tuple[List[Tuple[object, datetime]], bool]:
+    """
+    checkpoint 이후 entry만 선택
+
+    ordered가 True면 피드가 발행 시간 내림차순이라고 보고
+    checkpoint 이전 항목이 ORDERED_STOP_RUN개 연속(내림차순)으로 나온 지점에서 검사를 멈춥니다.
+    맨 앞의 고정 게시물 하나만으로는 멈추지 않으며, 그 뒤에 더 최신 항목이 오면
+    내림차순 위반으로 보고 전체 항목을 검사합니다.
+    마지막 항목이 멈출 지점보다 최신인 경우에도 전체 항목을 검사합니다.
+
+    Args:
+        entries: feedparser entry 리스트 (피드 순서 그대로)
+        checkpoint: 마지막으로 수집한 시간
+        ordered: 정렬 피드 모드 여부
+        filtered: 제외 사유별 항목 수 (no_date, checkpoint 값을 누적)
+
+    Returns:
+        (entry, 발행 시간) 리스트와 내림차순 위반 여부
+    """
+    selected = []
+    out_of_order = False
+    previous_dt = None
+    # 연속된 checkpoint 이전 항목 수
+    old_run = 0
+
+    for index, entry in enumerate(entries):
+        # 발행 시간 파싱
+        published_dt = parse_published_date(entry)
+
+        if published_dt is None:
+            filtered["no_date"] += 1
+            continue
+
+        if ordered and previous_dt is not None and published_dt > previous_dt:
+            ordered = False
+            out_of_order = True
+        previous_dt = published_dt
+
+        # checkpoint 이후 데이터만 수집
+        if checkpoint and published_dt <= checkpoint:
+            old_run += 1
+            if ordered and old_run >= ORDERED_STOP_RUN:
+                # 마지막 항목이 더 최신이면 오름차순 등으로 정렬이 다른 피드
+                last_dt = parse_published_date(entries[-1])
+                if last_dt is not None and last_dt > published_dt:
+                    ordered = False
+                    out_of_order = True
+                else:
+                    # 남은 항목은 모두 checkpoint 이전이므로 날짜 파싱 없이 제외
+                    filtered["checkpoint"] += len(entries) - index
+                    break
+            filtered["checkpoint"] += 1
+            continue
+
+        old_run = 0
+        selected.append((entry, published_dt))
+
+    return selected, out_of_order
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _create_executor(workers: int) -> ProcessPoolExecutor:
+    """forkserver(또는 spawn) 방식의 파싱 프로세스 풀 생성"""
+    start_method = PARSER_CONFIG["start_method"]
+    if start_method not in ("forkserver", "spawn"):
+        raise ValueError(f"지원하지 않는 프로세스 시작 방식: {start_method}")
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = "spawn"
+
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+    get_logger(__name__).info("파싱 프로세스 풀 생성", workers=workers, start_method=start_method)
+    return executor
+
+
+def start_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    파싱 프로세스 풀을 미리 생성 (애플리케이션 시작 시, 다른 스레드를 만들기 전에 호출)
+
+    빈 작업을 한 번 실행하여 forkserver와 첫 워커를 시작해 둡니다.
+
+    Returns:
+        프로세스 풀 (process_workers가 0이면 None)
+    """
+    global _executor
+
+    workers = PARSER_CONFIG["process_workers"]
+    if workers <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = _create_executor(workers)
+            _executor.submit(int).result()
+        return _executor
+
+
+def get_parse_executor(feed_size: int) -> Optional[ProcessPoolExecutor]:
+    """
+    피드 크기에 맞는 파싱 프로세스 풀 반환 (start_parse_executor()를 호출하지 않았으면 처음 호출 시 생성)
+
+    Args:
+        feed_size: 피드 본문 크기 (bytes)
+
+    Returns:
+        프로세스 풀 (사용하지 않는 경우 None)
+    """
+    global _executor
+
+    workers = PARSER_CONFIG["process_workers"]
+    if workers <= 0 or feed_size < PARSER_CONFIG["min_offload_bytes"]:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = _create_executor(workers)
+        return _executor
+
+
+def shutdown_parse_executor():
+    """파싱 프로세스 풀 종료"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
@@ -0,0 +1,162 @@
+"""
+피드 요청 정책: 재시도 지연 계산과 채널별 서킷 브레이커
+
+BaseCollector._fetch() / _fetch_async()가 사용합니다.
+- 연결 오류, 타임아웃, 429 / 5xx 응답만 재시도 대상입니다.
+- 재시도를 소진한 실패와 지속적인 4xx 응답(401 / 403 / 404 / 410)은 서킷 브레이커 실패로 셉니다.
+- 재시도 지연은 Retry-After가 있으면 그 값을, 없으면 지수 백오프(full jitter)를 사용합니다.
+- 연속 실패가 임계값에 도달하면 서킷을 열어 cooldown 동안 요청을 생략하고,
+  cooldown이 지나면 한 번 시도(half-open)하여 성공하면 닫습니다.
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+import httpx
+
+# 재시도할 응답 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 재시도하지 않지만 서킷 브레이커 실패로 세는 응답 상태 코드
+# (피드가 삭제 / 이동 / 차단된 경우 고쳐질 때까지 cooldown마다 한 번만 확인)
+PERSISTENT_FAILURE_STATUS_CODES = frozenset({401, 403, 404, 410})
+
+
+def is_retryable_response(response: httpx.Response) -> bool:
+    """재시도할 응답인지 여부 (429 / 5xx)"""
+    return response.status_code in RETRYABLE_STATUS_CODES
+
+
+def is_failed_response(response: httpx.Response) -> bool:
+    """서킷 브레이커 실패로 셀 응답인지 여부 (429 / 5xx, 지속적인 4xx)"""
+    return response.status_code in RETRYABLE_STATUS_CODES or response.status_code in PERSISTENT_FAILURE_STATUS_CODES
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Retry-After 헤더를 대기 시간(초)으로 변환
+
+    Args:
+        value: Retry-After 헤더 값 (초 또는 HTTP-date)
+        now: 기준 시각 (테스트용, 없으면 현재 UTC)
+
+    Returns:
+        대기 시간(초, 0 이상) 또는 None (헤더 없음 / 해석 불가)
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    now = now or datetime.now(timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+def backoff_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """
+    지수 백오프 지연 (full jitter)
+
+    Args:
+        attempt: 재시도 순번 (0부터)
+        base_seconds: 첫 재시도의 최대 지연
+        max_seconds: 지연 상한
+
+    Returns:
+        0 ~ min(max_seconds, base_seconds * 2^attempt) 사이의 임의 지연(초)
+    """
+    return random.uniform(0, min(max_seconds, base_seconds * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """채널별 서킷 브레이커"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        CircuitBreaker 초기화
+
+        Args:
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            cooldown_seconds: 서킷이 열린 뒤 요청을 생략하는 시간 (초)
+            clock: 단조 증가 시계 (테스트용)
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"잘못된 실패 임계값: {failure_threshold}")
+
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부 (cooldown이 지난 열린 서킷은 half-open으로 전환하고 한 번 허용)
+
+        Returns:
+            요청해도 되면 True
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if self._clock() - self._opened_at < self.cooldown_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+            return True
+
+    def remaining_cooldown(self) -> float:
+        """열린 서킷의 남은 cooldown (초)"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(self.cooldown_seconds - (self._clock() - self._opened_at), 0.0)
+
+    def record_success(self) -> bool:
+        """
+        요청 성공 기록
+
+        Returns:
+            서킷이 닫혔으면 (이전 상태가 closed가 아니었으면) True
+        """
+        with self._lock:
+            changed = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            return changed
+
+    def record_failure(self) -> bool:
+        """
+        요청 실패 기록 (재시도를 모두 소진했거나 지속적인 4xx 응답)
+
+        Returns:
+            이번 실패로 서킷이 열렸으면 True
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                return opened
+            return False
@@ -0,0 +1,158 @@
+"""
+HTML → 텍스트 변환
+
+모든 Collector가 공유하는 HTML 태그 제거 모듈입니다.
+트리를 만들지 않고 html.parser 이벤트만으로 텍스트를 추출하며,
+BeautifulSoup get_text(separator=' ', strip=True) + 공백 정규화와 같은 결과를 냅니다.
+
+문자 참조도 BeautifulSoup(html.parser)과 같이 convert_charrefs=False로 받아 직접 변환합니다.
+html.unescape()와는 세미콜론 없는 / 알 수 없는 참조 처리가 다릅니다.
+(예: "&notanentity;" → "&notanentity", "&amp" → "&amp")
+"""
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+
+# 텍스트로 취급하지 않는 요소 (BeautifulSoup get_text에서도 제외됨)
+_SKIPPED_ELEMENTS = frozenset({"script", "style", "template"})
+
+# 닫는 태그 없이 끝나는 요소 (열린 요소 스택에 넣지 않음)
+_VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link",
+    "menuitem", "meta", "param", "source", "track", "wbr", "basefont", "bgsound",
+    "command", "frame", "image", "isindex", "nextid", "spacer",
+})
+
+# 태그/엔티티가 없는 입력 판별용
+_MARKUP_PATTERN = re.compile(r"[<&]")
+
+# 이름 참조 (세미콜론을 뺀 이름 → 문자, BeautifulSoup EntitySubstitution과 같은 표)
+_NAMED_ENTITIES = {name.rstrip(";"): character for name, character in html5.items()}
+
+# 숫자 참조 뒤에 붙은 일반 텍스트 분리 ("&#65a" → "65", "a")
+_DECIMAL_REFERENCE = re.compile(r"^([0-9]+)(.*)")
+_HEX_REFERENCE = re.compile(r"^([0-9a-f]+)(.*)")
+
+
+def _numeric_character(number: int) -> str:
+    """숫자 참조를 문자로 변환 (HTML 명세의 numeric character reference end state)"""
+    if number == 0 or number > 0x10FFFF or 0xD800 <= number <= 0xDFFF:
+        return "\ufffd"
+    # Windows-1252로 인코딩된 값으로 보이는 C1 제어 문자
+    if 0x80 <= number <= 0x9F:
+        try:
+            return bytes([number]).decode("cp1252")
+        except UnicodeDecodeError:
+            pass
+    return chr(number)
+
+
+class _TextExtractor(HTMLParser):
+    """
+    텍스트 노드만 모으는 이벤트 기반 파서
+
+    트리 대신 열린 요소 이름만 스택으로 유지하여
+    script/style/template 내부 여부를 BeautifulSoup과 같은 규칙으로 판단합니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts = []
+        self._open_tags = []
+        self._skip_depth = 0
+        # <br> 처럼 이미 닫힌 void 요소 (뒤따르는 </br>은 무시)
+        self._closed_void_tags = []
+
+    def handle_starttag(self, tag, attrs):
+        self.parts.append(" ")
+        if tag in _VOID_ELEMENTS:
+            self._closed_void_tags.append(tag)
+            return
+        self._open_tags.append(tag)
+        if tag in _SKIPPED_ELEMENTS:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void_tags:
+            self._closed_void_tags.remove(tag)
+            return
+        self.parts.append(" ")
+        if tag not in self._open_tags:
+            return
+        # 짝이 맞는 요소까지 닫음 (사이에 열린 요소도 함께 닫힘)
+        while True:
+            closed = self._open_tags.pop()
+            if closed in _SKIPPED_ELEMENTS:
+                self._skip_depth -= 1
+            if closed == tag:
+                break
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def handle_charref(self, name):
+        base, pattern = 10, _DECIMAL_REFERENCE
+        if name[:1] in ("x", "X"):
+            base, pattern, name = 16, _HEX_REFERENCE, name[1:]
+
+        try:
+            self.handle_data(_numeric_character(int(name, base)))
+            return
+        except ValueError:
+            pass
+
+        match = pattern.match(name)
+        if match is None:
+            self.handle_data(name)
+            return
+        self.handle_data(_numeric_character(int(match.group(1), base)) + match.group(2))
+
+    def handle_entityref(self, name):
+        # 알 수 없는 이름은 "&이름" 그대로 (세미콜론은 파서가 소비)
+        self.handle_data(_NAMED_ENTITIES.get(name, "&" + name))
+
+    def handle_comment(self, data):
+        self.parts.append(" ")
+
+    def handle_decl(self, decl):
+        self.parts.append(" ")
+
+    def handle_pi(self, data):
+        self.parts.append(" ")
+
+    def unknown_decl(self, data):
+        # <![CDATA[...]]> 내용은 위치와 관계없이 텍스트로 취급
+        if data.upper().startswith("CDATA["):
+            self.parts.append(" " + data[len("CDATA["):] + " ")
+        else:
+            self.parts.append(" ")
+
+
+def clean_html(html_content: str) -> str:
+    """
+    HTML 태그 제거 및 텍스트 추출
+
+    텍스트 노드 사이는 공백 하나로 구분하고, 연속된 공백은 하나로 합칩니다.
+
+    Args:
+        html_content: HTML이 포함된 문자열
+
+    Returns:
+        HTML 태그가 제거된 순수 텍스트
+    """
+    if not html_content:
+        return ""
+
+    # 태그/엔티티가 없으면 공백 정규화만 수행
+    if not _MARKUP_PATTERN.search(html_content):
+        return " ".join(html_content.split())
+
+    parser = _TextExtractor()
+    parser.feed(html_content)
+    parser.close()
+
+    return " ".join("".join(parser.parts).split())
@@ -3,13 +3,15 @@ TruthSocialCollector: Truth Social RSS 피드 수집기
 
 Trump's Truth Social 플랫폼에서 발언을 수집합니다.
 """
-from typing import List, Optional
+import asyncio
+import time
+from typing import Dict, List, Optional
 from datetime import datetime
-import re
 import httpx
 import feedparser
-from bs4 import BeautifulSoup
 from src.collectors.base import BaseCollector
+from src.collectors.feed_parser import ParsedEntry, ParsedFeed, parse_published_date, select_new_entries
+from src.collectors.html_cleaner import clean_html
 from src.models.channel import Channel
 from src.models.raw_data import RawData
 
@@ -18,7 +20,11 @@ class TruthSocialCollector(BaseCollector):
     """Truth Social RSS 피드 수집 Collector"""
 
     RSS_FEED_URL = "https://trumpstruth.org/feed"
-    REQUEST_TIMEOUT = 30.0
+    # 게시가 몰리는 채널이므로 짧은 주기에서 시작
+    MIN_POLL_INTERVAL_SECONDS = 30
+    MAX_POLL_INTERVAL_SECONDS = 300
+    # 피드가 최신 글부터 내려옴
+    ORDERED_FEED = True
 
     def collect_raw_data(self, checkpoint: Optional[datetime]) -> List[RawData]:
         """
@@ -33,63 +39,86 @@ class TruthSocialCollector(BaseCollector):
         self.logger.info("Truth Social 데이터 수집 시작", checkpoint=checkpoint)
 
         try:
-            # RSS 피드 호출
-            response = httpx.get(self.RSS_FEED_URL, timeout=self.REQUEST_TIMEOUT)
-            response.raise_for_status()
+            # RSS 피드 호출 (공통 요청 정책: 타임아웃, 재시도, 서킷 브레이커)
+            response = self._fetch(self.RSS_FEED_URL, self._conditional_headers())
+            if response is None:
+                return []
+            return self._parse_response(response, checkpoint)
 
-            self.logger.debug("RSS 피드 호출 성공", status_code=response.status_code)
+        except httpx.HTTPError as e:
+            self.logger.error("HTTP 요청 실패", error=str(e), url=self.RSS_FEED_URL)
+            return []
+        except Exception as e:
+            self.logger.error("데이터 수집 중 예외 발생", error=str(e), error_type=type(e).__name__)
+            return []
 
-            # RSS 파싱
-            feed = feedparser.parse(response.text)
+    async def collect_raw_data_async(self, checkpoint: Optional[datetime], client: httpx.AsyncClient) -> List[RawData]:
+        """
+        공유 HTTP 클라이언트로 Truth Social RSS 피드에서 데이터 수집
 
-            if feed.bozo:
-                self.logger.warning("RSS 파싱 경고", error=feed.bozo_exception)
+        Args:
+            checkpoint: 마지막으로 수집한 시간
+            client: 공유 비동기 HTTP 클라이언트
 
-            # checkpoint 이후 데이터 필터링
-            collected_data = []
+        Returns:
+            수집된 원본 데이터 리스트
+        """
+        self.logger.info("Truth Social 데이터 수집 시작", checkpoint=checkpoint)
 
-            for entry in feed.entries:
-                # 발행 시간 파싱
-                published_dt = self._parse_published_date(entry)
+        try:
+            # RSS 피드 호출 (공통 요청 정책: 타임아웃, 재시도, 서킷 브레이커)
+            response = await self._fetch_async(client, self.RSS_FEED_URL, self._conditional_headers())
+            if response is None:
+                return []
+            # 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+            return await asyncio.to_thread(self._parse_response, response, checkpoint)
 
-                if published_dt is None:
-                    self.logger.warning("발행 시간 파싱 실패", entry_link=entry.get('link', 'Unknown'))
-                    continue
+        except httpx.HTTPError as e:
+            self.logger.error("HTTP 요청 실패", error=str(e), url=self.RSS_FEED_URL)
+            return []
+        except Exception as e:
+            self.logger.error("데이터 수집 중 예외 발생", error=str(e), error_type=type(e).__name__)
+            return []
 
-                # checkpoint 이후 데이터만 수집
-                if checkpoint and published_dt <= checkpoint:
-                    continue
+    def _parse_response(self, response: httpx.Response, checkpoint: Optional[datetime]) -> List[RawData]:
+        """
+        RSS 응답을 파싱하여 checkpoint 이후 데이터 추출
 
-                # HTML 태그 제거 (한 번만 수행)
-                raw_content = entry.get('summary', '')
-                cleaned_content = self._clean_html(raw_content)
+        Args:
+            response: RSS 피드 HTTP 응답
+            checkpoint: 마지막으로 수집한 시간
 
-                # 정리된 content 유효성 검사
-                if not self._is_valid_content(cleaned_content):
-                    self.logger.debug("유효하지 않은 content", link=entry.get('link', ''))
-                    continue
+        Returns:
+            수집된 원본 데이터 리스트
+        """
+        # 피드 변경 없음: 파싱 및 이후 작업 생략
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            self.logger.info("Truth Social 피드 변경 없음 (304)")
+            return []
 
-                # 데이터 구조화
-                raw_data = RawData(
-                    content=cleaned_content,
-                    link=entry.get('link', ''),
-                    published_at=published_dt,
-                    channel=self.get_channel(),
-                )
+        response.raise_for_status()
 
-                collected_data.append(raw_data)
-                self.logger.debug("데이터 수집", published_at=raw_data.published_at, link=raw_data.link)
+        self.logger.debug("RSS 피드 호출 성공", status_code=response.status_code)
 
-            self.logger.info("Truth Social 데이터 수집 완료", count=len(collected_data))
-            return collected_data
+        parsed = self._parse_feed(parse_feed, response, checkpoint)
 
+        # 데이터 구조화
+        collected_data = []
+        for entry in parsed.entries:
+            raw_data = RawData(
+                content=entry.content,
+                link=entry.link,
+                published_at=entry.published_at,
+                channel=self.get_channel(),
+            )
+            collected_data.append(raw_data)
+            self.logger.debug("데이터 수집", published_at=raw_data.published_at, link=raw_data.link)
 
-        except httpx.HTTPError as e:
-            self.logger.error("HTTP 요청 실패", error=str(e), url=self.RSS_FEED_URL)
-            return []
-        except Exception as e:
-            self.logger.error("데이터 수집 중 예외 발생", error=str(e), error_type=type(e).__name__)
-            return []
+        # 파싱이 끝난 응답의 검증자만 기록
+        self._remember_validators(response)
+
+        self.logger.info("Truth Social 데이터 수집 완료", count=len(collected_data))
+        return collected_data
 
     def _clean_html(self, html_content: str) -> str:
         """
@@ -101,19 +130,7 @@ class TruthSocialCollector(BaseCollector):
         Returns:
             HTML 태그가 제거된 순수 텍스트
         """
-        if not html_content:
-            return ""
-
-        # BeautifulSoup으로 HTML 파싱
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # 모든 텍스트 추출
-        text = soup.get_text(separator=' ', strip=True)
-
-        # 연속된 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
+        return clean_html(html_content)
 
     def _is_valid_content(self, cleaned_content: str) -> bool:
         """
@@ -125,24 +142,7 @@ class TruthSocialCollector(BaseCollector):
         Returns:
             유효하면 True, 아니면 False
         """
-        if not cleaned_content or cleaned_content.strip() == "":
-            return False
-
-        # 텍스트가 너무 짧으면 제외
-        if len(cleaned_content) < 10:
-            return False
-
-        # RT로 시작하는 리트윗 제외 (RT, RT:, RT @username 등)
-        content_stripped = cleaned_content.strip()
-        if content_stripped == "RT" or content_stripped.startswith("RT:") or content_stripped.startswith("RT @"):
-            return False
-
-        # URL만 있는 경우 제외 (http:// 또는 https://로 시작하는 경우)
-        content_stripped = cleaned_content.strip()
-        if content_stripped.startswith("http://") or content_stripped.startswith("https://"):
-            return False
-
-        return True
+        return is_valid_content(cleaned_content)
 
     def _parse_published_date(self, entry) -> Optional[datetime]:
         """
@@ -154,26 +154,7 @@ class TruthSocialCollector(BaseCollector):
         Returns:
             파싱된 datetime 객체 (UTC timezone-aware) 또는 None
         """
-        from datetime import timezone
-
-        # feedparser는 published_parsed (time.struct_time) 제공
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            try:
-                import time
-                timestamp = time.mktime(entry.published_parsed)
-                # UTC timezone 정보 추가
-                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            except (ValueError, OverflowError, OSError) as e:
-                self.logger.warning("published_parsed 파싱 실패", error=str(e))
-
-        # 대안: published 문자열 직접 파싱 시도
-        if hasattr(entry, 'published'):
-            try:
-                return datetime.fromisoformat(entry.published.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                pass
-
-        return None
+        return parse_published_date(entry)
 
     def get_channel(self) -> Channel:
         """
@@ -183,3 +164,82 @@ class TruthSocialCollector(BaseCollector):
             Channel enum
         """
         return Channel.TRUTH_SOCIAL
+
+
+def is_valid_content(cleaned_content: str) -> bool:
+    """
+    정리된 content가 유효한지 검사 (비어있거나 의미없는 내용 제외)
+
+    Args:
+        cleaned_content: HTML이 이미 제거된 content 문자열
+
+    Returns:
+        유효하면 True, 아니면 False
+    """
+    if not cleaned_content or cleaned_content.strip() == "":
+        return False
+
+    # 텍스트가 너무 짧으면 제외
+    if len(cleaned_content) < 10:
+        return False
+
+    # RT로 시작하는 리트윗 제외 (RT, RT:, RT @username 등)
+    content_stripped = cleaned_content.strip()
+    if content_stripped == "RT" or content_stripped.startswith("RT:") or content_stripped.startswith("RT @"):
+        return False
+
+    # URL만 있는 경우 제외 (http:// 또는 https://로 시작하는 경우)
+    if content_stripped.startswith("http://") or content_stripped.startswith("https://"):
+        return False
+
+    return True
+
+
+def parse_feed(
+    feed_body: bytes,
+    checkpoint: Optional[datetime],
+    response_headers: Optional[Dict[str, str]] = None,
+    ordered: bool = False,
+) -> ParsedFeed:
+    """
+    Truth Social RSS 본문을 파싱하여 checkpoint 이후 항목 추출
+
+    파싱 프로세스 풀에서도 실행되므로 모듈 수준 함수로 정의합니다.
+
+    Args:
+        feed_body: RSS 피드 응답 본문 (디코딩하지 않은 bytes)
+        checkpoint: 마지막으로 수집한 시간
+        response_headers: 문자셋 판별용 응답 헤더 (소문자 키)
+        ordered: 피드가 발행 시간 내림차순이면 checkpoint 이전 항목에서 검사 중단
+
+    Returns:
+        파싱 결과
+    """
+    # RSS 파싱
+    parse_started = time.perf_counter()
+    # 디코딩은 feedparser가 한 번만 수행 (HTTP 헤더 → XML 선언 순으로 문자셋 판별)
+    feed = feedparser.parse(feed_body, response_headers=response_headers)
+    parse_seconds = time.perf_counter() - parse_started
+
+    entries = []
+    filtered = {"no_date": 0, "checkpoint": 0, "invalid": 0}
+    clean_seconds = 0.0
+
+    # checkpoint 필터를 먼저 적용하고, 남은 항목만 정제/검사
+    new_entries, out_of_order = select_new_entries(feed.entries, checkpoint, ordered, filtered)
+
+    for entry, published_dt in new_entries:
+        # HTML 태그 제거 (한 번만 수행)
+        clean_started = time.perf_counter()
+        cleaned_content = clean_html(entry.get('summary', ''))
+        clean_seconds += time.perf_counter() - clean_started
+
+        # 정리된 content 유효성 검사
+        if not is_valid_content(cleaned_content):
+            filtered["invalid"] += 1
+            continue
+
+        entries.append(ParsedEntry(cleaned_content, entry.get('link', ''), published_dt))
+
+    bozo_error = str(feed.bozo_exception) if feed.bozo else None
+    return ParsedFeed(entries, filtered, parse_seconds, clean_seconds, bozo_error, out_of_order)
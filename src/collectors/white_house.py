@@ -2,13 +2,15 @@
 WhiteHouseCollector: 백악관 뉴스 피드 수집기
 """
 
-import re
-from typing import List, Optional
+import asyncio
+import time
+from typing import Dict, List, Optional
 from datetime import datetime
 import httpx
 import feedparser
-from bs4 import BeautifulSoup
 from src.collectors.base import BaseCollector
+from src.collectors.feed_parser import ParsedEntry, ParsedFeed, parse_published_date, select_new_entries
+from src.collectors.html_cleaner import clean_html
 from src.models.channel import Channel
 from src.models.raw_data import RawData
 
@@ -17,8 +19,12 @@ class WhiteHouseCollector(BaseCollector):
     """백악관 RSS 피드 수집 Collector"""
 
     RSS_FEED_URL = "https://www.whitehouse.gov/news/feed/"
-    REQUEST_TIMEOUT = 30.0
     USER_AGENT = "Trump-Scan-Bot/1.0"
+    # 게시 빈도가 낮은 채널이므로 긴 주기까지 허용
+    MIN_POLL_INTERVAL_SECONDS = 120
+    MAX_POLL_INTERVAL_SECONDS = 1800
+    # 피드가 최신 글부터 내려옴
+    ORDERED_FEED = True
 
     def collect_raw_data(self, checkpoint: Optional[datetime]) -> List[RawData]:
         """
@@ -33,54 +39,45 @@ class WhiteHouseCollector(BaseCollector):
         self.logger.info("백악관 데이터 수집 시작", checkpoint=checkpoint)
 
         try:
-            # RSS 피드 호출
-            headers = {"User-Agent": self.USER_AGENT}
-            response = httpx.get(
-                self.RSS_FEED_URL, headers=headers, timeout=self.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-
-            # RSS 파싱
-            feed = feedparser.parse(response.text)
-
-            collected_data = []
-
-            for entry in feed.entries:
-                # 발행 시간 파싱
-                published_dt = self._parse_published_date(entry)
-
-                if published_dt is None:
-                    continue
-
-                # checkpoint 이후 데이터만 수집
-                if checkpoint and published_dt <= checkpoint:
-                    continue
-
-                # 본문 추출 및 정제
-                # content:encoded 가 있으면 우선 사용, 없으면 summary 사용
-                raw_content = ""
-                if hasattr(entry, "content"):
-                    raw_content = entry.content[0].value
-                else:
-                    raw_content = entry.get("summary", "")
+            # RSS 피드 호출 (공통 요청 정책: 타임아웃, 재시도, 서킷 브레이커)
+            headers = {"User-Agent": self.USER_AGENT, **self._conditional_headers()}
+            response = self._fetch(self.RSS_FEED_URL, headers)
+            if response is None:
+                return []
+            return self._parse_response(response, checkpoint)
 
-                cleaned_content = self._clean_html(raw_content)
+        except httpx.HTTPError as e:
+            self.logger.error("HTTP 요청 실패", error=str(e), url=self.RSS_FEED_URL)
+            return []
+        except Exception as e:
+            self.logger.error(
+                "데이터 수집 중 예외 발생", error=str(e), error_type=type(e).__name__
+            )
+            return []
 
-                # 데이터 구조화
-                raw_data = RawData(
-                    content=cleaned_content,
-                    link=entry.get("link", ""),
-                    published_at=published_dt,
-                    channel=self.get_channel(),
-                )
+    async def collect_raw_data_async(
+        self, checkpoint: Optional[datetime], client: httpx.AsyncClient
+    ) -> List[RawData]:
+        """
+        공유 HTTP 클라이언트로 백악관 RSS 피드에서 데이터 수집
 
-                collected_data.append(raw_data)
+        Args:
+            checkpoint: 마지막으로 수집한 시간
+            client: 공유 비동기 HTTP 클라이언트
 
-            # 발행 시간 기준 오름차순 정렬
-            collected_data.sort(key=lambda x: x.published_at)
+        Returns:
+            수집된 원본 데이터 리스트 (발행 시간 오름차순 정렬)
+        """
+        self.logger.info("백악관 데이터 수집 시작", checkpoint=checkpoint)
 
-            self.logger.info("백악관 데이터 수집 완료", count=len(collected_data))
-            return collected_data
+        try:
+            # RSS 피드 호출 (공통 요청 정책: 타임아웃, 재시도, 서킷 브레이커)
+            headers = {"User-Agent": self.USER_AGENT, **self._conditional_headers()}
+            response = await self._fetch_async(client, self.RSS_FEED_URL, headers)
+            if response is None:
+                return []
+            # 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+            return await asyncio.to_thread(self._parse_response, response, checkpoint)
 
         except httpx.HTTPError as e:
             self.logger.error("HTTP 요청 실패", error=str(e), url=self.RSS_FEED_URL)
@@ -91,29 +88,56 @@ class WhiteHouseCollector(BaseCollector):
             )
             return []
 
-    def _clean_html(self, html_content: str) -> str:
+    def _parse_response(
+        self, response: httpx.Response, checkpoint: Optional[datetime]
+    ) -> List[RawData]:
         """
-        HTML 태그 제거 및 텍스트 추출
+        RSS 응답을 파싱하여 checkpoint 이후 데이터 추출
 
         Args:
-            html_content: HTML이 포함된 문자열
+            response: RSS 피드 HTTP 응답
+            checkpoint: 마지막으로 수집한 시간
 
         Returns:
-            HTML 태그가 제거된 순수 텍스트
+            수집된 원본 데이터 리스트 (발행 시간 오름차순 정렬)
         """
-        if not html_content:
-            return ""
+        # 피드 변경 없음: 파싱 및 이후 작업 생략
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            self.logger.info("백악관 피드 변경 없음 (304)")
+            return []
+
+        response.raise_for_status()
 
-        # BeautifulSoup으로 HTML 파싱
-        soup = BeautifulSoup(html_content, "html.parser")
+        parsed = self._parse_feed(parse_feed, response, checkpoint)
 
-        # 모든 텍스트 추출
-        text = soup.get_text(separator=" ", strip=True)
+        # 데이터 구조화
+        collected_data = [
+            RawData(
+                content=entry.content,
+                link=entry.link,
+                published_at=entry.published_at,
+                channel=self.get_channel(),
+            )
+            for entry in parsed.entries
+        ]
+
+        # 파싱이 끝난 응답의 검증자만 기록
+        self._remember_validators(response)
+
+        self.logger.info("백악관 데이터 수집 완료", count=len(collected_data))
+        return collected_data
+
+    def _clean_html(self, html_content: str) -> str:
+        """
+        HTML 태그 제거 및 텍스트 추출
 
-        # 연속된 공백을 하나로
-        text = re.sub(r"\s+", " ", text)
+        Args:
+            html_content: HTML이 포함된 문자열
 
-        return text.strip()
+        Returns:
+            HTML 태그가 제거된 순수 텍스트
+        """
+        return clean_html(html_content)
 
     def _parse_published_date(self, entry) -> Optional[datetime]:
         """
@@ -125,30 +149,64 @@ class WhiteHouseCollector(BaseCollector):
         Returns:
             파싱된 datetime 객체 (UTC timezone-aware) 또는 None
         """
-        from datetime import timezone
-
-        # feedparser는 published_parsed (time.struct_time) 제공
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            try:
-                import time
-
-                timestamp = time.mktime(entry.published_parsed)
-                # UTC timezone 정보 추가
-                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            except (ValueError, OverflowError, OSError) as e:
-                self.logger.warning("published_parsed 파싱 실패", error=str(e))
-
-        # 대안: published 문자열 직접 파싱 시도
-        if hasattr(entry, "published"):
-            try:
-                return datetime.fromisoformat(entry.published.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-
-        return None
+        return parse_published_date(entry)
 
     def get_channel(self) -> Channel:
         """
         채널 반환
         """
         return Channel.WHITE_HOUSE
+
+
+def parse_feed(
+    feed_body: bytes,
+    checkpoint: Optional[datetime],
+    response_headers: Optional[Dict[str, str]] = None,
+    ordered: bool = False,
+) -> ParsedFeed:
+    """
+    백악관 RSS 본문을 파싱하여 checkpoint 이후 항목 추출
+
+    파싱 프로세스 풀에서도 실행되므로 모듈 수준 함수로 정의합니다.
+
+    Args:
+        feed_body: RSS 피드 응답 본문 (디코딩하지 않은 bytes)
+        checkpoint: 마지막으로 수집한 시간
+        response_headers: 문자셋 판별용 응답 헤더 (소문자 키)
+        ordered: 피드가 발행 시간 내림차순이면 checkpoint 이전 항목에서 검사 중단
+
+    Returns:
+        파싱 결과 (발행 시간 오름차순 정렬)
+    """
+    # RSS 파싱
+    parse_started = time.perf_counter()
+    # 디코딩은 feedparser가 한 번만 수행 (HTTP 헤더 → XML 선언 순으로 문자셋 판별)
+    feed = feedparser.parse(feed_body, response_headers=response_headers)
+    parse_seconds = time.perf_counter() - parse_started
+
+    entries = []
+    filtered = {"no_date": 0, "checkpoint": 0}
+    clean_seconds = 0.0
+
+    # checkpoint 필터를 먼저 적용하고, 남은 항목만 정제/검사
+    new_entries, out_of_order = select_new_entries(feed.entries, checkpoint, ordered, filtered)
+
+    for entry, published_dt in new_entries:
+        # 본문 추출 및 정제
+        # content:encoded 가 있으면 우선 사용, 없으면 summary 사용
+        if hasattr(entry, "content"):
+            raw_content = entry.content[0].value
+        else:
+            raw_content = entry.get("summary", "")
+
+        clean_started = time.perf_counter()
+        cleaned_content = clean_html(raw_content)
+        clean_seconds += time.perf_counter() - clean_started
+
+        entries.append(ParsedEntry(cleaned_content, entry.get("link", ""), published_dt))
+
+    # 발행 시간 기준 오름차순 정렬
+    entries.sort(key=lambda x: x.published_at)
+
+    bozo_error = str(feed.bozo_exception) if feed.bozo else None
+    return ParsedFeed(entries, filtered, parse_seconds, clean_seconds, bozo_error, out_of_order)
@@ -0,0 +1,448 @@
+"""
+Oracle Database 비동기 연결 관리
+
+python-oracledb asyncio API(create_pool_async)를 사용하는 Database 구현입니다.
+Database와 같은 메서드를 코루틴으로 제공하므로 비동기 Orchestrator가
+스레드 위임 없이 이벤트 루프에서 직접 저장할 수 있습니다.
+SQL, 바인딩, 행 변환은 raw_data_sql 모듈을 Database와 공유하며 I/O 호출만 다릅니다.
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+import oracledb
+from src.infrastructure import raw_data_sql as sql
+from src.logger import get_logger
+from src.metrics import DB_ACQUIRE_SECONDS, DB_INSERT_SECONDS, DB_POOL_BUSY, DB_POOL_OPEN
+from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
+from src.models.channel import Channel
+from config.database import DB_CONFIG, DB_POOL_CONFIG, OUTBOX_CONFIG
+
+
+class AsyncDatabase:
+    """
+    Oracle Database 비동기 연결 관리 클래스 (AsyncConnectionPool 사용)
+
+    Connection Pool은 이벤트 루프 안에서만 만들 수 있으므로
+    첫 DB 호출 시(또는 open() 호출 시) 생성합니다.
+    """
+
+    def __init__(self):
+        """AsyncDatabase 초기화 (Connection Pool은 첫 사용 시 생성)"""
+        self.logger = get_logger(__name__)
+        self._pool: Optional[oracledb.AsyncConnectionPool] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+
+        # outbox 모드: 저장과 같은 트랜잭션에 발행 대기 행 기록
+        self.outbox_enabled = OUTBOX_CONFIG["enabled"]
+
+        # acquire 대기 시간 통계
+        self._acquire_stats = sql.AcquireStats()
+
+    async def open(self):
+        """Connection Pool 생성 및 최소 연결 수만큼 미리 연결"""
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+
+        async with self._open_lock:
+            if self._pool is not None:
+                return
+
+            dsn = DB_CONFIG["dsn"]
+            pool = None
+
+            try:
+                self.logger.info("Creating Oracle DB Async Connection Pool...", dsn=dsn)
+
+                pool = oracledb.create_pool_async(**sql.pool_params())
+
+                if DB_POOL_CONFIG["prewarm"]:
+                    connections = [await pool.acquire() for _ in range(DB_POOL_CONFIG["min"])]
+                    for connection in connections:
+                        await pool.release(connection)
+
+            except oracledb.Error as e:
+                await self._close_failed_pool(pool)
+                self.logger.error("Failed to create Async Connection Pool", **sql.error_fields(e))
+                raise
+            except Exception as e:
+                await self._close_failed_pool(pool)
+                self.logger.error(
+                    "Unexpected error during Async Connection Pool creation",
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                raise
+
+            self._pool = pool
+            self.logger.info("Database Async Connection Pool created", dsn=dsn, opened=pool.opened)
+
+            # Pool 사용량 메트릭 (scrape 시점에 조회, 종료된 Pool은 0)
+            DB_POOL_BUSY.set_function(lambda: self._pool.busy if self._pool is not None else 0)
+            DB_POOL_OPEN.set_function(lambda: self._pool.opened if self._pool is not None else 0)
+
+    async def _close_failed_pool(self, pool: Optional[oracledb.AsyncConnectionPool]):
+        """준비 중 실패한 Connection Pool 종료 (이미 연결된 세션 포함, 종료 오류는 무시)"""
+        if pool is None:
+            return
+        try:
+            await pool.close(force=True)
+        except oracledb.Error:
+            pass
+
+    async def _get_connection(self) -> oracledb.AsyncConnection:
+        """Pool에서 connection 획득 (대기 시간 기록)"""
+        if self._pool is None:
+            await self.open()
+
+        started = time.perf_counter()
+        connection = await self._pool.acquire()
+        waited = time.perf_counter() - started
+
+        DB_ACQUIRE_SECONDS.observe(waited)
+        self._acquire_stats.record(waited)
+        return connection
+
+    async def _rollback(self, connection: oracledb.AsyncConnection):
+        """롤백 (연결 끊긴 경우 무시)"""
+        try:
+            await connection.rollback()
+        except oracledb.Error:
+            pass
+
+    def pool_stats(self) -> Dict[str, float]:
+        """
+        Connection Pool 사용 현황
+
+        Returns:
+            busy, open, max, acquire 횟수 및 대기 시간(초) 통계
+        """
+        return {
+            "busy": self._pool.busy if self._pool else 0,
+            "open": self._pool.opened if self._pool else 0,
+            "max": DB_POOL_CONFIG["max"],
+            **self._acquire_stats.snapshot(),
+        }
+
+    async def save_raw_data(self, raw_data: RawData) -> RawData:
+        """
+        원본 데이터 저장
+
+        Args:
+            raw_data: 저장할 RawData
+
+        Returns:
+            ID가 할당된 RawData
+        """
+        connection = await self._get_connection()
+        try:
+            cursor = connection.cursor()
+
+            # ID를 받을 변수 준비
+            id_var = cursor.var(oracledb.NUMBER)
+
+            with DB_INSERT_SECONDS.time():
+                await cursor.execute(sql.INSERT_SQL, {**sql.insert_params(raw_data), "id": id_var})
+
+            # 생성된 ID를 RawData 객체에 할당
+            raw_data.id = int(id_var.getvalue()[0])
+
+            # outbox 모드: 같은 트랜잭션에 발행 대기 행 기록
+            if self.outbox_enabled:
+                await cursor.execute(sql.OUTBOX_INSERT_SQL, sql.outbox_params([raw_data])[0])
+
+            await connection.commit()
+
+            self.logger.debug("원본 데이터 저장 완료", id=raw_data.id, link=raw_data.link)
+
+            cursor.close()
+            return raw_data
+
+        except oracledb.Error as e:
+            await self._rollback(connection)
+            self.logger.error("데이터 저장 실패", link=raw_data.link, **sql.error_fields(e))
+            raise
+        except Exception as e:
+            await self._rollback(connection)
+            self.logger.error(
+                "데이터 저장 중 예외 발생", error=str(e), error_type=type(e).__name__, link=raw_data.link
+            )
+            raise
+        finally:
+            await self._pool.release(connection)  # pool에 반환
+
+    async def save_raw_data_batch(
+        self, raw_data_list: List[Union[RawData, RawRecord]]
+    ) -> List[Union[RawData, RawRecord]]:
+        """
+        원본 데이터 일괄 저장 (executemany + 단일 커밋)
+
+        수집 hot path에서는 검증이 끝난 RawRecord를 받습니다.
+
+        Args:
+            raw_data_list: 저장할 RawData 또는 RawRecord 리스트
+
+        Returns:
+            입력 순서대로 ID가 할당된 항목 리스트
+            (content_hash unique 인덱스에 걸린 중복 항목은 제외되며 id가 None으로 남음)
+        """
+        if not raw_data_list:
+            return []
+
+        connection = await self._get_connection()
+        try:
+            cursor = connection.cursor()
+
+            # 행마다 생성된 ID를 받을 배열 변수 준비
+            id_var = cursor.var(oracledb.NUMBER, arraysize=len(raw_data_list))
+            cursor.setinputsizes(id=id_var)
+
+            # Array DML로 한 번에 실행 (행 단위 오류는 batcherrors로 수집)
+            with DB_INSERT_SECONDS.time():
+                await cursor.executemany(
+                    sql.INSERT_SQL,
+                    [sql.insert_params(raw_data) for raw_data in raw_data_list],
+                    batcherrors=True
+                )
+
+            # 중복(ORA-00001)은 건너뛰고, 그 외 행 오류는 전체 롤백
+            duplicates = sql.duplicate_offsets(cursor.getbatcherrors())
+            saved_data = sql.assign_batch_ids(raw_data_list, id_var, duplicates)
+
+            # outbox 모드: 같은 트랜잭션에 발행 대기 행 기록 (커밋 후 OutboxRelay가 발행)
+            if self.outbox_enabled and saved_data:
+                outbox_cursor = connection.cursor()
+                await outbox_cursor.executemany(sql.OUTBOX_INSERT_SQL, sql.outbox_params(saved_data))
+                outbox_cursor.close()
+
+            # 커밋 (전체 1회)
+            await connection.commit()
+
+            if duplicates:
+                self.logger.info("중복 데이터 저장 생략", skipped=len(duplicates))
+            self.logger.debug("원본 데이터 일괄 저장 완료", count=len(saved_data))
+
+            cursor.close()
+            return saved_data
+
+        except oracledb.Error as e:
+            await self._rollback(connection)
+            self.logger.error("데이터 일괄 저장 실패", count=len(raw_data_list), **sql.error_fields(e))
+            raise
+        except Exception as e:
+            await self._rollback(connection)
+            self.logger.error(
+                "데이터 일괄 저장 중 예외 발생",
+                error=str(e),
+                error_type=type(e).__name__,
+                count=len(raw_data_list)
+            )
+            raise
+        finally:
+            await self._pool.release(connection)  # pool에 반환
+
+    async def get_latest_raw_data(self, id: Optional[int] = None) -> Optional[RawData]:
+        """
+        raw_data 조회
+
+        Args:
+            id: raw_data의 id. 없으면 가장 최근 1건 조회
+
+        Returns:
+            RawData 또는 None (데이터 없는 경우)
+
+        Note:
+            published_at은 UTC timezone-aware datetime으로 반환됩니다.
+        """
+        connection = await self._get_connection()
+        try:
+            cursor = connection.cursor()
+
+            # content(CLOB)는 str로 바로 받아 LOB 읽기 왕복을 없앰
+            query, params = sql.latest_query(id)
+            await cursor.execute(query, params, fetch_lobs=False)
+
+            row = await cursor.fetchone()
+            cursor.close()
+
+            if row is None:
+                return None
+
+            return sql.row_to_raw_data(row)
+
+        except oracledb.Error as e:
+            self.logger.error("데이터 조회 실패", **sql.error_fields(e))
+            raise
+        finally:
+            await self._pool.release(connection)
+
+    async def get_raw_data_by_ids(self, ids: List[int]) -> Dict[int, RawRecord]:
+        """
+        id 목록으로 raw_data 일괄 조회 (참조 모드 소비자용)
+
+        Database.get_raw_data_by_ids()와 같은 규칙을 따릅니다.
+
+        Args:
+            ids: 조회할 raw_data id 목록
+
+        Returns:
+            id → RawRecord 딕셔너리 (없는 id는 포함되지 않음)
+        """
+        records: Dict[int, RawRecord] = {}
+        if not ids:
+            return records
+
+        connection = await self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = sql.IN_LIST_LIMIT
+            for chunk in sql.id_chunks(ids):
+                query, params = sql.ids_query(chunk)
+                await cursor.execute(query, params, fetch_lobs=False)
+                for row in await cursor.fetchall():
+                    record = sql.row_to_record(row)
+                    records[record.id] = record
+            cursor.close()
+            return records
+
+        except oracledb.Error as e:
+            self.logger.error("id 목록 조회 실패", count=len(ids), **sql.error_fields(e))
+            raise
+        finally:
+            await self._pool.release(connection)
+
+    async def get_raw_data_ids_by_hash(self, content_hashes: List[str]) -> Dict[str, int]:
+        """
+        content_hash 목록으로 raw_data id 일괄 조회
+
+        Database.get_raw_data_ids_by_hash()와 같은 규칙을 따릅니다.
+
+        Args:
+            content_hashes: 조회할 content_hash 목록
+
+        Returns:
+            content_hash → id 딕셔너리 (없는 content_hash는 포함되지 않음)
+        """
+        ids: Dict[str, int] = {}
+        if not content_hashes:
+            return ids
+
+        connection = await self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = sql.IN_LIST_LIMIT
+            for chunk in sql.id_chunks(content_hashes):
+                query, params = sql.hashes_query(chunk)
+                await cursor.execute(query, params)
+                for db_id, content_hash in await cursor.fetchall():
+                    ids[content_hash] = int(db_id)
+            cursor.close()
+            return ids
+
+        except oracledb.Error as e:
+            self.logger.error("content_hash 목록 조회 실패", count=len(content_hashes), **sql.error_fields(e))
+            raise
+        finally:
+            await self._pool.release(connection)
+
+    async def iter_raw_data(
+        self,
+        since: Optional[datetime] = None,
+        channel: Optional[Channel] = None,
+        batch_size: int = 500,
+        until: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> AsyncIterator[List[RawRecord]]:
+        """
+        published_at 구간의 raw_data를 페이지 단위로 조회 (백필용)
+
+        Database.iter_raw_data()와 같은 순서와 페이지 규칙을 따릅니다.
+
+        Args:
+            since: 이 시간 이후(포함) 데이터만 조회 (없으면 처음부터)
+            channel: 특정 채널만 조회 (없으면 전체)
+            batch_size: 페이지 크기
+            until: 이 시간 이전(미포함) 데이터만 조회 (없으면 끝까지)
+            after_id: since와 같은 발행 시간 중 이 id 다음부터 조회 (이어서 조회할 때 사용)
+
+        Yields:
+            RawRecord 리스트 (페이지)
+        """
+        while True:
+            query, params = sql.range_query(since, until, channel, after_id, batch_size)
+
+            connection = await self._get_connection()
+            try:
+                cursor = connection.cursor()
+                cursor.arraysize = batch_size
+                await cursor.execute(query, params, fetch_lobs=False)
+                page = [sql.row_to_record(row) for row in await cursor.fetchall()]
+                cursor.close()
+            except oracledb.Error as e:
+                self.logger.error("데이터 구간 조회 실패", since=since, **sql.error_fields(e))
+                raise
+            finally:
+                await self._pool.release(connection)
+
+            if page:
+                yield page
+
+            # 다음 페이지는 마지막 행 다음부터
+            position = sql.next_page(page, batch_size)
+            if position is None:
+                return
+            since, after_id = position
+
+    async def drain_outbox(
+        self, publish: Callable[[List[RawRecord]], Awaitable[None]], batch_size: int = 500
+    ) -> int:
+        """
+        outbox 행을 최대 batch_size건 잠그고 발행한 뒤 삭제 (단일 트랜잭션)
+
+        Database.drain_outbox()와 같은 규칙을 따르며, publish는 코루틴 함수입니다.
+
+        Args:
+            publish: 잠근 행의 RawRecord 리스트를 발행하는 코루틴 함수 (실패 시 예외)
+            batch_size: 한 번에 처리할 최대 행 수
+
+        Returns:
+            발행 및 삭제한 행 수
+        """
+        connection = await self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = batch_size
+            await cursor.execute(sql.OUTBOX_CLAIM_SQL, fetch_lobs=False)
+            claimed = sql.claimed_outbox(await cursor.fetchmany(batch_size))
+
+            if claimed.records:
+                await publish(claimed.records)
+                await cursor.executemany(sql.OUTBOX_DELETE_SQL, sql.outbox_delete_params(claimed.outbox_ids))
+                await connection.commit()
+            else:
+                await connection.rollback()
+
+            cursor.close()
+            return len(claimed.records)
+
+        except oracledb.Error as e:
+            await self._rollback(connection)
+            self.logger.error("outbox 처리 실패", **sql.error_fields(e))
+            raise
+        except Exception:
+            # 발행 실패: 잠금 해제 후 다음 실행에서 재시도
+            await self._rollback(connection)
+            raise
+        finally:
+            await self._pool.release(connection)
+
+    async def close(self):
+        """Connection Pool 종료"""
+        if self._pool is None:
+            return
+        self.logger.info("Database Connection Pool 통계", **self.pool_stats())
+        await self._pool.close()
+        self._pool = None
+        self.logger.info("Database Async Connection Pool 종료")
@@ -2,27 +2,20 @@
 Oracle Database 연결 관리
 
 Trump Scan 프로젝트의 Oracle DB 연결을 관리합니다.
+SQL, 바인딩, 행 변환은 raw_data_sql 모듈을 AsyncDatabase와 공유합니다.
 """
-from datetime import datetime, timezone, timedelta
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 import oracledb
+from src.infrastructure import raw_data_sql as sql
 from src.logger import get_logger
+from src.metrics import DB_ACQUIRE_SECONDS, DB_INSERT_SECONDS, DB_POOL_BUSY, DB_POOL_OPEN
 from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
 from src.models.channel import Channel
-from config.database import DB_CONFIG
-
-
-def _to_char_timestamp_tz(column_name: str) -> str:
-    """TIMESTAMP WITH TIME ZONE 컬럼을 ISO 8601 형식 문자열로 변환하는 SQL 표현식"""
-    return f"TO_CHAR({column_name}, 'YYYY-MM-DD\"T\"HH24:MI:SS.FF6TZH:TZM')"
-
-
-def _parse_iso_timestamp(value: str) -> datetime:
-    """ISO 8601 형식 문자열을 timezone-aware datetime으로 변환"""
-    if value is None:
-        return None
-    return datetime.fromisoformat(value)
+from config.database import DB_CONFIG, DB_POOL_CONFIG, OUTBOX_CONFIG
 
 
 class Database:
@@ -32,38 +25,36 @@ class Database:
         """Database 초기화 및 Connection Pool 생성"""
         self.logger = get_logger(__name__)
 
-        # DB 설정 로드
-        username = DB_CONFIG["username"]
-        password = DB_CONFIG["password"]
         dsn = DB_CONFIG["dsn"]
-        wallet_location = DB_CONFIG["wallet_location"]
-        wallet_password = DB_CONFIG["wallet_password"]
+
+        # outbox 모드: 저장과 같은 트랜잭션에 발행 대기 행 기록
+        self.outbox_enabled = OUTBOX_CONFIG["enabled"]
+
+        # acquire 대기 시간 통계
+        self._acquire_stats = sql.AcquireStats()
 
         # Connection Pool 생성
         try:
             self.logger.info("Creating Oracle DB Connection Pool...", dsn=dsn)
 
-            self._pool = oracledb.create_pool(
-                user=username,
-                password=password,
+            self._pool = oracledb.create_pool(**sql.pool_params())
+
+            self.logger.info(
+                "Database Connection Pool created",
                 dsn=dsn,
-                config_dir=wallet_location,
-                wallet_location=wallet_location,
-                wallet_password=wallet_password,
-                min=1,
-                max=2,
-                increment=1,
+                min=DB_POOL_CONFIG["min"],
+                max=DB_POOL_CONFIG["max"]
             )
 
-            self.logger.info("Database Connection Pool created", dsn=dsn)
+            if DB_POOL_CONFIG["prewarm"]:
+                self._prewarm()
+
+            # Pool 사용량 메트릭 (scrape 시점에 조회, 종료된 Pool은 0)
+            DB_POOL_BUSY.set_function(lambda: self._pool.busy if self._pool is not None else 0)
+            DB_POOL_OPEN.set_function(lambda: self._pool.opened if self._pool is not None else 0)
 
         except oracledb.Error as e:
-            error_obj, = e.args
-            self.logger.error(
-                "Failed to create Connection Pool",
-                error_code=error_obj.code if hasattr(error_obj, 'code') else None,
-                error_message=str(error_obj.message) if hasattr(error_obj, 'message') else str(e)
-            )
+            self.logger.error("Failed to create Connection Pool", **sql.error_fields(e))
             raise
         except Exception as e:
             self.logger.error(
@@ -73,9 +64,43 @@ class Database:
             )
             raise
 
+    def _prewarm(self):
+        """최소 연결 수만큼 미리 연결하여 첫 수집의 연결 지연 제거"""
+        connections = [self._pool.acquire() for _ in range(DB_POOL_CONFIG["min"])]
+        for connection in connections:
+            connection.close()
+        self.logger.info("Database Connection Pool 준비 완료", opened=self._pool.opened)
+
     def _get_connection(self):
-        """Pool에서 connection 획득"""
-        return self._pool.acquire()
+        """Pool에서 connection 획득 (대기 시간 기록)"""
+        started = time.perf_counter()
+        connection = self._pool.acquire()
+        waited = time.perf_counter() - started
+
+        DB_ACQUIRE_SECONDS.observe(waited)
+        self._acquire_stats.record(waited)
+        return connection
+
+    def _rollback(self, connection):
+        """롤백 (연결 끊긴 경우 무시)"""
+        try:
+            connection.rollback()
+        except oracledb.Error:
+            pass
+
+    def pool_stats(self) -> Dict[str, float]:
+        """
+        Connection Pool 사용 현황
+
+        Returns:
+            busy, open, max, acquire 횟수 및 대기 시간(초) 통계
+        """
+        return {
+            "busy": self._pool.busy,
+            "open": self._pool.opened,
+            "max": self._pool.max,
+            **self._acquire_stats.snapshot(),
+        }
 
     def save_raw_data(self, raw_data: RawData) -> RawData:
         """
@@ -91,33 +116,19 @@ class Database:
         try:
             cursor = connection.cursor()
 
-            # INSERT 쿼리 (RETURNING으로 생성된 ID 받기)
-            insert_sql = """
-                INSERT INTO raw_data (content, link, published_at, channel)
-                VALUES (:content, :link, :published_at, :channel)
-                RETURNING id INTO :id
-            """
-
             # ID를 받을 변수 준비
             id_var = cursor.var(oracledb.NUMBER)
 
-            # 실행
-            cursor.execute(
-                insert_sql,
-                {
-                    "content": raw_data.content,
-                    "link": raw_data.link,
-                    "published_at": raw_data.published_at,
-                    "channel": raw_data.channel.value,  # Enum의 값 사용
-                    "id": id_var
-                }
-            )
+            with DB_INSERT_SECONDS.time():
+                cursor.execute(sql.INSERT_SQL, {**sql.insert_params(raw_data), "id": id_var})
 
             # 생성된 ID를 RawData 객체에 할당
-            generated_id = int(id_var.getvalue()[0])
-            raw_data.id = generated_id
+            raw_data.id = int(id_var.getvalue()[0])
+
+            # outbox 모드: 같은 트랜잭션에 발행 대기 행 기록
+            if self.outbox_enabled:
+                cursor.execute(sql.OUTBOX_INSERT_SQL, sql.outbox_params([raw_data])[0])
 
-            # 커밋
             connection.commit()
 
             self.logger.debug("원본 데이터 저장 완료", id=raw_data.id, link=raw_data.link)
@@ -126,28 +137,83 @@ class Database:
             return raw_data
 
         except oracledb.Error as e:
-            try:
-                connection.rollback()
-            except oracledb.Error:
-                pass  # 연결 끊긴 경우 rollback 무시
-            error_obj, = e.args
+            self._rollback(connection)
+            self.logger.error("데이터 저장 실패", link=raw_data.link, **sql.error_fields(e))
+            raise
+        except Exception as e:
+            self._rollback(connection)
             self.logger.error(
-                "데이터 저장 실패",
-                error_code=error_obj.code if hasattr(error_obj, 'code') else None,
-                error_message=str(error_obj.message) if hasattr(error_obj, 'message') else str(e),
-                link=raw_data.link
+                "데이터 저장 중 예외 발생", error=str(e), error_type=type(e).__name__, link=raw_data.link
             )
             raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def save_raw_data_batch(
+        self, raw_data_list: List[Union[RawData, RawRecord]]
+    ) -> List[Union[RawData, RawRecord]]:
+        """
+        원본 데이터 일괄 저장 (executemany + 단일 커밋)
+
+        수집 hot path에서는 검증이 끝난 RawRecord를 받습니다.
+
+        Args:
+            raw_data_list: 저장할 RawData 또는 RawRecord 리스트
+
+        Returns:
+            입력 순서대로 ID가 할당된 항목 리스트
+            (content_hash unique 인덱스에 걸린 중복 항목은 제외되며 id가 None으로 남음)
+        """
+        if not raw_data_list:
+            return []
+
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+
+            # 행마다 생성된 ID를 받을 배열 변수 준비
+            id_var = cursor.var(oracledb.NUMBER, arraysize=len(raw_data_list))
+            cursor.setinputsizes(id=id_var)
+
+            # Array DML로 한 번에 실행 (행 단위 오류는 batcherrors로 수집)
+            with DB_INSERT_SECONDS.time():
+                cursor.executemany(
+                    sql.INSERT_SQL,
+                    [sql.insert_params(raw_data) for raw_data in raw_data_list],
+                    batcherrors=True
+                )
+
+            # 중복(ORA-00001)은 건너뛰고, 그 외 행 오류는 전체 롤백
+            duplicates = sql.duplicate_offsets(cursor.getbatcherrors())
+            saved_data = sql.assign_batch_ids(raw_data_list, id_var, duplicates)
+
+            # outbox 모드: 같은 트랜잭션에 발행 대기 행 기록 (커밋 후 OutboxRelay가 발행)
+            if self.outbox_enabled and saved_data:
+                outbox_cursor = connection.cursor()
+                outbox_cursor.executemany(sql.OUTBOX_INSERT_SQL, sql.outbox_params(saved_data))
+                outbox_cursor.close()
+
+            # 커밋 (전체 1회)
+            connection.commit()
+
+            if duplicates:
+                self.logger.info("중복 데이터 저장 생략", skipped=len(duplicates))
+            self.logger.debug("원본 데이터 일괄 저장 완료", count=len(saved_data))
+
+            cursor.close()
+            return saved_data
+
+        except oracledb.Error as e:
+            self._rollback(connection)
+            self.logger.error("데이터 일괄 저장 실패", count=len(raw_data_list), **sql.error_fields(e))
+            raise
         except Exception as e:
-            try:
-                connection.rollback()
-            except oracledb.Error:
-                pass
+            self._rollback(connection)
             self.logger.error(
-                "데이터 저장 중 예외 발생",
+                "데이터 일괄 저장 중 예외 발생",
                 error=str(e),
                 error_type=type(e).__name__,
-                link=raw_data.link
+                count=len(raw_data_list)
             )
             raise
         finally:
@@ -164,38 +230,15 @@ class Database:
             RawData 또는 None (데이터 없는 경우)
 
         Note:
-            published_at은 timezone-aware datetime으로 반환됩니다.
+            published_at은 UTC timezone-aware datetime으로 반환됩니다.
         """
         connection = self._get_connection()
         try:
             cursor = connection.cursor()
 
-            # TO_CHAR로 타임존 포함 ISO 8601 형식으로 변환
-            if id is not None:
-                query = f"""
-                    SELECT
-                        id,
-                        content,
-                        link,
-                        {_to_char_timestamp_tz('published_at')} as published_at,
-                        channel
-                    FROM raw_data
-                    WHERE id = :id
-                """
-                cursor.execute(query, {"id": id})
-            else:
-                query = f"""
-                    SELECT
-                        id,
-                        content,
-                        link,
-                        {_to_char_timestamp_tz('published_at')} as published_at,
-                        channel
-                    FROM raw_data
-                    ORDER BY published_at DESC
-                    FETCH FIRST 1 ROW ONLY
-                """
-                cursor.execute(query)
+            # content(CLOB)는 str로 바로 받아 LOB 읽기 왕복을 없앰
+            query, params = sql.latest_query(id)
+            cursor.execute(query, params, fetch_lobs=False)
 
             row = cursor.fetchone()
             cursor.close()
@@ -203,34 +246,182 @@ class Database:
             if row is None:
                 return None
 
-            db_id, content_lob, link, published_at_str, channel_value = row
+            return sql.row_to_raw_data(row)
 
-            # CLOB -> str 변환
-            content = content_lob.read() if hasattr(content_lob, 'read') else str(content_lob)
+        except oracledb.Error as e:
+            self.logger.error("데이터 조회 실패", **sql.error_fields(e))
+            raise
+        finally:
+            connection.close()
 
-            # ISO 8601 문자열 -> timezone-aware datetime
-            published_at = _parse_iso_timestamp(published_at_str)
+    def get_raw_data_by_ids(self, ids: List[int]) -> Dict[int, RawRecord]:
+        """
+        id 목록으로 raw_data 일괄 조회 (참조 모드 소비자용)
 
-            return RawData(
-                id=int(db_id),
-                content=content,
-                link=link,
-                published_at=published_at,
-                channel=Channel(channel_value)
-            )
+        IN_LIST_LIMIT개씩 나눠 IN 조회하며, 연결은 한 번만 획득합니다.
+
+        Args:
+            ids: 조회할 raw_data id 목록
+
+        Returns:
+            id → RawRecord 딕셔너리 (없는 id는 포함되지 않음)
+        """
+        records: Dict[int, RawRecord] = {}
+        if not ids:
+            return records
+
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = sql.IN_LIST_LIMIT
+            for chunk in sql.id_chunks(ids):
+                query, params = sql.ids_query(chunk)
+                cursor.execute(query, params, fetch_lobs=False)
+                for row in cursor.fetchall():
+                    record = sql.row_to_record(row)
+                    records[record.id] = record
+            cursor.close()
+            return records
 
         except oracledb.Error as e:
-            error_obj, = e.args
-            self.logger.error(
-                "데이터 조회 실패",
-                error_code=error_obj.code if hasattr(error_obj, 'code') else None,
-                error_message=str(error_obj.message) if hasattr(error_obj, 'message') else str(e)
-            )
+            self.logger.error("id 목록 조회 실패", count=len(ids), **sql.error_fields(e))
+            raise
+        finally:
+            connection.close()
+
+    def get_raw_data_ids_by_hash(self, content_hashes: List[str]) -> Dict[str, int]:
+        """
+        content_hash 목록으로 raw_data id 일괄 조회
+
+        IN_LIST_LIMIT개씩 나눠 IN 조회하며, 연결은 한 번만 획득합니다.
+        저장 시 중복(ORA-00001)으로 제외된 항목의 기존 id를 찾을 때 사용합니다.
+
+        Args:
+            content_hashes: 조회할 content_hash 목록
+
+        Returns:
+            content_hash → id 딕셔너리 (없는 content_hash는 포함되지 않음)
+        """
+        ids: Dict[str, int] = {}
+        if not content_hashes:
+            return ids
+
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = sql.IN_LIST_LIMIT
+            for chunk in sql.id_chunks(content_hashes):
+                query, params = sql.hashes_query(chunk)
+                cursor.execute(query, params)
+                for db_id, content_hash in cursor.fetchall():
+                    ids[content_hash] = int(db_id)
+            cursor.close()
+            return ids
+
+        except oracledb.Error as e:
+            self.logger.error("content_hash 목록 조회 실패", count=len(content_hashes), **sql.error_fields(e))
+            raise
+        finally:
+            connection.close()
+
+    def iter_raw_data(
+        self,
+        since: Optional[datetime] = None,
+        channel: Optional[Channel] = None,
+        batch_size: int = 500,
+        until: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[List[RawRecord]]:
+        """
+        published_at 구간의 raw_data를 페이지 단위로 조회 (백필용)
+
+        발행 시간, id 오름차순으로 batch_size건씩 돌려주며,
+        페이지마다 마지막 행 다음부터 조회하므로 메모리 사용량이 일정합니다.
+        대량 조회이므로 Pydantic 모델 대신 RawRecord를 돌려줍니다.
+
+        Args:
+            since: 이 시간 이후(포함) 데이터만 조회 (없으면 처음부터)
+            channel: 특정 채널만 조회 (없으면 전체)
+            batch_size: 페이지 크기
+            until: 이 시간 이전(미포함) 데이터만 조회 (없으면 끝까지)
+            after_id: since와 같은 발행 시간 중 이 id 다음부터 조회 (이어서 조회할 때 사용)
+
+        Yields:
+            RawRecord 리스트 (페이지)
+        """
+        while True:
+            query, params = sql.range_query(since, until, channel, after_id, batch_size)
+
+            connection = self._get_connection()
+            try:
+                cursor = connection.cursor()
+                cursor.arraysize = batch_size
+                cursor.execute(query, params, fetch_lobs=False)
+                page = [sql.row_to_record(row) for row in cursor.fetchall()]
+                cursor.close()
+            except oracledb.Error as e:
+                self.logger.error("데이터 구간 조회 실패", since=since, **sql.error_fields(e))
+                raise
+            finally:
+                connection.close()
+
+            if page:
+                yield page
+
+            # 다음 페이지는 마지막 행 다음부터
+            position = sql.next_page(page, batch_size)
+            if position is None:
+                return
+            since, after_id = position
+
+    def drain_outbox(self, publish: Callable[[List[RawRecord]], None], batch_size: int = 500) -> int:
+        """
+        outbox 행을 최대 batch_size건 잠그고 발행한 뒤 삭제 (단일 트랜잭션)
+
+        SELECT ... FOR UPDATE SKIP LOCKED로 잠근 행만 처리하므로 여러 인스턴스가
+        동시에 실행해도 같은 행을 나눠 갖지 않습니다. 발행 후 커밋 전에 실패하면
+        롤백되어 다음 실행에서 다시 발행합니다 (최소 1회 전달).
+
+        Args:
+            publish: 잠근 행의 RawRecord 리스트를 발행하는 함수 (실패 시 예외)
+            batch_size: 한 번에 처리할 최대 행 수
+
+        Returns:
+            발행 및 삭제한 행 수
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = batch_size
+            cursor.execute(sql.OUTBOX_CLAIM_SQL, fetch_lobs=False)
+            claimed = sql.claimed_outbox(cursor.fetchmany(batch_size))
+
+            if claimed.records:
+                publish(claimed.records)
+                cursor.executemany(sql.OUTBOX_DELETE_SQL, sql.outbox_delete_params(claimed.outbox_ids))
+                connection.commit()
+            else:
+                connection.rollback()
+
+            cursor.close()
+            return len(claimed.records)
+
+        except oracledb.Error as e:
+            self._rollback(connection)
+            self.logger.error("outbox 처리 실패", **sql.error_fields(e))
+            raise
+        except Exception:
+            # 발행 실패: 잠금 해제 후 다음 실행에서 재시도
+            self._rollback(connection)
             raise
         finally:
             connection.close()
 
     def close(self):
         """Connection Pool 종료"""
+        if self._pool is None:
+            return
+        self.logger.info("Database Connection Pool 통계", **self.pool_stats())
         self._pool.close()
+        self._pool = None
         self.logger.info("Database Connection Pool 종료")
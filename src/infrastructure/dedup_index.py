@@ -0,0 +1,121 @@
+"""
+DedupIndex: 수집 데이터 중복 제거 인덱스
+
+Redis에 content_hash를 TTL과 함께 기록하여 이미 저장/발행된 항목을 걸러냅니다.
+최종 방어선은 raw_data.content_hash의 unique 인덱스입니다.
+
+저장 전에는 발행 대기 표시(dedup:pending:<hash>)를 남기고 발행이 끝나면 지웁니다.
+다음 수집에서 표시가 남아 있는 항목은 저장 후 발행이 끝나지 않은 항목입니다.
+"""
+from typing import List, Optional, Set, Union
+import redis
+from redis.client import Pipeline
+from src.logger import get_logger
+from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
+from config.redis import REDIS_CONFIG, DEDUP_CONFIG
+
+
+class DedupIndex:
+    """content_hash 기반 중복 제거 인덱스"""
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        """
+        DedupIndex 초기화
+
+        Args:
+            redis_client: 사용할 Redis 클라이언트 (없으면 REDIS_CONFIG로 생성)
+        """
+        self.logger = get_logger(__name__)
+
+        # Redis 설정 로드
+        host = REDIS_CONFIG["host"]
+        port = REDIS_CONFIG["port"]
+        db = REDIS_CONFIG["db"]
+
+        self.redis_client = redis_client or redis.Redis(host=host, port=port, db=db, decode_responses=True)
+        self.ttl_seconds = DEDUP_CONFIG["ttl_seconds"]
+
+        # 연결 테스트
+        try:
+            self.redis_client.ping()
+            self.logger.info("DedupIndex 연결 성공", host=host, port=port, db=db)
+        except redis.ConnectionError as e:
+            self.logger.error("DedupIndex 연결 실패", error=str(e))
+            raise
+
+    def filter_new(self, raw_data_list: List[Union[RawData, RawRecord]]) -> List[Union[RawData, RawRecord]]:
+        """
+        이미 처리된 항목과 배치 내 중복을 제외 (MGET 1회)
+
+        Args:
+            raw_data_list: 수집된 RawData 또는 RawRecord 리스트
+
+        Returns:
+            처음 보는 항목 리스트 (입력 순서 유지)
+        """
+        if not raw_data_list:
+            return []
+
+        hashes = [raw_data.content_hash() for raw_data in raw_data_list]
+        seen = self.redis_client.mget([self._key(content_hash) for content_hash in hashes])
+
+        new_data = []
+        batch_hashes = set()
+        for raw_data, content_hash, existing in zip(raw_data_list, hashes, seen):
+            if existing is not None or content_hash in batch_hashes:
+                continue
+            batch_hashes.add(content_hash)
+            new_data.append(raw_data)
+
+        skipped = len(raw_data_list) - len(new_data)
+        if skipped:
+            self.logger.info("중복 데이터 제외", skipped=skipped, remaining=len(new_data))
+
+        return new_data
+
+    def mark_pending(self, raw_data_list: List[Union[RawData, RawRecord]]) -> Set[str]:
+        """
+        저장 전 발행 대기 표시 (SET ... GET, pipeline 1회)
+
+        Args:
+            raw_data_list: 저장할 RawData 또는 RawRecord 리스트
+
+        Returns:
+            이전 시도의 표시가 남아 있던 content_hash 집합 (저장 후 발행이 끝나지 않은 항목)
+        """
+        if not raw_data_list:
+            return set()
+
+        hashes = [raw_data.content_hash() for raw_data in raw_data_list]
+        pipe = self.redis_client.pipeline(transaction=False)
+        for content_hash in hashes:
+            pipe.set(self._pending_key(content_hash), 1, ex=self.ttl_seconds, get=True)
+
+        return {content_hash for content_hash, previous in zip(hashes, pipe.execute()) if previous is not None}
+
+    def mark_seen(self, raw_data_list: List[Union[RawData, RawRecord]], pipeline: Optional[Pipeline] = None):
+        """
+        처리된 항목을 인덱스에 기록하고 발행 대기 표시 삭제
+
+        Args:
+            raw_data_list: 저장 및 발행된 RawData 또는 RawRecord 리스트
+            pipeline: 주어지면 즉시 실행하지 않고 해당 pipeline에 명령을 추가
+        """
+        pipe = pipeline or self.redis_client.pipeline(transaction=False)
+
+        for raw_data in raw_data_list:
+            content_hash = raw_data.content_hash()
+            pipe.set(self._key(content_hash), 1, ex=self.ttl_seconds)
+            pipe.delete(self._pending_key(content_hash))
+
+        if pipeline is None:
+            pipe.execute()
+
+    def _key(self, content_hash: str) -> str:
+        """content_hash에 해당하는 Redis 키"""
+        return f"dedup:{content_hash}"
+
+    def _pending_key(self, content_hash: str) -> str:
+        """content_hash의 발행 대기 표시 Redis 키"""
+        return f"dedup:pending:{content_hash}"
@@ -0,0 +1,279 @@
+"""
+MessageCodec: Redis Streams 메시지 직렬화
+
+스트림 항목은 다음 필드로 구성됩니다 (wire format v1).
+- v: wire format 버전
+- codec: payload 인코딩 (json, orjson, msgpack)
+- data: 인코딩된 payload (RawData.to_dict() 결과)
+- compression: payload 압축 방식 (zlib, zstd). 압축한 경우에만 존재
+- ref: "1"이면 참조 모드 메시지 (content 없이 id와 메타데이터만 포함)
+
+v 필드가 없는 항목은 이전 형식(data 필드에 JSON 문자열)으로 취급합니다.
+orjson, msgpack, zstd(zstandard)는 선택 의존성이며 설정에서 선택한 경우에만 필요합니다.
+"""
+import json
+import zlib
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+# 현재 wire format 버전
+WIRE_VERSION = "1"
+
+# 스트림 필드 이름
+VERSION_FIELD = "v"
+CODEC_FIELD = "codec"
+DATA_FIELD = "data"
+COMPRESSION_FIELD = "compression"
+REFERENCE_FIELD = "ref"
+
+Payload = Union[str, bytes]
+
+
+class MessageCodec(NamedTuple):
+    """payload 인코더/디코더 쌍"""
+
+    # codec 필드에 기록할 이름
+    name: str
+    # dict → payload
+    encode: Callable[[Dict[str, Any]], Payload]
+    # payload → dict
+    decode: Callable[[Payload], Dict[str, Any]]
+
+
+def _json_codec() -> MessageCodec:
+    return MessageCodec(
+        "json",
+        lambda message: json.dumps(message, ensure_ascii=False),
+        json.loads,
+    )
+
+
+def _orjson_codec() -> MessageCodec:
+    import orjson
+
+    return MessageCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgpack_codec() -> MessageCodec:
+    import msgpack
+
+    return MessageCodec(
+        "msgpack",
+        lambda message: msgpack.packb(message, use_bin_type=True),
+        lambda payload: msgpack.unpackb(payload, raw=False),
+    )
+
+
+_CODEC_FACTORIES: Dict[str, Callable[[], MessageCodec]] = {
+    "json": _json_codec,
+    "orjson": _orjson_codec,
+    "msgpack": _msgpack_codec,
+}
+
+_codecs: Dict[str, MessageCodec] = {}
+
+
+def get_codec(name: str) -> MessageCodec:
+    """
+    이름으로 codec 조회
+
+    Args:
+        name: codec 이름 (json, orjson, msgpack)
+
+    Returns:
+        MessageCodec
+
+    Raises:
+        ValueError: 알 수 없는 codec
+        ImportError: codec의 선택 의존성이 설치되지 않은 경우
+    """
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+
+    factory = _CODEC_FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"알 수 없는 codec: {name} (지원: {', '.join(_CODEC_FACTORIES)})")
+
+    try:
+        codec = factory()
+    except ImportError as e:
+        raise ImportError(f"codec '{name}'을 사용하려면 {name} 패키지를 설치하세요") from e
+
+    _codecs[name] = codec
+    return codec
+
+
+class Compressor(NamedTuple):
+    """payload 압축/해제 함수 쌍"""
+
+    # compression 필드에 기록할 이름
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _zlib_compressor() -> Compressor:
+    return Compressor("zlib", zlib.compress, zlib.decompress)
+
+
+def _zstd_compressor() -> Compressor:
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor()
+    decompressor = zstandard.ZstdDecompressor()
+    return Compressor("zstd", compressor.compress, decompressor.decompress)
+
+
+_COMPRESSOR_FACTORIES: Dict[str, Callable[[], Compressor]] = {
+    "zlib": _zlib_compressor,
+    "zstd": _zstd_compressor,
+}
+
+_compressors: Dict[str, Compressor] = {}
+
+
+def get_compressor(name: str) -> Compressor:
+    """
+    이름으로 압축 방식 조회
+
+    Args:
+        name: 압축 방식 이름 (zlib, zstd)
+
+    Returns:
+        Compressor
+
+    Raises:
+        ValueError: 알 수 없는 압축 방식
+        ImportError: zstd 사용 시 zstandard 패키지가 설치되지 않은 경우
+    """
+    compressor = _compressors.get(name)
+    if compressor is not None:
+        return compressor
+
+    factory = _COMPRESSOR_FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"알 수 없는 압축 방식: {name} (지원: {', '.join(_COMPRESSOR_FACTORIES)})")
+
+    try:
+        compressor = factory()
+    except ImportError as e:
+        raise ImportError(f"압축 방식 '{name}'을 사용하려면 zstandard 패키지를 설치하세요") from e
+
+    _compressors[name] = compressor
+    return compressor
+
+
+def encode_message(
+    message: Dict[str, Any],
+    codec: MessageCodec,
+    compressor: Optional[Compressor] = None,
+    compression_min_bytes: int = 0,
+    reference: bool = False,
+) -> Dict[str, Payload]:
+    """
+    메시지를 스트림 항목 필드로 인코딩
+
+    Args:
+        message: RawData.to_dict() 형태의 메시지
+        codec: 사용할 codec
+        compressor: 주어지면 payload가 compression_min_bytes 이상일 때 압축
+        compression_min_bytes: 압축할 최소 payload 크기 (bytes)
+        reference: True면 content를 빼고 id와 메타데이터만 발행 (참조 모드)
+
+    Returns:
+        XADD에 넘길 필드 딕셔너리
+    """
+    fields = {
+        VERSION_FIELD: WIRE_VERSION,
+        CODEC_FIELD: codec.name,
+    }
+
+    if reference:
+        message = {key: value for key, value in message.items() if key != "content"}
+        fields[REFERENCE_FIELD] = "1"
+
+    payload = codec.encode(message)
+
+    if compressor is not None and len(payload) >= compression_min_bytes:
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        payload = compressor.compress(payload)
+        fields[COMPRESSION_FIELD] = compressor.name
+
+    fields[DATA_FIELD] = payload
+    return fields
+
+
+def decode_message(fields: Dict[Any, Any]) -> Dict[str, Any]:
+    """
+    스트림 항목 필드를 메시지로 디코딩 (소비자용)
+
+    decode_responses 설정과 관계없이 str / bytes 키를 모두 받습니다.
+    msgpack 및 압축된 payload는 바이너리이므로 소비자는 decode_responses=False로 읽어야 합니다.
+    참조 모드 메시지는 content가 없으므로 resolve_references()로 채웁니다.
+
+    Args:
+        fields: XREAD / XRANGE로 읽은 항목 필드
+
+    Returns:
+        RawData.to_dict() 형태의 메시지
+
+    Raises:
+        ValueError: 지원하지 않는 wire format 버전
+    """
+    normalized = {
+        key.decode() if isinstance(key, bytes) else key: value
+        for key, value in fields.items()
+    }
+
+    version = _as_str(normalized.get(VERSION_FIELD))
+
+    # 버전 필드가 없으면 이전 형식 (JSON 문자열)
+    if version is None:
+        return json.loads(normalized[DATA_FIELD])
+
+    if version != WIRE_VERSION:
+        raise ValueError(f"지원하지 않는 메시지 버전: {version}")
+
+    codec_name = _as_str(normalized[CODEC_FIELD])
+    payload = normalized[DATA_FIELD]
+
+    compression = normalized.get(COMPRESSION_FIELD)
+    if compression is not None:
+        payload = get_compressor(_as_str(compression)).decompress(payload)
+
+    message = get_codec(codec_name).decode(payload)
+
+    if _as_str(normalized.get(REFERENCE_FIELD)) == "1":
+        message["content"] = None
+
+    return message
+
+
+def resolve_references(messages: List[Dict[str, Any]], database) -> List[Dict[str, Any]]:
+    """
+    참조 모드 메시지의 content를 Database에서 일괄 조회하여 채움 (소비자용)
+
+    Args:
+        messages: decode_message() 결과 리스트
+        database: get_raw_data_by_ids()를 제공하는 Database
+
+    Returns:
+        content가 채워진 메시지 리스트 (DB에 없는 항목은 content가 None)
+    """
+    ids = [message["id"] for message in messages if message.get("content") is None]
+    if not ids:
+        return messages
+
+    found = database.get_raw_data_by_ids(ids)
+    for message in messages:
+        if message.get("content") is None and message["id"] in found:
+            message["content"] = found[message["id"]].content
+    return messages
+
+
+def _as_str(value: Optional[Union[str, bytes]]) -> Optional[str]:
+    """bytes 필드 값을 str로 변환"""
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
@@ -3,18 +3,28 @@ MessageQueue: Redis Streams 메시지 큐
 
 수집된 데이터를 다음 레이어로 전달하는 메시지 큐입니다.
 """
-import json
+import time
+from typing import Callable, Dict, List, Optional, Union
 import redis
+from redis.client import Pipeline
+from src.infrastructure.message_codec import encode_message, get_codec, get_compressor
 from src.logger import get_logger
+from src.metrics import XADD_SECONDS
 from src.models.raw_data import RawData
-from config.redis import REDIS_CONFIG
+from src.models.raw_record import RawRecord
+from config.redis import REDIS_CONFIG, STREAM_CONFIG
 
 
 class MessageQueue:
     """Redis Streams 기반 메시지 큐"""
 
-    def __init__(self):
-        """MessageQueue 초기화"""
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        """
+        MessageQueue 초기화
+
+        Args:
+            redis_client: 사용할 Redis 클라이언트 (없으면 REDIS_CONFIG로 생성)
+        """
         self.logger = get_logger(__name__)
 
         # Redis 설정 로드
@@ -22,8 +32,19 @@ class MessageQueue:
         port = REDIS_CONFIG["port"]
         db = REDIS_CONFIG["db"]
 
-        self.redis_client = redis.Redis(host=host, port=port, db=db, decode_responses=True)
-        self.stream_name = "trump-scan:data-collection:raw-data"
+        self.redis_client = redis_client or redis.Redis(host=host, port=port, db=db, decode_responses=True)
+        self.stream_name = STREAM_CONFIG["name"]
+        self.transaction = STREAM_CONFIG["transaction"]
+        self.retention = STREAM_CONFIG["retention"]
+        self.codec = get_codec(STREAM_CONFIG["codec"])
+
+        # payload 압축 (임계 크기 이상만) 및 참조 모드
+        compression = STREAM_CONFIG["compression"]
+        self.compressor = None if compression == "none" else get_compressor(compression)
+        self.compression_min_bytes = STREAM_CONFIG["compression_min_bytes"]
+        if STREAM_CONFIG["payload"] not in ("full", "reference"):
+            raise ValueError(f"알 수 없는 payload 설정: {STREAM_CONFIG['payload']} (지원: full, reference)")
+        self.reference = STREAM_CONFIG["payload"] == "reference"
 
         # 연결 테스트
         try:
@@ -44,14 +65,16 @@ class MessageQueue:
             발행된 메시지 ID
         """
         try:
-            # JSON 직렬화 (Pydantic model_dump 사용)
-            message_json = json.dumps(raw_data.to_dict(), ensure_ascii=False)
+            # 설정된 codec으로 직렬화 (버전 필드 포함)
+            fields = self._encode(raw_data)
 
             # Redis Streams에 발행
-            message_id = self.redis_client.xadd(
-                self.stream_name,
-                {"data": message_json}
-            )
+            with XADD_SECONDS.time():
+                message_id = self.redis_client.xadd(
+                    self.stream_name,
+                    fields,
+                    **self._trim_options()
+                )
 
             self.logger.debug(
                 "메시지 발행 완료",
@@ -73,3 +96,115 @@ class MessageQueue:
                 raw_data_id=raw_data.id
             )
             raise
+
+    def publish_batch(
+        self,
+        raw_data_list: List[Union[RawData, RawRecord]],
+        after_publish: Optional[Callable[[Pipeline], Optional[Callable[[List], None]]]] = None,
+    ) -> List[str]:
+        """
+        메시지 일괄 발행 (단일 Redis pipeline)
+
+        Redis는 MULTI/EXEC 안에서도 실패한 명령만 건너뛰고 나머지를 실행하므로,
+        상태 기록(Checkpoint 등)은 메시지와 같은 pipeline에 넣지 않고
+        모든 XADD가 성공한 뒤 별도의 MULTI/EXEC로 기록합니다.
+        발행 후 상태 기록 전에 실패하면 다음 수집에서 다시 발행됩니다 (최소 1회 전달).
+
+        Args:
+            raw_data_list: 발행할 RawData 또는 RawRecord 리스트
+            after_publish: 발행 성공 후 상태 기록 pipeline(MULTI/EXEC)에 명령을 넣는 콜백
+                (예: Checkpoint 저장, 중복 인덱스 기록).
+                함수를 반환하면 상태 기록 결과를 인자로 호출 (예: Checkpoint 캐시 반영)
+
+        Returns:
+            발행된 메시지 ID 리스트 (입력 순서)
+
+        Raises:
+            redis.RedisError: XADD 실패 (이 경우 after_publish 명령은 실행되지 않음)
+        """
+        if not raw_data_list and after_publish is None:
+            return []
+
+        try:
+            message_ids = []
+            if raw_data_list:
+                pipe = self.redis_client.pipeline(transaction=self.transaction)
+
+                trim_options = self._trim_options()
+                for raw_data in raw_data_list:
+                    fields = self._encode(raw_data)
+                    pipe.xadd(self.stream_name, fields, **trim_options)
+
+                # 하나라도 실패하면 예외 (상태 기록으로 넘어가지 않음)
+                with XADD_SECONDS.time():
+                    message_ids = pipe.execute()
+
+            # 발행이 모두 성공한 뒤에만 상태 기록
+            if after_publish is not None:
+                state_pipe = self.redis_client.pipeline(transaction=True)
+                on_written = after_publish(state_pipe)
+                state_results = state_pipe.execute()
+                if on_written is not None:
+                    on_written(state_results)
+
+            self.logger.debug("메시지 일괄 발행 완료", count=len(message_ids))
+
+            return message_ids
+
+        except redis.RedisError as e:
+            self.logger.error("메시지 일괄 발행 실패", error=str(e), count=len(raw_data_list))
+            raise
+        except Exception as e:
+            self.logger.error(
+                "메시지 일괄 발행 중 예외 발생",
+                error=str(e),
+                error_type=type(e).__name__,
+                count=len(raw_data_list)
+            )
+            raise
+
+    def trim(self) -> int:
+        """
+        보존 정책에 따라 스트림 트리밍 (백그라운드 트리머용)
+
+        Returns:
+            제거된 메시지 수
+        """
+        trim_options = self._trim_options()
+        if not trim_options:
+            return 0
+
+        try:
+            removed = self.redis_client.xtrim(self.stream_name, **trim_options)
+            self.logger.debug("스트림 트리밍 완료", removed=removed, retention=self.retention)
+            return removed
+        except redis.RedisError as e:
+            self.logger.error("스트림 트리밍 실패", error=str(e))
+            raise
+
+    def _encode(self, raw_data: Union[RawData, RawRecord]) -> Dict:
+        """설정된 codec / 압축 / payload 모드로 스트림 항목 필드 생성"""
+        return encode_message(
+            raw_data.to_dict(),
+            self.codec,
+            compressor=self.compressor,
+            compression_min_bytes=self.compression_min_bytes,
+            reference=self.reference,
+        )
+
+    def _trim_options(self) -> Dict:
+        """
+        보존 정책에 해당하는 XADD/XTRIM 인자
+
+        Returns:
+            maxlen 또는 minid 근사(~) 트리밍 인자 (정책이 none이면 빈 딕셔너리)
+        """
+        if self.retention == "maxlen":
+            return {"maxlen": STREAM_CONFIG["maxlen"], "approximate": True}
+
+        if self.retention == "minid":
+            # Stream ID는 밀리초 타임스탬프 기반이므로 보존 기간 이전 ID를 하한으로 사용
+            min_timestamp_ms = int((time.time() - STREAM_CONFIG["retention_seconds"]) * 1000)
+            return {"minid": f"{min_timestamp_ms}-0", "approximate": True}
+
+        return {}
@@ -0,0 +1,86 @@
+"""
+OutboxRelay: outbox → Redis Streams 발행
+
+raw_data와 같은 트랜잭션에 기록된 raw_data_outbox 행을 배치 단위로 잠그고,
+Redis Streams에 발행한 뒤 삭제합니다. 발행 후 삭제 커밋 전에 실패하면
+다음 실행에서 다시 발행하므로 최소 1회 전달을 보장합니다.
+"""
+import asyncio
+from collections import Counter
+from typing import List, Optional
+from src.logger import get_logger
+from src.metrics import ITEMS_PUBLISHED
+from src.models.raw_record import RawRecord
+from config.database import OUTBOX_CONFIG
+
+
+class OutboxRelay:
+    """Transactional outbox 발행 클래스"""
+
+    # 한 번 실행에서 처리할 최대 배치 수 (다른 작업이 밀리지 않도록 제한)
+    MAX_BATCHES_PER_RUN = 20
+
+    def __init__(self, database, message_queue, batch_size: Optional[int] = None):
+        """
+        OutboxRelay 초기화
+
+        Args:
+            database: drain_outbox()를 제공하는 Database 또는 AsyncDatabase
+            message_queue: 발행할 메시지 큐
+            batch_size: 한 트랜잭션에서 처리할 최대 행 수 (없으면 OUTBOX_CONFIG 사용)
+        """
+        self.logger = get_logger(__name__)
+        self.database = database
+        self.message_queue = message_queue
+        self.batch_size = batch_size or OUTBOX_CONFIG["batch_size"]
+
+    def run_once(self) -> int:
+        """
+        outbox가 빌 때까지 (최대 MAX_BATCHES_PER_RUN 배치) 발행
+
+        Returns:
+            발행한 행 수
+        """
+        relayed = 0
+        for _ in range(self.MAX_BATCHES_PER_RUN):
+            count = self.database.drain_outbox(self._publish, self.batch_size)
+            relayed += count
+            if count < self.batch_size:
+                break
+
+        self._log_relayed(relayed)
+        return relayed
+
+    async def run_once_async(self) -> int:
+        """
+        AsyncDatabase로 outbox 발행 (동기 Redis 발행은 스레드로 위임)
+
+        Returns:
+            발행한 행 수
+        """
+        async def publish(records: List[RawRecord]):
+            await asyncio.to_thread(self._publish, records)
+
+        relayed = 0
+        for _ in range(self.MAX_BATCHES_PER_RUN):
+            count = await self.database.drain_outbox(publish, self.batch_size)
+            relayed += count
+            if count < self.batch_size:
+                break
+
+        self._log_relayed(relayed)
+        return relayed
+
+    def _publish(self, records: List[RawRecord]):
+        """잠근 outbox 행을 단일 pipeline으로 발행 (실패 시 예외 → 롤백)"""
+        self.message_queue.publish_batch(records)
+
+        for channel, count in Counter(record.channel for record in records).items():
+            ITEMS_PUBLISHED.labels(channel=channel.value).inc(count)
+
+    def _log_relayed(self, relayed: int):
+        """발행 결과 로깅"""
+        if relayed:
+            self.logger.info("outbox 발행 완료", count=relayed)
+        else:
+            self.logger.debug("발행할 outbox 없음")
@@ -0,0 +1,307 @@
+"""
+raw_data SQL 및 바인딩 / 행 변환
+
+Database(동기)와 AsyncDatabase(비동기)가 공유하는 부분입니다.
+두 클래스는 연결 획득과 execute / fetch / commit 호출만 다르고,
+SQL, 바인딩 생성, 결과 행 변환, 오류 로깅 필드는 모두 이 모듈을 사용합니다.
+"""
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+import oracledb
+from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
+from src.models.channel import Channel
+from config.database import DB_CONFIG, DB_POOL_CONFIG
+
+
+# ORA-00001: unique constraint violated
+UNIQUE_VIOLATION_CODE = 1
+
+# IN 목록 최대 개수 (ORA-01795: 목록은 최대 1000개)
+IN_LIST_LIMIT = 1000
+
+# published_at은 UTC TIMESTAMP로 변환해 조회
+# (드라이버가 TIMESTAMP WITH TIME ZONE을 naive datetime으로 돌려주므로 UTC 기준으로 맞춤)
+RAW_DATA_COLUMNS = "id, content, link, SYS_EXTRACT_UTC(published_at) AS published_at, channel"
+
+# INSERT 쿼리 (RETURNING으로 생성된 ID 받기)
+INSERT_SQL = """
+    INSERT INTO raw_data (content, link, published_at, channel, content_hash)
+    VALUES (:content, :link, :published_at, :channel, :content_hash)
+    RETURNING id INTO :id
+"""
+
+# outbox: raw_data와 같은 트랜잭션에 기록하고 OutboxRelay가 발행 후 삭제
+OUTBOX_INSERT_SQL = "INSERT INTO raw_data_outbox (raw_data_id) VALUES (:raw_data_id)"
+
+# SKIP LOCKED는 fetch한 행만 잠그므로 fetchmany(batch_size)로 배치 크기를 제한
+# (FETCH FIRST는 FOR UPDATE와 함께 쓸 수 없음)
+OUTBOX_CLAIM_SQL = """
+    SELECT o.id, r.id, r.content, r.link, SYS_EXTRACT_UTC(r.published_at) AS published_at, r.channel
+    FROM raw_data_outbox o
+    JOIN raw_data r ON r.id = o.raw_data_id
+    FOR UPDATE OF o.id SKIP LOCKED
+"""
+
+OUTBOX_DELETE_SQL = "DELETE FROM raw_data_outbox WHERE id = :id"
+
+
+def pool_params() -> Dict[str, Any]:
+    """create_pool / create_pool_async 공통 인자"""
+    wallet_location = DB_CONFIG["wallet_location"]
+    return {
+        "user": DB_CONFIG["username"],
+        "password": DB_CONFIG["password"],
+        "dsn": DB_CONFIG["dsn"],
+        "config_dir": wallet_location,
+        "wallet_location": wallet_location,
+        "wallet_password": DB_CONFIG["wallet_password"],
+        "min": DB_POOL_CONFIG["min"],
+        "max": DB_POOL_CONFIG["max"],
+        "increment": DB_POOL_CONFIG["increment"],
+        "stmtcachesize": DB_POOL_CONFIG["stmtcachesize"],
+        "getmode": oracledb.POOL_GETMODE_TIMEDWAIT,
+        "wait_timeout": DB_POOL_CONFIG["wait_timeout_ms"],
+        "ping_interval": DB_POOL_CONFIG["ping_interval"],
+    }
+
+
+def error_fields(error: Exception) -> Dict[str, Any]:
+    """oracledb.Error를 로그 필드(error_code, error_message)로 변환"""
+    error_obj = error.args[0] if error.args else error
+    return {
+        "error_code": getattr(error_obj, "code", None),
+        "error_message": str(getattr(error_obj, "message", error)),
+    }
+
+
+class AcquireStats:
+    """Connection Pool acquire 대기 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.wait_seconds = 0.0
+        self.wait_max_seconds = 0.0
+
+    def record(self, waited: float):
+        """acquire 1회의 대기 시간 기록"""
+        with self._lock:
+            self.count += 1
+            self.wait_seconds += waited
+            self.wait_max_seconds = max(self.wait_max_seconds, waited)
+
+    def snapshot(self) -> Dict[str, float]:
+        """acquire 횟수 및 대기 시간(초) 통계"""
+        with self._lock:
+            count, total, maximum = self.count, self.wait_seconds, self.wait_max_seconds
+        return {
+            "acquire_count": count,
+            "acquire_wait_seconds_total": total,
+            "acquire_wait_seconds_avg": total / count if count else 0.0,
+            "acquire_wait_seconds_max": maximum,
+        }
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """timezone-aware datetime을 FROM_TZ(:value, 'UTC') 바인딩용 UTC naive datetime으로 변환"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def row_to_record(row) -> RawRecord:
+    """(id, content, link, UTC published_at, channel) 행을 RawRecord로 변환 (저장 시 검증된 값)"""
+    db_id, content, link, published_at, channel_value = row
+    return RawRecord(
+        content=content,
+        link=link,
+        published_at=published_at.replace(tzinfo=timezone.utc),
+        channel=Channel(channel_value),
+        id=int(db_id),
+    )
+
+
+def row_to_raw_data(row) -> RawData:
+    """(id, content, link, UTC published_at, channel) 행을 RawData로 변환"""
+    return RawData.from_record(row_to_record(row))
+
+
+def insert_params(raw_data: Union[RawData, RawRecord]) -> Dict[str, Any]:
+    """raw_data INSERT 바인딩 (id 제외)"""
+    return {
+        "content": raw_data.content,
+        "link": raw_data.link,
+        "published_at": raw_data.published_at,
+        "channel": raw_data.channel.value,  # Enum의 값 사용
+        "content_hash": raw_data.content_hash(),
+    }
+
+
+def duplicate_offsets(batch_errors) -> Set[int]:
+    """
+    executemany(batcherrors=True) 오류 중 중복(ORA-00001) 행 위치
+
+    Raises:
+        oracledb.DatabaseError: 중복 외의 행 오류 (전체 롤백)
+    """
+    offsets = set()
+    for error in batch_errors:
+        if error.code != UNIQUE_VIOLATION_CODE:
+            raise oracledb.DatabaseError(error)
+        offsets.add(error.offset)
+    return offsets
+
+
+def assign_batch_ids(
+    raw_data_list: List[Union[RawData, RawRecord]], id_var, skipped: Set[int]
+) -> List[Union[RawData, RawRecord]]:
+    """
+    RETURNING 배열 변수의 ID를 입력 순서대로 할당
+
+    Args:
+        raw_data_list: INSERT한 RawData 또는 RawRecord 리스트
+        id_var: RETURNING id INTO 배열 변수
+        skipped: 저장되지 않은 행 위치 (중복)
+
+    Returns:
+        저장된 항목 리스트 (입력 순서)
+    """
+    saved_data = []
+    for index, raw_data in enumerate(raw_data_list):
+        if index in skipped:
+            continue
+        raw_data.id = int(id_var.getvalue(index)[0])
+        saved_data.append(raw_data)
+    return saved_data
+
+
+def outbox_params(raw_data_list: Sequence) -> List[Dict[str, int]]:
+    """raw_data_outbox INSERT 바인딩"""
+    return [{"raw_data_id": raw_data.id} for raw_data in raw_data_list]
+
+
+def latest_query(id: Optional[int]) -> Tuple[str, Dict]:
+    """id 1건 또는 가장 최근 1건 조회 쿼리"""
+    if id is not None:
+        query = f"""
+            SELECT {RAW_DATA_COLUMNS}
+            FROM raw_data
+            WHERE id = :id
+        """
+        return query, {"id": id}
+
+    query = f"""
+        SELECT {RAW_DATA_COLUMNS}
+        FROM raw_data
+        ORDER BY published_at DESC
+        FETCH FIRST 1 ROW ONLY
+    """
+    return query, {}
+
+
+def id_chunks(ids: Sequence[Any]) -> Iterator[List[Any]]:
+    """중복을 제거한 값 목록을 IN_LIST_LIMIT개씩 나눔"""
+    unique_ids = list(dict.fromkeys(ids))
+    for start in range(0, len(unique_ids), IN_LIST_LIMIT):
+        yield unique_ids[start:start + IN_LIST_LIMIT]
+
+
+def _in_list(prefix: str, values: List[Any]) -> Tuple[str, Dict]:
+    """IN 목록 placeholder와 바인딩 생성"""
+    params = {f"{prefix}{index}": value for index, value in enumerate(values)}
+    return ", ".join(f":{name}" for name in params), params
+
+
+def ids_query(ids: List[int]) -> Tuple[str, Dict]:
+    """id 목록 조회 쿼리 (ids는 IN_LIST_LIMIT개 이하)"""
+    placeholders, params = _in_list("id", ids)
+    query = f"""
+        SELECT {RAW_DATA_COLUMNS}
+        FROM raw_data
+        WHERE id IN ({placeholders})
+    """
+    return query, params
+
+
+def hashes_query(content_hashes: List[str]) -> Tuple[str, Dict]:
+    """content_hash 목록의 id 조회 쿼리 (content_hashes는 IN_LIST_LIMIT개 이하, uq_raw_data_content_hash 사용)"""
+    placeholders, params = _in_list("hash", content_hashes)
+    query = f"""
+        SELECT id, content_hash
+        FROM raw_data
+        WHERE content_hash IN ({placeholders})
+    """
+    return query, params
+
+
+def range_query(
+    since: Optional[datetime],
+    until: Optional[datetime],
+    channel: Optional[Channel],
+    after_id: Optional[int],
+    batch_size: int,
+) -> Tuple[str, Dict]:
+    """
+    published_at 구간 조회 쿼리 생성 (idx_raw_data_published_at 사용, keyset 페이지)
+
+    after_id가 있으면 (since, after_id) 바로 다음 행부터 조회합니다.
+    """
+    conditions = []
+    params = {"batch_size": batch_size}
+
+    if since is not None:
+        params["since"] = to_utc_naive(since)
+        if after_id is None:
+            conditions.append("published_at >= FROM_TZ(:since, 'UTC')")
+        else:
+            conditions.append(
+                "(published_at > FROM_TZ(:since, 'UTC')"
+                " OR (published_at = FROM_TZ(:since, 'UTC') AND id > :after_id))"
+            )
+            params["after_id"] = after_id
+    if until is not None:
+        conditions.append("published_at < FROM_TZ(:until, 'UTC')")
+        params["until"] = to_utc_naive(until)
+    if channel is not None:
+        conditions.append("channel = :channel")
+        params["channel"] = channel.value
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {RAW_DATA_COLUMNS}
+        FROM raw_data
+        {where}
+        ORDER BY published_at, id
+        FETCH FIRST :batch_size ROWS ONLY
+    """
+    return query, params
+
+
+def next_page(page: List[RawRecord], batch_size: int) -> Optional[Tuple[datetime, int]]:
+    """다음 페이지의 (since, after_id). 마지막 페이지면 None"""
+    if len(page) < batch_size:
+        return None
+    return page[-1].published_at, page[-1].id
+
+
+class ClaimedOutbox(NamedTuple):
+    """잠근 outbox 행"""
+
+    # 삭제할 outbox id
+    outbox_ids: List[int]
+    # 발행할 원본 데이터 (outbox 기록 순서)
+    records: List[RawRecord]
+
+
+def claimed_outbox(rows) -> ClaimedOutbox:
+    """OUTBOX_CLAIM_SQL 결과를 outbox 기록 순서(≈ 저장 순서)로 정렬해 변환"""
+    rows = sorted(rows, key=lambda row: row[0])
+    return ClaimedOutbox([row[0] for row in rows], [row_to_record(row[1:]) for row in rows])
+
+
+def outbox_delete_params(outbox_ids: List[int]) -> List[Dict[str, int]]:
+    """raw_data_outbox DELETE 바인딩"""
+    return [{"id": outbox_id} for outbox_id in outbox_ids]
@@ -3,28 +3,63 @@ StateStore: Checkpoint 저장/조회
 
 Redis를 사용하여 각 Collector의 마지막 수집 위치(Checkpoint)를 관리합니다.
 """
-from typing import Optional
+import os
+import socket
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
 from datetime import datetime, timezone
 import redis
+from redis.client import Pipeline
 from src.logger import get_logger
 from src.models.channel import Channel
-from config.redis import REDIS_CONFIG
+from config.redis import CHECKPOINT_CONFIG, REDIS_CONFIG
+
+
+class _CachedCheckpoint(NamedTuple):
+    """프로세스 내 Checkpoint 캐시 항목"""
+
+    checkpoint: Optional[datetime]
+    # 이 인스턴스가 기록한 값인지 여부
+    owned: bool
+    # Redis와 마지막으로 맞춰본 시각 (time.monotonic)
+    checked_at: float
 
 
 class StateStore:
     """Checkpoint 관리 클래스"""
 
-    def __init__(self):
-        """StateStore 초기화"""
+    def __init__(self, redis_client: Optional[redis.Redis] = None, write_behind: Optional[bool] = None):
+        """
+        StateStore 초기화
+
+        Args:
+            redis_client: 사용할 Redis 클라이언트 (없으면 REDIS_CONFIG로 생성)
+            write_behind: 쓰기 지연 모드 여부 (없으면 CHECKPOINT_CONFIG 사용)
+        """
         self.logger = get_logger(__name__)
 
+        # 쓰기 지연 모드: flush() 전까지 Checkpoint를 메모리에 보관
+        self.write_behind = CHECKPOINT_CONFIG["write_behind"] if write_behind is None else write_behind
+        self._pending_checkpoints: Dict[Channel, datetime] = {}
+
+        # Checkpoint 캐시: 직접 기록한 값은 cache_ttl_seconds, 다른 인스턴스가 기록한 값은
+        # foreign_cache_ttl_seconds 동안 Redis 조회 없이 사용
+        # 기록자 키(checkpoint-writer:<channel>)로 다른 인스턴스의 기록을 감지
+        self.instance_id = CHECKPOINT_CONFIG["instance_id"] or f"{socket.gethostname()}:{os.getpid()}"
+        self.cache_ttl_seconds = CHECKPOINT_CONFIG["cache_ttl_seconds"]
+        self.foreign_cache_ttl_seconds = CHECKPOINT_CONFIG["foreign_cache_ttl_seconds"]
+        self._cache: Dict[Channel, _CachedCheckpoint] = {}
+
+        self._lock = threading.Lock()
+
         # Redis 설정 로드
         host = REDIS_CONFIG["host"]
         port = REDIS_CONFIG["port"]
         db = REDIS_CONFIG["db"]
 
         # Redis 클라이언트 생성
-        self.redis_client = redis.Redis(
+        self.redis_client = redis_client or redis.Redis(
             host=host,
             port=port,
             db=db,
@@ -49,35 +84,228 @@ class StateStore:
         Returns:
             Checkpoint datetime (없으면 None)
         """
-        key = f"checkpoint:{channel.value}"
-        checkpoint_str = self.redis_client.get(key)
-
-        if checkpoint_str:
-            try:
-                checkpoint = datetime.fromisoformat(checkpoint_str.replace('Z', '+00:00'))
-                self.logger.debug("Checkpoint 조회", channel=channel, checkpoint=checkpoint)
-                return checkpoint
-            except (ValueError, AttributeError) as e:
-                self.logger.warning("Checkpoint 파싱 실패", channel=channel, checkpoint=checkpoint_str, error=str(e))
-                return None
-        else:
-            self.logger.debug("Checkpoint 없음 (첫 수집)", channel=channel)
-            return None
+        return self.get_checkpoints([channel])[channel]
 
-    def save_checkpoint(self, channel: Channel, checkpoint: datetime):
+    def get_checkpoints(self, channels: Iterable[Channel]) -> Dict[Channel, Optional[datetime]]:
+        """
+        여러 채널의 Checkpoint 일괄 조회
+
+        기록 대기 중이거나 캐시가 유효한 채널은 Redis를 조회하지 않고,
+        나머지 채널은 Checkpoint와 기록자 키를 단일 MGET으로 조회합니다.
+
+        Args:
+            channels: 조회할 채널 목록
+
+        Returns:
+            채널별 Checkpoint (없으면 None)
+        """
+        checkpoints = {}
+        stale_channels = []
+        now = time.monotonic()
+
+        with self._lock:
+            for channel in channels:
+                # 아직 기록하지 않은 Checkpoint가 가장 최신
+                pending = self._pending_checkpoints.get(channel)
+                cached = self._cache.get(channel)
+                if pending is not None:
+                    checkpoints[channel] = pending
+                elif cached is not None and now - cached.checked_at < self._cache_ttl(cached):
+                    checkpoints[channel] = cached.checkpoint
+                else:
+                    stale_channels.append(channel)
+
+        if not stale_channels:
+            return checkpoints
+
+        keys = [self._checkpoint_key(channel) for channel in stale_channels]
+        keys += [self._writer_key(channel) for channel in stale_channels]
+        values = self.redis_client.mget(keys)
+        writers = values[len(stale_channels):]
+
+        for channel, checkpoint_str, writer in zip(stale_channels, values, writers):
+            checkpoint = self._parse_checkpoint(channel, checkpoint_str)
+
+            with self._lock:
+                cached = self._cache.get(channel)
+                if cached is not None and cached.owned and writer != self.instance_id:
+                    self.logger.warning(
+                        "다른 인스턴스가 Checkpoint를 기록함 - 캐시 무효화",
+                        channel=channel,
+                        writer=writer,
+                        instance_id=self.instance_id
+                    )
+                self._cache[channel] = _CachedCheckpoint(checkpoint, writer == self.instance_id, now)
+
+            checkpoints[channel] = checkpoint
+
+        return checkpoints
+
+    def save_checkpoint(
+        self, channel: Channel, checkpoint: datetime, pipeline: Optional[Pipeline] = None
+    ) -> Optional[Callable[[List], None]]:
         """
         채널의 Checkpoint 저장
 
+        쓰기 지연 모드에서는 메모리에만 기록하고 flush() 때 Redis에 저장합니다.
+        이 경우 저장과 발행이 끝난 뒤에 호출해야 합니다.
+
         Args:
             channel: 채널
             checkpoint: 저장할 Checkpoint datetime (timezone-aware여야 함)
+            pipeline: 주어지면 즉시 실행하지 않고 해당 pipeline에 SET을 추가
+                (쓰기 지연 모드에서는 무시)
+
+        Returns:
+            pipeline이 주어진 경우 pipeline 실행 결과로 호출할 확인 콜백 (캐시 반영), 그 외에는 None
         """
         # timezone-naive인 경우 UTC로 설정 (방어 코드)
         if checkpoint.tzinfo is None:
             checkpoint = checkpoint.replace(tzinfo=timezone.utc)
             self.logger.warning("Checkpoint에 timezone이 없어 UTC로 설정", channel=channel)
 
-        key = f"checkpoint:{channel.value}"
-        checkpoint_str = checkpoint.isoformat()
-        self.redis_client.set(key, checkpoint_str)
+        if self.write_behind:
+            with self._lock:
+                pending = self._pending_checkpoints.get(channel)
+                if pending is None or checkpoint > pending:
+                    self._pending_checkpoints[channel] = checkpoint
+            self.logger.debug("Checkpoint 기록 대기", channel=channel, checkpoint=checkpoint)
+            return None
+
+        pipe = pipeline or self.redis_client.pipeline(transaction=False)
+        pipe.set(self._checkpoint_key(channel), checkpoint.isoformat())
+        # 이전 기록자를 함께 받아 다른 인스턴스의 기록을 감지
+        pipe.set(self._writer_key(channel), self.instance_id, get=True)
+        writer_index = len(pipe) - 1
+
+        def confirm(results: List):
+            self.confirm_checkpoint(channel, checkpoint, previous_writer=results[writer_index])
+
         self.logger.debug("Checkpoint 저장", channel=channel, checkpoint=checkpoint)
+
+        if pipeline is not None:
+            return confirm
+        confirm(pipe.execute())
+        return None
+
+    def confirm_checkpoint(self, channel: Channel, checkpoint: datetime, previous_writer: Optional[str] = None):
+        """
+        저장한 Checkpoint를 캐시에 반영 (Redis 기록 성공 후 호출)
+
+        직전 기록자가 다른 인스턴스이면 같은 채널을 함께 기록하는 인스턴스가 있으므로
+        캐시를 다른 인스턴스 기록과 같은 짧은 유효 시간으로 낮춥니다.
+
+        Args:
+            channel: 채널
+            checkpoint: 저장된 Checkpoint
+            previous_writer: 기록 직전의 기록자 (없으면 None)
+        """
+        owned = previous_writer is None or previous_writer == self.instance_id
+        with self._lock:
+            cached = self._cache.get(channel)
+            # 직접 기록한 뒤에 다른 인스턴스가 기록한 경우만 경고 (재시작 직후의 이전 프로세스 기록은 제외)
+            if not owned and cached is not None and cached.owned:
+                self.logger.warning(
+                    "다른 인스턴스가 Checkpoint를 기록함 - 캐시 무효화",
+                    channel=channel,
+                    writer=previous_writer,
+                    instance_id=self.instance_id
+                )
+            self._cache[channel] = _CachedCheckpoint(checkpoint, owned, time.monotonic())
+
+    def flush(self):
+        """
+        기록 대기 중인 Checkpoint를 단일 pipeline으로 Redis에 저장
+
+        실패하면 대기 목록에 되돌려 다음 flush()에서 다시 시도합니다.
+        """
+        with self._lock:
+            pending = self._pending_checkpoints
+            self._pending_checkpoints = {}
+            # 기록 중에도 조회가 Redis의 이전 값으로 돌아가지 않도록 캐시에 먼저 반영
+            now = time.monotonic()
+            # (소유 여부는 기록 결과로 확정)
+            for channel, checkpoint in pending.items():
+                cached = self._cache.get(channel)
+                self._cache[channel] = _CachedCheckpoint(checkpoint, cached is not None and cached.owned, now)
+
+        if not pending:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for channel, checkpoint in pending.items():
+                pipe.set(self._checkpoint_key(channel), checkpoint.isoformat())
+                pipe.set(self._writer_key(channel), self.instance_id, get=True)
+            results = pipe.execute()
+        except redis.RedisError as e:
+            # 그 사이 더 최신 Checkpoint가 들어왔으면 그 값을 유지
+            with self._lock:
+                for channel, checkpoint in pending.items():
+                    current = self._pending_checkpoints.get(channel)
+                    if current is None or checkpoint > current:
+                        self._pending_checkpoints[channel] = checkpoint
+            self.logger.error("Checkpoint 일괄 저장 실패", channels=len(pending), error=str(e))
+            return
+
+        for (channel, checkpoint), previous_writer in zip(pending.items(), results[1::2]):
+            self.confirm_checkpoint(channel, checkpoint, previous_writer=previous_writer)
+
+        self.logger.debug("Checkpoint 일괄 저장", channels=len(pending))
+
+    def _cache_ttl(self, cached: _CachedCheckpoint) -> float:
+        """캐시 항목의 유효 시간 (초)"""
+        return self.cache_ttl_seconds if cached.owned else self.foreign_cache_ttl_seconds
+
+    def _parse_checkpoint(self, channel: Channel, checkpoint_str: Optional[str]) -> Optional[datetime]:
+        """Redis에 저장된 Checkpoint 문자열을 datetime으로 변환"""
+        if not checkpoint_str:
+            self.logger.debug("Checkpoint 없음 (첫 수집)", channel=channel)
+            return None
+
+        try:
+            checkpoint = datetime.fromisoformat(checkpoint_str.replace('Z', '+00:00'))
+            self.logger.debug("Checkpoint 조회", channel=channel, checkpoint=checkpoint)
+            return checkpoint
+        except (ValueError, AttributeError) as e:
+            self.logger.warning("Checkpoint 파싱 실패", channel=channel, checkpoint=checkpoint_str, error=str(e))
+            return None
+
+    def _checkpoint_key(self, channel: Channel) -> str:
+        """채널의 Checkpoint 키"""
+        return f"checkpoint:{channel.value}"
+
+    def _writer_key(self, channel: Channel) -> str:
+        """채널의 Checkpoint를 마지막으로 기록한 인스턴스 키"""
+        return f"checkpoint-writer:{channel.value}"
+
+    def get_validators(self, channel: Channel) -> Dict[str, str]:
+        """
+        채널의 조건부 요청 검증자 조회 (ETag / Last-Modified)
+
+        Args:
+            channel: 채널
+
+        Returns:
+            검증자 딕셔너리 (없으면 빈 딕셔너리)
+        """
+        key = f"validators:{channel.value}"
+        validators = self.redis_client.hgetall(key)
+        self.logger.debug("검증자 조회", channel=channel, validators=validators)
+        return validators
+
+    def save_validators(self, channel: Channel, validators: Dict[str, str]):
+        """
+        채널의 조건부 요청 검증자 저장
+
+        Args:
+            channel: 채널
+            validators: 저장할 검증자 (etag, last_modified)
+        """
+        key = f"validators:{channel.value}"
+        pipe = self.redis_client.pipeline()
+        pipe.delete(key)
+        if validators:
+            pipe.hset(key, mapping=validators)
+        pipe.execute()
+        self.logger.debug("검증자 저장", channel=channel, validators=validators)
@@ -0,0 +1,77 @@
+"""
+Prometheus 메트릭
+
+수집 파이프라인의 단계별 처리량과 소요 시간을 /metrics 엔드포인트로 노출합니다.
+"""
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+from src.logger import get_logger
+from config.metrics import METRICS_CONFIG
+
+# 수집 단계 소요 시간 구간 (초)
+_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 항목 수 (채널별)
+ITEMS_COLLECTED = Counter(
+    "data_collection_items_collected_total", "수집된 항목 수", ["channel"]
+)
+ITEMS_FILTERED = Counter(
+    "data_collection_items_filtered_total", "제외된 항목 수", ["channel", "reason"]
+)
+ITEMS_SAVED = Counter(
+    "data_collection_items_saved_total", "Database에 저장된 항목 수", ["channel"]
+)
+ITEMS_PUBLISHED = Counter(
+    "data_collection_items_published_total", "Message Queue에 발행된 항목 수", ["channel"]
+)
+FETCH_RETRIES = Counter(
+    "data_collection_fetch_retries_total", "피드 요청 재시도 횟수", ["channel", "reason"]
+)
+FETCH_SKIPPED = Counter(
+    "data_collection_fetch_skipped_total", "서킷 브레이커가 열려 생략된 피드 요청 수", ["channel"]
+)
+
+# 단계별 소요 시간
+FETCH_SECONDS = Histogram(
+    "data_collection_fetch_seconds", "피드 HTTP 요청 시간", ["channel"], buckets=_LATENCY_BUCKETS
+)
+PARSE_SECONDS = Histogram(
+    "data_collection_parse_seconds", "피드 파싱 시간", ["channel"], buckets=_LATENCY_BUCKETS
+)
+CLEAN_SECONDS = Histogram(
+    "data_collection_clean_seconds", "수집 1회당 HTML 정제 시간", ["channel"], buckets=_LATENCY_BUCKETS
+)
+DB_INSERT_SECONDS = Histogram(
+    "data_collection_db_insert_seconds", "Database INSERT 시간", buckets=_LATENCY_BUCKETS
+)
+DB_ACQUIRE_SECONDS = Histogram(
+    "data_collection_db_acquire_seconds", "DB Connection Pool 연결 획득 대기 시간", buckets=_LATENCY_BUCKETS
+)
+XADD_SECONDS = Histogram(
+    "data_collection_xadd_seconds", "Redis Streams XADD 시간", buckets=_LATENCY_BUCKETS
+)
+
+# 상태
+CHECKPOINT_LAG_SECONDS = Gauge(
+    "data_collection_checkpoint_lag_seconds", "현재 시간 - Checkpoint", ["channel"]
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "data_collection_circuit_breaker_state", "피드 요청 서킷 브레이커 상태 (0: closed, 1: open, 2: half-open)", ["channel"]
+)
+DB_POOL_BUSY = Gauge(
+    "data_collection_db_pool_busy", "사용 중인 DB 연결 수"
+)
+DB_POOL_OPEN = Gauge(
+    "data_collection_db_pool_open", "열려 있는 DB 연결 수"
+)
+
+
+def start_metrics_server():
+    """설정에 따라 /metrics HTTP 엔드포인트 시작"""
+    logger = get_logger(__name__)
+
+    if not METRICS_CONFIG["enabled"]:
+        logger.info("메트릭 엔드포인트 비활성화")
+        return
+
+    start_http_server(METRICS_CONFIG["port"], addr=METRICS_CONFIG["host"])
+    logger.info("메트릭 엔드포인트 시작", host=METRICS_CONFIG["host"], port=METRICS_CONFIG["port"])
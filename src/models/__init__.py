@@ -2,5 +2,6 @@
 데이터 모델 패키지
 """
 from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
 
-__all__ = ['RawData']
+__all__ = ['RawData', 'RawRecord']
@@ -7,10 +7,16 @@ from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 from src.models.channel import Channel
+from src.models.raw_record import RawRecord, compute_content_hash
 
 
 class RawData(BaseModel):
-    """수집된 원본 데이터 모델"""
+    """
+    수집된 원본 데이터 모델
+
+    외부 입력(피드 등)을 받는 경계에서 검증에 사용합니다.
+    검증 이후 hot path에서는 to_record()로 변환한 RawRecord를 사용할 수 있습니다.
+    """
 
     model_config = ConfigDict(
         frozen=False,  # 필요시 불변으로 변경 가능
@@ -26,3 +32,40 @@ class RawData(BaseModel):
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (직렬화용)"""
         return self.model_dump(mode='json')
+
+    def to_record(self) -> RawRecord:
+        """검증 없이 RawRecord로 변환"""
+        return RawRecord(
+            content=self.content,
+            link=self.link,
+            published_at=self.published_at,
+            channel=self.channel,
+            id=self.id,
+        )
+
+    @classmethod
+    def from_record(cls, record: RawRecord) -> "RawData":
+        """
+        RawRecord에서 검증 없이 생성 (model_construct, 이미 검증된 값에만 사용)
+
+        Args:
+            record: 변환할 RawRecord
+
+        Returns:
+            RawData
+        """
+        return cls.model_construct(
+            id=record.id,
+            content=record.content,
+            link=record.link,
+            published_at=record.published_at,
+            channel=record.channel,
+        )
+
+    def content_hash(self) -> str:
+        """
+        중복 판별용 해시 (채널 + 링크 + 공백 정규화된 내용의 SHA-256)
+
+        피드 재정렬이나 Checkpoint 유실로 같은 항목이 다시 수집되어도 같은 값을 가집니다.
+        """
+        return compute_content_hash(self.channel, self.link, self.content)
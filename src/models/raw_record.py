@@ -0,0 +1,56 @@
+"""
+RawRecord: 파이프라인 내부용 경량 원본 데이터 레코드
+
+Collector → Database → Message Queue 사이의 hot path에서 사용하는 __slots__ dataclass입니다.
+검증은 하지 않으므로 이미 검증된 값(RawData, DB 조회 결과)으로만 만들어야 합니다.
+외부 입력의 검증은 RawData(Pydantic)가 담당합니다.
+"""
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from src.models.channel import Channel
+
+
+def compute_content_hash(channel: Channel, link: str, content: str) -> str:
+    """
+    중복 판별용 해시 (채널 + 링크 + 공백 정규화된 내용의 SHA-256)
+
+    피드 재정렬이나 Checkpoint 유실로 같은 항목이 다시 수집되어도 같은 값을 가집니다.
+    """
+    normalized_content = " ".join(content.split())
+    key = f"{channel.value}\n{link.strip()}\n{normalized_content}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def format_datetime(value: datetime) -> str:
+    """RawData.to_dict()와 같은 형식의 ISO 8601 문자열 (UTC는 'Z' 접미사)"""
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        return text[:-6] + "Z"
+    return text
+
+
+@dataclass(slots=True)
+class RawRecord:
+    """검증이 끝난 원본 데이터 레코드"""
+
+    content: str
+    link: str
+    published_at: datetime
+    channel: Channel
+    id: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (직렬화용, RawData.to_dict()와 같은 결과)"""
+        return {
+            "id": self.id,
+            "content": self.content,
+            "link": self.link,
+            "published_at": format_datetime(self.published_at),
+            "channel": self.channel.value,
+        }
+
+    def content_hash(self) -> str:
+        """중복 판별용 해시 (RawData.content_hash()와 같은 값)"""
+        return compute_content_hash(self.channel, self.link, self.content)
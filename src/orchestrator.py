@@ -3,9 +3,24 @@ Orchestrator: Collector 조율자
 
 여러 Collector를 등록하고 관리하며, 전체 수집 흐름을 조율합니다.
 """
-from typing import List
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+import httpx
+from apscheduler.executors.pool import ThreadPoolExecutor as SchedulerThreadPoolExecutor
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
+from src.collectors.feed_parser import shutdown_parse_executor
+from src.infrastructure.outbox_relay import OutboxRelay
 from src.logger import get_logger
+from src.metrics import CHECKPOINT_LAG_SECONDS, ITEMS_COLLECTED, ITEMS_FILTERED, ITEMS_PUBLISHED, ITEMS_SAVED
+from src.models.raw_record import RawRecord
+from src.poll_interval import PollInterval
+from config.database import OUTBOX_CONFIG
+from config.http import HTTP_CONFIG
+from config.redis import CHECKPOINT_CONFIG, STREAM_CONFIG
 from config.scheduler import SCHEDULER_CONFIG
 
 
@@ -16,9 +31,11 @@ class Orchestrator:
     책임:
     - Collector 관리
     - 전체 수집 흐름 제어 (checkpoint 조회 → 수집 → 저장 → 발행 → checkpoint 저장)
+    - Collector 간 동시 실행 및 채널별 장애 격리
+    - 채널별 독립 스케줄 및 적응형 수집 주기
     """
 
-    def __init__(self, collectors: List = None, state_store=None, database=None, message_queue=None):
+    def __init__(self, collectors: List = None, state_store=None, database=None, message_queue=None, dedup_index=None):
         """
         Orchestrator 초기화
 
@@ -27,108 +44,631 @@ class Orchestrator:
             state_store: Checkpoint 저장/조회 인프라
             database: 원본 데이터 저장 인프라
             message_queue: 메시지 발행 인프라
+            dedup_index: 중복 제거 인덱스 (없으면 Checkpoint 비교만 사용하고, 발행 실패 항목의 재발행도 하지 않음)
         """
         self.logger = get_logger(__name__)
         self.collectors: List = collectors if collectors else []
         self.state_store = state_store
         self.database = database
         self.message_queue = message_queue
-        self.scheduler = BlockingScheduler()
+        self.dedup_index = dedup_index
+        self.mode = SCHEDULER_CONFIG['mode']
 
-        # 등록된 Collector 로깅
+        # AsyncDatabase(코루틴 메서드)는 비동기 모드에서만 사용 가능
+        self._async_database = inspect.iscoroutinefunction(getattr(database, "save_raw_data_batch", None))
+        if self._async_database and self.mode != "async":
+            raise ValueError("AsyncDatabase는 비동기 모드(SCHEDULER_CONFIG['mode'] = 'async')에서만 사용할 수 있습니다")
+
+        # 쓰기 지연 모드는 주기적 기록이 있어야 Redis에 반영되지 않은 구간이 제한됨
+        if state_store is not None and state_store.write_behind and CHECKPOINT_CONFIG['flush_interval_seconds'] < 1:
+            raise ValueError("쓰기 지연 모드에서는 CHECKPOINT_CONFIG['flush_interval_seconds']가 1 이상이어야 합니다")
+
+        # outbox 모드: 저장 트랜잭션에 기록된 outbox를 OutboxRelay가 발행 (수집 흐름에서는 발행 안 함)
+        self.outbox_relay: Optional[OutboxRelay] = None
+        if getattr(database, "outbox_enabled", False):
+            self.outbox_relay = OutboxRelay(database, message_queue)
+
+        if self.mode == "async":
+            self.scheduler = AsyncIOScheduler()
+        else:
+            self.scheduler = BlockingScheduler(
+                executors={"default": SchedulerThreadPoolExecutor(SCHEDULER_CONFIG['max_workers'])}
+            )
+
+        # 비동기 모드에서 모든 Collector가 공유하는 HTTP 클라이언트
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 채널별 적응형 수집 주기
+        self.poll_intervals: Dict = {}
+
+        # 등록된 Collector 로깅 및 조건부 요청 검증자 복원
         for collector in self.collectors:
             channel = collector.get_channel()
+            if self.state_store is not None:
+                collector.validators = self.state_store.get_validators(channel)
+            self.poll_intervals[channel] = PollInterval(
+                min_seconds=collector.MIN_POLL_INTERVAL_SECONDS or SCHEDULER_CONFIG['min_interval_seconds'],
+                max_seconds=collector.MAX_POLL_INTERVAL_SECONDS or SCHEDULER_CONFIG['max_interval_seconds'],
+                backoff_factor=SCHEDULER_CONFIG['backoff_factor'],
+            )
             self.logger.info("Collector 등록", channel=channel)
 
         self.logger.info("Orchestrator 초기화 완료", collectors_count=len(self.collectors))
 
     def run(self):
         """
-        등록된 모든 Collector의 수집 작업 실행
+        등록된 모든 Collector의 수집 작업을 동시에 실행
+
+        Collector별 파이프라인을 스레드 풀에서 병렬 실행하므로
+        전체 수집 시간은 가장 느린 채널에 의해 결정됩니다.
+        한 채널의 실패는 다른 채널에 영향을 주지 않습니다.
+        """
+        self.logger.info("수집 작업 시작", collectors_count=len(self.collectors))
+
+        if not self.collectors:
+            self.logger.info("수집 작업 완료")
+            return
+
+        max_workers = min(SCHEDULER_CONFIG['max_workers'], len(self.collectors))
+
+        self._prefetch_checkpoints()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collector") as executor:
+            futures = {
+                executor.submit(self._run_collector, collector): collector.get_channel()
+                for collector in self.collectors
+            }
+
+            for future in as_completed(futures):
+                channel = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error("Collector 실행 실패", channel=channel, error=str(e))
+
+        # 쓰기 지연 모드: 채널별 Checkpoint를 한 번에 기록
+        self.state_store.flush()
+
+        if self.outbox_relay is not None:
+            self._relay_outbox()
+
+        self.logger.info("수집 작업 완료")
+
+    def _prefetch_checkpoints(self):
+        """
+        모든 채널의 Checkpoint를 한 번에 조회 (이후 채널별 조회는 캐시 사용)
+
+        실패하면 채널별 조회로 대신합니다.
+        """
+        try:
+            self.state_store.get_checkpoints([collector.get_channel() for collector in self.collectors])
+        except Exception as e:
+            self.logger.warning("Checkpoint 일괄 조회 실패", error=str(e))
+
+    def _run_collector(self, collector) -> int:
+        """
+        단일 Collector의 수집 파이프라인 실행
 
-        각 Collector에 대해:
         1. Checkpoint 조회
         2. collect_raw_data() 호출
         3. 데이터 저장 (Database)
         4. 메시지 발행 (Message Queue)
         5. Checkpoint 저장
-        """
-        self.logger.info("수집 작업 시작", collectors_count=len(self.collectors))
+        6. 조건부 요청 검증자 저장
 
-        for collector in self.collectors:
-            channel = collector.get_channel()
+        Args:
+            collector: 실행할 Collector
 
-            try:
-                self.logger.info("Collector 실행 시작", channel=channel)
+        Returns:
+            수집된 데이터 건수
+        """
+        channel = collector.get_channel()
+        self.logger.info("Collector 실행 시작", channel=channel)
 
-                # 1. Checkpoint 조회
-                checkpoint = self.state_store.get_checkpoint(channel)
+        # 1. Checkpoint 조회
+        checkpoint = self.state_store.get_checkpoint(channel)
 
-                # 2. 데이터 수집
-                collected_data = collector.collect_raw_data(checkpoint)
+        # 2. 데이터 수집
+        collected_data = collector.collect_raw_data(checkpoint)
 
-                # 3. 데이터가 있으면 저장 및 발행
-                if collected_data:
-                    self.logger.info("수집된 데이터 있음", channel=channel, count=len(collected_data))
+        # 3. 데이터가 있으면 저장 및 발행
+        self._store_and_publish(channel, checkpoint, collected_data)
 
-                    # 3-1. 건별로 Database 저장, Message Queue 발행, Checkpoint 갱신
-                    for raw_data in collected_data:
-                        # Checkpoint 갱신 (published_at이 현재 checkpoint보다 나중이면 저장)
-                        if checkpoint is None or raw_data.published_at > checkpoint:
-                            checkpoint = raw_data.published_at
-                            self.state_store.save_checkpoint(channel, checkpoint)
-                            self.logger.debug("Checkpoint 저장 완료", channel=channel, checkpoint=checkpoint)
+        # 4. 저장 및 발행이 끝난 뒤 검증자 확정
+        self._commit_validators(collector)
 
-                        # Database 저장 (ID 할당됨)
-                        saved_data = self.database.save_raw_data(raw_data)
+        self.logger.info("Collector 실행 완료", channel=channel)
+        return len(collected_data)
 
-                        # Message Queue 발행
-                        self.message_queue.publish(saved_data)
+    def _store_and_publish(self, channel, checkpoint: Optional[datetime], collected_data: List) -> None:
+        """
+        수집된 데이터 저장, 발행 및 Checkpoint 갱신
 
-                    self.logger.info("Database 저장 및 Message Queue 발행 완료", channel=channel, count=len(collected_data))
-                else:
-                    self.logger.info("수집된 데이터 없음", channel=channel)
+        Args:
+            channel: 수집 채널
+            checkpoint: 수집 시점의 Checkpoint
+            collected_data: 수집된 원본 데이터 리스트
+        """
+        batch = self._prepare_batch(channel, checkpoint, collected_data)
+        if batch is None:
+            return
+        new_checkpoint, candidates, unfinished = batch
 
-                self.logger.info("Collector 실행 완료", channel=channel)
+        # 3-2. Database 일괄 저장 (ID 할당됨, DB unique 인덱스 중복은 제외됨)
+        saved_data = self.database.save_raw_data_batch(candidates)
 
-            except Exception as e:
-                self.logger.error("Collector 실행 실패", channel=channel, error=str(e))
+        # 중복으로 제외된 항목 중 이전 시도에서 발행이 끝나지 않은 항목은 기존 id로 다시 발행
+        recovered = []
+        duplicates = self._unpublished_duplicates(candidates, saved_data, unfinished)
+        if duplicates:
+            existing_ids = self.database.get_raw_data_ids_by_hash([raw_data.content_hash() for raw_data in duplicates])
+            recovered = self._assign_existing_ids(channel, duplicates, saved_data, existing_ids)
 
-        self.logger.info("수집 작업 완료")
+        self._publish_saved(channel, checkpoint, new_checkpoint, collected_data, candidates, saved_data, recovered)
 
-    def start(self):
+    async def _store_and_publish_async(self, channel, checkpoint: Optional[datetime], collected_data: List) -> None:
         """
-        스케줄러 시작 및 주기적 수집 실행
+        비동기 Database로 수집된 데이터 저장, 발행 및 Checkpoint 갱신
 
-        5분마다 수집 작업을 실행합니다.
+        Database 저장은 이벤트 루프에서 직접 수행하고,
+        동기 Redis 호출(중복 제거, 발행)만 스레드로 위임합니다.
+
+        Args:
+            channel: 수집 채널
+            checkpoint: 수집 시점의 Checkpoint
+            collected_data: 수집된 원본 데이터 리스트
         """
-        # 즉시 한 번 실행
-        self.logger.info("초기 수집 작업 실행")
-        self.run()
+        batch = await asyncio.to_thread(self._prepare_batch, channel, checkpoint, collected_data)
+        if batch is None:
+            return
+        new_checkpoint, candidates, unfinished = batch
+
+        # 3-2. Database 일괄 저장 (ID 할당됨, DB unique 인덱스 중복은 제외됨)
+        saved_data = await self.database.save_raw_data_batch(candidates)
 
-        # 스케줄 등록 (설정 파일 사용)
-        self.scheduler.add_job(
-            func=self.run,
-            trigger=SCHEDULER_CONFIG['trigger'],
-            minutes=SCHEDULER_CONFIG['minutes'],
-            id=SCHEDULER_CONFIG['id'],
-            name=SCHEDULER_CONFIG['name']
+        # 중복으로 제외된 항목 중 이전 시도에서 발행이 끝나지 않은 항목은 기존 id로 다시 발행
+        recovered = []
+        duplicates = self._unpublished_duplicates(candidates, saved_data, unfinished)
+        if duplicates:
+            existing_ids = await self.database.get_raw_data_ids_by_hash(
+                [raw_data.content_hash() for raw_data in duplicates]
+            )
+            recovered = self._assign_existing_ids(channel, duplicates, saved_data, existing_ids)
+
+        await asyncio.to_thread(
+            self._publish_saved,
+            channel,
+            checkpoint,
+            new_checkpoint,
+            collected_data,
+            candidates,
+            saved_data,
+            recovered,
         )
 
+    def _prepare_batch(
+        self, channel, checkpoint: Optional[datetime], collected_data: List
+    ) -> Optional[Tuple[Optional[datetime], List, Set[str]]]:
+        """
+        저장 전 준비: 새 Checkpoint 계산, 이미 처리된 항목 제외 및 발행 대기 표시
+
+        Args:
+            channel: 수집 채널
+            checkpoint: 수집 시점의 Checkpoint
+            collected_data: 수집된 원본 데이터 리스트
+
+        Collector가 검증한 RawData는 여기서 RawRecord로 변환하여,
+        이후 중복 제거 / 저장 / 발행 hot path는 Pydantic 모델 없이 처리합니다.
+
+        Returns:
+            (새 Checkpoint 또는 None, 저장할 RawRecord 리스트, 이전 시도에서 발행이 끝나지 않은 content_hash 집합).
+            수집된 데이터가 없으면 None
+        """
+        if not collected_data:
+            self.logger.info("수집된 데이터 없음", channel=channel)
+            self._observe_checkpoint_lag(channel, checkpoint)
+            return None
+
+        self.logger.info("수집된 데이터 있음", channel=channel, count=len(collected_data))
+        ITEMS_COLLECTED.labels(channel=channel.value).inc(len(collected_data))
+
+        # 중복 여부와 관계없이 수집된 범위까지 Checkpoint 전진
+        latest = max(raw_data.published_at for raw_data in collected_data)
+        new_checkpoint = latest if checkpoint is None or latest > checkpoint else None
+
+        # 검증이 끝난 항목을 경량 레코드로 변환
+        records = [raw_data if isinstance(raw_data, RawRecord) else raw_data.to_record() for raw_data in collected_data]
+
+        # 3-1. 이미 처리된 항목 제외 (중복 제거 인덱스)
+        candidates = records
+        unfinished: Set[str] = set()
+        if self.dedup_index is not None:
+            candidates = self.dedup_index.filter_new(records)
+            # outbox 모드에서는 OutboxRelay가 발행을 보장하므로 표시하지 않음
+            if self.outbox_relay is None:
+                unfinished = self.dedup_index.mark_pending(candidates)
+
+        return new_checkpoint, candidates, unfinished
+
+    def _unpublished_duplicates(self, candidates: List, saved_data: List, unfinished: Set[str]) -> List:
+        """
+        저장 시 중복(DB unique 인덱스)으로 제외된 항목 중 다시 발행할 항목
+
+        DB 커밋 후 발행이 실패하면 Checkpoint가 전진하지 않아 같은 항목이 다시 수집되고,
+        이번에는 중복으로 저장이 생략됩니다. 이전 시도의 발행 대기 표시가 남아 있는 항목만
+        발행되지 않았다는 근거가 있으므로 다시 발행합니다 (at-least-once).
+        중복 제거 인덱스가 없거나 표시가 없는 중복(만료, 유실 포함)은 이미 발행된 것으로 보고 발행하지 않습니다.
+
+        Args:
+            candidates: 저장을 시도한 RawRecord 리스트
+            saved_data: Database에 저장된 RawRecord 리스트
+            unfinished: 이전 시도에서 발행이 끝나지 않은 content_hash 집합
+
+        Returns:
+            중복으로 저장되지 않았고 발행이 끝나지 않은 RawRecord 리스트 (id 없음)
+        """
+        if not unfinished or len(saved_data) == len(candidates):
+            return []
+        return [raw_data for raw_data in candidates if raw_data.id is None and raw_data.content_hash() in unfinished]
+
+    def _assign_existing_ids(self, channel, duplicates: List, saved_data: List, existing_ids: Dict[str, int]) -> List:
+        """
+        중복 항목에 기존 raw_data id 할당
+
+        Args:
+            channel: 수집 채널
+            duplicates: 중복으로 저장되지 않은 RawRecord 리스트
+            saved_data: 이번에 저장된 RawRecord 리스트 (배치 내 중복은 다시 발행하지 않음)
+            existing_ids: content_hash → id
+
+        Returns:
+            기존 id가 할당된 RawRecord 리스트 (id를 찾지 못한 항목 제외)
+        """
+        published_ids = {raw_data.id for raw_data in saved_data}
+        recovered = []
+        for raw_data in duplicates:
+            db_id = existing_ids.get(raw_data.content_hash())
+            if db_id is None or db_id in published_ids:
+                continue
+            raw_data.id = db_id
+            published_ids.add(db_id)
+            recovered.append(raw_data)
+
+        if recovered:
+            self.logger.info("발행 기록이 없는 중복 데이터 재발행", channel=channel, count=len(recovered))
+        return recovered
+
+    def _publish_saved(
+        self,
+        channel,
+        checkpoint: Optional[datetime],
+        new_checkpoint: Optional[datetime],
+        collected_data: List,
+        candidates: List,
+        saved_data: List,
+        recovered: Optional[List] = None,
+    ) -> None:
+        """
+        저장된 데이터 발행 및 Checkpoint 갱신
+
+        Args:
+            channel: 수집 채널
+            checkpoint: 수집 시점의 Checkpoint
+            new_checkpoint: 발행 후 기록할 Checkpoint (전진하지 않으면 None)
+            collected_data: 수집된 원본 데이터 리스트
+            candidates: 저장을 시도한 RawRecord 리스트 (발행 후 중복 인덱스에 기록)
+            saved_data: Database에 저장된 RawRecord 리스트
+            recovered: 이미 저장되어 있지만 발행 기록이 없어 다시 발행할 RawRecord 리스트
+        """
+        ITEMS_FILTERED.labels(channel=channel.value, reason="duplicate").inc(len(collected_data) - len(saved_data))
+        ITEMS_SAVED.labels(channel=channel.value).inc(len(saved_data))
+
+        # 3-3. Message Queue 일괄 발행 → 성공 시 Checkpoint 갱신 + 중복 인덱스 기록 (MULTI/EXEC)
+        # outbox 모드에서는 저장 트랜잭션에 outbox가 기록되었으므로 발행은 OutboxRelay에 맡김
+        write_behind = self.state_store.write_behind
+        published = (recovered or []) + saved_data
+        to_publish = [] if self.outbox_relay is not None else published
+
+        def after_publish(pipe):
+            # 기록 성공 후 Checkpoint 캐시 반영 콜백
+            confirm = None
+            if new_checkpoint is not None and not write_behind:
+                confirm = self.state_store.save_checkpoint(channel, new_checkpoint, pipeline=pipe)
+            if self.dedup_index is not None:
+                # DB 중복으로 발행하지 않은 항목도 처리 완료로 기록하고 발행 대기 표시 삭제
+                self.dedup_index.mark_seen(candidates, pipeline=pipe)
+            return confirm
+
+        self.message_queue.publish_batch(to_publish, after_publish=after_publish)
+        ITEMS_PUBLISHED.labels(channel=channel.value).inc(len(to_publish))
+
+        if new_checkpoint is not None:
+            if write_behind:
+                # 쓰기 지연 모드: 발행이 끝난 뒤에만 Checkpoint를 기록 대기에 추가
+                self.state_store.save_checkpoint(channel, new_checkpoint)
+            self.logger.debug("Checkpoint 저장 완료", channel=channel, checkpoint=new_checkpoint)
+
         self.logger.info(
-            "스케줄러 시작됨",
-            interval_minutes=SCHEDULER_CONFIG['minutes'],
-            job_name=SCHEDULER_CONFIG['name']
+            "Database 저장 및 Message Queue 발행 완료",
+            channel=channel,
+            count=len(saved_data),
+            outbox=self.outbox_relay is not None
+        )
+        self._observe_checkpoint_lag(channel, new_checkpoint or checkpoint)
+
+    def _observe_checkpoint_lag(self, channel, checkpoint: Optional[datetime]) -> None:
+        """Checkpoint 지연(현재 시간 - Checkpoint) 메트릭 갱신"""
+        if checkpoint is not None:
+            lag = (datetime.now(timezone.utc) - checkpoint).total_seconds()
+            CHECKPOINT_LAG_SECONDS.labels(channel=channel.value).set(lag)
+
+    def _commit_validators(self, collector) -> None:
+        """
+        Collector의 조건부 요청 검증자를 확정하고 StateStore에 저장
+
+        Args:
+            collector: 저장 및 발행을 마친 Collector
+        """
+        validators = collector.commit_validators()
+        if validators is not None:
+            self.state_store.save_validators(collector.get_channel(), validators)
+
+    async def run_async(self):
+        """
+        등록된 모든 Collector의 수집 작업을 단일 이벤트 루프에서 동시에 실행
+
+        모든 Collector는 공유 HTTP 클라이언트(keep-alive, HTTP/2)를 사용하며,
+        동시 실행 수는 SCHEDULER_CONFIG['max_workers']로 제한됩니다.
+        """
+        self.logger.info("수집 작업 시작", collectors_count=len(self.collectors), mode="async")
+
+        semaphore = asyncio.Semaphore(SCHEDULER_CONFIG['max_workers'])
+
+        await asyncio.to_thread(self._prefetch_checkpoints)
+
+        async def run_one(collector):
+            async with semaphore:
+                try:
+                    await self._run_collector_async(collector)
+                except Exception as e:
+                    self.logger.error("Collector 실행 실패", channel=collector.get_channel(), error=str(e))
+
+        # 이번 실행 동안만 사용하는 공유 HTTP 클라이언트
+        async with self._create_http_client() as client:
+            self._http_client = client
+            try:
+                await asyncio.gather(*(run_one(collector) for collector in self.collectors))
+            finally:
+                self._http_client = None
+
+        # 쓰기 지연 모드: 채널별 Checkpoint를 한 번에 기록
+        await asyncio.to_thread(self.state_store.flush)
+
+        if self.outbox_relay is not None:
+            await self._relay_outbox_async()
+
+        self.logger.info("수집 작업 완료")
+
+    async def _run_collector_async(self, collector) -> int:
+        """
+        단일 Collector의 수집 파이프라인을 비동기로 실행
+
+        HTTP 수집은 공유 클라이언트로 수행하고,
+        동기 인프라(StateStore, Database, MessageQueue) 호출은 스레드로 위임합니다.
+
+        Args:
+            collector: 실행할 Collector
+
+        Returns:
+            수집된 데이터 건수
+        """
+        channel = collector.get_channel()
+        self.logger.info("Collector 실행 시작", channel=channel)
+
+        checkpoint = await asyncio.to_thread(self.state_store.get_checkpoint, channel)
+
+        collected_data = await collector.collect_raw_data_async(checkpoint, self._http_client)
+
+        if self._async_database:
+            await self._store_and_publish_async(channel, checkpoint, collected_data)
+        else:
+            await asyncio.to_thread(self._store_and_publish, channel, checkpoint, collected_data)
+        await asyncio.to_thread(self._commit_validators, collector)
+
+        self.logger.info("Collector 실행 완료", channel=channel)
+        return len(collected_data)
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """공유 비동기 HTTP 클라이언트 생성"""
+        limits = httpx.Limits(
+            max_connections=HTTP_CONFIG['max_connections'],
+            max_keepalive_connections=HTTP_CONFIG['max_keepalive_connections'],
+            keepalive_expiry=HTTP_CONFIG['keepalive_expiry'],
         )
+        return httpx.AsyncClient(http2=HTTP_CONFIG['http2'], limits=limits)
+
+    def start(self):
+        """
+        스케줄러 시작 및 채널별 주기적 수집 실행
+
+        Collector마다 독립된 작업을 등록하여 즉시 한 번 실행한 뒤,
+        채널별 적응형 주기(PollInterval)에 따라 다시 실행합니다.
+        """
+        if self.mode == "async":
+            asyncio.run(self._start_async())
+            return
+
+        # 등록 즉시 모든 채널이 실행되므로 Checkpoint를 먼저 한 번에 조회
+        self._prefetch_checkpoints()
+        self._add_collector_jobs(self._run_scheduled)
+        self._add_maintenance_jobs()
+
+        self.logger.info("스케줄러 시작됨", collectors_count=len(self.collectors))
 
         try:
             self.scheduler.start()
         except (KeyboardInterrupt, SystemExit):
             self.logger.info("스케줄러 종료")
 
+    def _add_collector_jobs(self, func):
+        """
+        Collector별 수집 작업 등록 (등록 즉시 첫 실행)
+
+        Args:
+            func: Collector를 인자로 받는 작업 함수
+        """
+        now = datetime.now(timezone.utc)
+        for collector in self.collectors:
+            channel = collector.get_channel()
+            interval = self.poll_intervals[channel]
+            self.scheduler.add_job(
+                func=func,
+                args=[collector],
+                trigger="interval",
+                seconds=interval.current,
+                next_run_time=now,
+                id=self._job_id(channel),
+                name=f"{SCHEDULER_CONFIG['name']} ({channel.value})"
+            )
+            self.logger.info(
+                "수집 작업 등록",
+                channel=channel,
+                min_interval_seconds=interval.min_seconds,
+                max_interval_seconds=interval.max_seconds
+            )
+
+    def _run_scheduled(self, collector):
+        """스케줄러가 실행하는 채널별 수집 작업 (스레드 모드)"""
+        try:
+            collected_count = self._run_collector(collector)
+        except Exception as e:
+            self.logger.error("Collector 실행 실패", channel=collector.get_channel(), error=str(e))
+            collected_count = 0
+
+        self._reschedule(collector, collected_count)
+
+    async def _run_scheduled_async(self, collector):
+        """스케줄러가 실행하는 채널별 수집 작업 (비동기 모드)"""
+        async with self._semaphore:
+            try:
+                collected_count = await self._run_collector_async(collector)
+            except Exception as e:
+                self.logger.error("Collector 실행 실패", channel=collector.get_channel(), error=str(e))
+                collected_count = 0
+
+        self._reschedule(collector, collected_count)
+
+    def _reschedule(self, collector, collected_count: int):
+        """
+        수집 결과에 따라 채널의 다음 수집 주기 조정
+
+        Args:
+            collector: 수집을 마친 Collector
+            collected_count: 수집된 데이터 건수 (실패 시 0)
+        """
+        channel = collector.get_channel()
+        interval = self.poll_intervals[channel]
+        previous = interval.current
+        current = interval.on_new_items() if collected_count else interval.on_quiet()
+
+        if current != previous:
+            self.scheduler.reschedule_job(self._job_id(channel), trigger="interval", seconds=current)
+            self.logger.info("수집 주기 변경", channel=channel, interval_seconds=current)
+
+    def _job_id(self, channel) -> str:
+        """채널별 수집 작업 ID"""
+        return f"collect:{channel.value}"
+
+    def _relay_outbox(self):
+        """outbox 발행 (실패해도 다음 실행에서 재시도)"""
+        try:
+            self.outbox_relay.run_once()
+        except Exception as e:
+            self.logger.error("outbox 발행 실패", error=str(e))
+
+    async def _relay_outbox_async(self):
+        """outbox 발행 (비동기 모드)"""
+        try:
+            if self._async_database:
+                await self.outbox_relay.run_once_async()
+            else:
+                await asyncio.to_thread(self.outbox_relay.run_once)
+        except Exception as e:
+            self.logger.error("outbox 발행 실패", error=str(e))
+
+    def _add_maintenance_jobs(self):
+        """주기적 유지보수 작업 등록 (스트림 트리밍, Checkpoint 기록, outbox 발행)"""
+        if self.outbox_relay is not None:
+            relay_interval = OUTBOX_CONFIG['relay_interval_seconds']
+            self.scheduler.add_job(
+                func=self._relay_outbox_async if self.mode == "async" else self._relay_outbox,
+                trigger="interval",
+                seconds=relay_interval,
+                id="outbox_relay_job",
+                name="outbox 발행 작업",
+                max_instances=1,
+                coalesce=True
+            )
+            self.logger.info("outbox 발행 작업 등록", interval_seconds=relay_interval)
+
+        if self.state_store is not None and self.state_store.write_behind:
+            flush_interval = CHECKPOINT_CONFIG['flush_interval_seconds']
+            self.scheduler.add_job(
+                func=self.state_store.flush,
+                trigger="interval",
+                seconds=flush_interval,
+                id="checkpoint_flush_job",
+                name="Checkpoint 기록 작업",
+                max_instances=1,
+                coalesce=True
+            )
+            self.logger.info("Checkpoint 기록 작업 등록", interval_seconds=flush_interval)
+
+        trim_interval = STREAM_CONFIG['trim_interval_seconds']
+        if trim_interval > 0 and self.message_queue is not None:
+            self.scheduler.add_job(
+                func=self.message_queue.trim,
+                trigger="interval",
+                seconds=trim_interval,
+                id="stream_trim_job",
+                name="스트림 트리밍 작업"
+            )
+            self.logger.info("스트림 트리밍 작업 등록", interval_seconds=trim_interval)
+
+    async def _start_async(self):
+        """비동기 모드 스케줄러 시작 (공유 HTTP 클라이언트 수명 관리)"""
+        self._stop_event = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(SCHEDULER_CONFIG['max_workers'])
+
+        async with self._create_http_client() as client:
+            self._http_client = client
+
+            # 등록 즉시 모든 채널이 실행되므로 Checkpoint를 먼저 한 번에 조회
+            await asyncio.to_thread(self._prefetch_checkpoints)
+            self._add_collector_jobs(self._run_scheduled_async)
+            self._add_maintenance_jobs()
+            self.scheduler.start()
+
+            self.logger.info("스케줄러 시작됨", collectors_count=len(self.collectors), mode="async")
+
+            await self._stop_event.wait()
+
+        self._http_client = None
+        if self._async_database:
+            await self.database.close()
+        self.logger.info("스케줄러 종료")
+
     def shutdown(self):
         """스케줄러 우아한 종료"""
         self.logger.info("스케줄러 종료 중...")
         if self.scheduler.running:
             self.scheduler.shutdown(wait=True)
+        if self._stop_event is not None:
+            self._stop_event.set()
+        # 종료 전 남은 Checkpoint 기록
+        if self.state_store is not None:
+            self.state_store.flush()
+        shutdown_parse_executor()
         self.logger.info("스케줄러 종료 완료")
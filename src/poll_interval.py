@@ -0,0 +1,36 @@
+"""
+PollInterval: 채널별 적응형 수집 주기
+
+새 데이터가 나오면 최소 주기로 당기고, 조용하거나 실패하면 최대 주기까지 지수적으로 늘립니다.
+"""
+
+
+class PollInterval:
+    """채널별 적응형 수집 주기"""
+
+    def __init__(self, min_seconds: float, max_seconds: float, backoff_factor: float = 2.0):
+        """
+        PollInterval 초기화
+
+        Args:
+            min_seconds: 최소 수집 주기 (초)
+            max_seconds: 최대 수집 주기 (초)
+            backoff_factor: 새 데이터가 없을 때 주기에 곱하는 배수
+        """
+        if min_seconds <= 0 or max_seconds < min_seconds:
+            raise ValueError(f"잘못된 수집 주기 범위: min={min_seconds}, max={max_seconds}")
+
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.backoff_factor = backoff_factor
+        self.current = min_seconds
+
+    def on_new_items(self) -> float:
+        """새 데이터가 있었던 수집 후 호출 (최소 주기로 복귀)"""
+        self.current = self.min_seconds
+        return self.current
+
+    def on_quiet(self) -> float:
+        """새 데이터가 없었거나 실패한 수집 후 호출 (주기를 늘림)"""
+        self.current = min(self.current * self.backoff_factor, self.max_seconds)
+        return self.current
@@ -0,0 +1,11 @@
+"""
+공통 테스트 fixture
+"""
+import fakeredis
+import pytest
+
+
+@pytest.fixture
+def redis_client():
+    """테스트마다 독립된 메모리 Redis"""
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
@@ -0,0 +1,329 @@
+"""
+AsyncDatabase 저장 / 조회 / Connection Pool 수명 테스트
+
+Oracle 대신 tests/test_database.py와 같은 메모리 테이블을 비동기 pool / connection / cursor로 감싸 사용합니다.
+"""
+import asyncio
+import oracledb
+import pytest
+from datetime import datetime, timezone
+from prometheus_client import REGISTRY
+from typing import List, Optional
+from src.infrastructure import raw_data_sql as sql
+from src.infrastructure.async_database import AsyncDatabase
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+from tests.test_database import BatchError, IdVar, RawDataTable, make_raw_data
+from config.database import DB_POOL_CONFIG
+
+
+class ReturningVar(IdVar):
+    """단건 INSERT(getvalue()) / 배치 INSERT(getvalue(index)) 공용 RETURNING 변수"""
+
+    def getvalue(self, index: int = 0) -> List[int]:
+        return super().getvalue(index)
+
+
+class AsyncFakeCursor:
+    """INSERT_SQL / OUTBOX_INSERT_SQL / latest_query만 처리하는 비동기 cursor"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.id_var = None
+        self.batch_errors: List[BatchError] = []
+        self._row: Optional[tuple] = None
+
+    def var(self, type_, arraysize=None):
+        return ReturningVar()
+
+    def setinputsizes(self, id):
+        self.id_var = id
+
+    async def execute(self, query, params=None, fetch_lobs=True):
+        table = self.connection.table
+        if table.failure is not None:
+            raise table.failure
+
+        if query == sql.INSERT_SQL:
+            # 단건 INSERT: RETURNING 변수는 바인딩으로 전달됨
+            id_var = params["id"]
+            new_id = len(table.ids_by_hash) + len(self.connection.inserted) + 1
+            self.connection.inserted[params["content_hash"]] = new_id
+            id_var.values[0] = new_id
+            return
+        if query == sql.OUTBOX_INSERT_SQL:
+            self.connection.outbox.append(params["raw_data_id"])
+            return
+
+        # latest_query: CLOB은 str로 받아야 함
+        assert not fetch_lobs
+        table.queries.append(params)
+        self._row = table.latest_row
+
+    async def executemany(self, query, params, batcherrors=False):
+        table = self.connection.table
+        table.executemany_calls += 1
+        if table.failure is not None:
+            raise table.failure
+
+        if query == sql.OUTBOX_INSERT_SQL:
+            self.connection.outbox.extend(param["raw_data_id"] for param in params)
+            return
+
+        assert query == sql.INSERT_SQL
+        assert batcherrors
+        for offset, param in enumerate(params):
+            content_hash = param["content_hash"]
+            if param["link"] in table.failing_links:
+                self.batch_errors.append(BatchError(12899, offset))
+            elif content_hash in table.ids_by_hash or content_hash in self.connection.inserted:
+                self.batch_errors.append(BatchError(sql.UNIQUE_VIOLATION_CODE, offset))
+            else:
+                new_id = len(table.ids_by_hash) + len(self.connection.inserted) + 1
+                self.connection.inserted[content_hash] = new_id
+                self.id_var.values[offset] = new_id
+
+    def getbatcherrors(self):
+        return self.batch_errors
+
+    async def fetchone(self):
+        return self._row
+
+    def close(self):
+        pass
+
+
+class AsyncFakeConnection:
+    """커밋 전까지 INSERT를 보류하는 비동기 connection"""
+
+    def __init__(self, table: RawDataTable):
+        self.table = table
+        self.inserted = {}
+        self.outbox: List[int] = []
+
+    def cursor(self):
+        return AsyncFakeCursor(self)
+
+    async def commit(self):
+        self.table.commits += 1
+        self.table.ids_by_hash.update(self.inserted)
+        self.table.outbox.extend(self.outbox)
+        self.inserted, self.outbox = {}, []
+
+    async def rollback(self):
+        self.table.rollbacks += 1
+        self.inserted, self.outbox = {}, []
+
+
+class AsyncFakePool:
+    """create_pool_async 결과를 흉내 내는 pool (acquire / release / close 기록)"""
+
+    def __init__(self, table: RawDataTable, fail_acquire: bool = False, **params):
+        self.table = table
+        self.params = params
+        self.fail_acquire = fail_acquire
+        self.max = params.get("max", DB_POOL_CONFIG["max"])
+        self.opened = 0
+        self.busy = 0
+        self.acquired = 0
+        self.closed = False
+        self.force_closed = False
+
+    async def acquire(self):
+        if self.fail_acquire:
+            raise oracledb.DatabaseError("ORA-12541: no listener")
+        self.acquired += 1
+        self.busy += 1
+        self.opened = max(self.opened, self.busy)
+        return AsyncFakeConnection(self.table)
+
+    async def release(self, connection):
+        self.busy -= 1
+
+    async def close(self, force=False):
+        self.closed = True
+        self.force_closed = force
+
+
+def with_table(table: RawDataTable) -> RawDataTable:
+    """비동기 cursor가 쓰는 속성 추가 (latest_query 결과, 강제 예외)"""
+    table.failure = None
+    table.latest_row = None
+    table.queries = []
+    return table
+
+
+def create_database(table: RawDataTable, outbox_enabled: bool = False) -> AsyncDatabase:
+    """열린 pool을 가진 AsyncDatabase"""
+    database = AsyncDatabase()
+    database.outbox_enabled = outbox_enabled
+    database._pool = AsyncFakePool(with_table(table))
+    return database
+
+
+class TestAsyncSave:
+    """AsyncDatabase.save_raw_data / save_raw_data_batch 테스트 클래스"""
+
+    def test_save_raw_data(self):
+        """단건 저장 후 id 할당, outbox 모드는 같은 커밋에 outbox 기록"""
+        table = RawDataTable()
+        database = create_database(table, outbox_enabled=True)
+
+        raw_data = asyncio.run(database.save_raw_data(make_raw_data(1)))
+
+        assert raw_data.id == 1
+        assert table.outbox == [1]
+        assert table.commits == 1
+        assert database._pool.busy == 0
+
+    def test_batch_single_round_trip(self):
+        """배치 전체를 executemany 1회 + 커밋 1회로 저장하고 중복은 건너뜀"""
+        table = RawDataTable()
+        database = create_database(table)
+        asyncio.run(database.save_raw_data_batch([make_raw_data(1)]))
+
+        saved_data = asyncio.run(
+            database.save_raw_data_batch([make_raw_data(1), make_raw_data(2), make_raw_data(3)])
+        )
+
+        assert [raw_data.id for raw_data in saved_data] == [2, 3]
+        assert table.executemany_calls == 2
+        assert table.commits == 2
+        assert database._pool.busy == 0
+
+    def test_batch_row_error_rolls_back(self):
+        """중복 외의 행 오류는 배치 전체를 롤백하고 예외"""
+        table = RawDataTable(failing_links={"https://example.com/2"})
+        database = create_database(table)
+
+        with pytest.raises(oracledb.DatabaseError):
+            asyncio.run(database.save_raw_data_batch([make_raw_data(1), make_raw_data(2)]))
+
+        assert table.ids_by_hash == {}
+        assert table.rollbacks == 1
+        assert database._pool.busy == 0
+
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_unexpected_error_rolls_back(self, batch):
+        """oracledb.Error가 아닌 예외도 롤백 후 연결을 반환하고 다시 던짐"""
+        table = RawDataTable()
+        database = create_database(table)
+        table.failure = RuntimeError("예상하지 못한 오류")
+
+        with pytest.raises(RuntimeError):
+            if batch:
+                asyncio.run(database.save_raw_data_batch([make_raw_data(1)]))
+            else:
+                asyncio.run(database.save_raw_data(make_raw_data(1)))
+
+        assert table.commits == 0
+        assert table.rollbacks == 1
+        assert database._pool.busy == 0
+
+
+class TestAsyncGetLatest:
+    """AsyncDatabase.get_latest_raw_data 테스트 클래스"""
+
+    def test_latest_row(self):
+        """UTC naive published_at을 timezone-aware로 변환한 RawData"""
+        table = RawDataTable()
+        database = create_database(table)
+        table.latest_row = (7, "트럼프 발언", "https://example.com/7", datetime(2025, 11, 21, 10, 0, 0), "dummy")
+
+        raw_data = asyncio.run(database.get_latest_raw_data())
+
+        assert isinstance(raw_data, RawData)
+        assert raw_data.id == 7
+        assert raw_data.published_at == datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc)
+        assert raw_data.channel == Channel.DUMMY
+        assert database._pool.busy == 0
+
+    def test_by_id_and_missing(self):
+        """id로 조회하고, 행이 없으면 None"""
+        table = RawDataTable()
+        database = create_database(table)
+
+        assert asyncio.run(database.get_latest_raw_data(id=3)) is None
+        assert table.queries == [{"id": 3}]
+
+
+class TestAsyncPoolLifecycle:
+    """AsyncDatabase open / close 테스트 클래스"""
+
+    @pytest.fixture
+    def pools(self, monkeypatch):
+        pools = []
+
+        def create_pool_async(**params):
+            pools.append(AsyncFakePool(with_table(RawDataTable()), **params))
+            return pools[-1]
+
+        monkeypatch.setattr(oracledb, "create_pool_async", create_pool_async)
+        return pools
+
+    def test_open_once_and_prewarm(self, pools, monkeypatch):
+        """동시에 여러 번 열어도 pool은 하나만 만들고 최소 연결 수만큼 미리 연결"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", True)
+        database = AsyncDatabase()
+
+        async def open_concurrently():
+            await asyncio.gather(database.open(), database.open(), database.open())
+
+        asyncio.run(open_concurrently())
+
+        assert len(pools) == 1
+        assert pools[0].acquired == DB_POOL_CONFIG["min"]
+        assert pools[0].busy == 0
+
+    def test_lazy_open_on_first_use(self, pools, monkeypatch):
+        """open() 없이 첫 조회에서 pool 생성"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", False)
+        database = AsyncDatabase()
+
+        assert asyncio.run(database.get_latest_raw_data()) is None
+        assert len(pools) == 1
+
+    def test_prewarm_failure_closes_pool(self, monkeypatch):
+        """미리 연결이 실패하면 만든 pool을 닫고 예외"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", True)
+        pools = []
+
+        def create_pool_async(**params):
+            pools.append(AsyncFakePool(RawDataTable(), fail_acquire=True, **params))
+            return pools[-1]
+
+        monkeypatch.setattr(oracledb, "create_pool_async", create_pool_async)
+        database = AsyncDatabase()
+
+        with pytest.raises(oracledb.DatabaseError):
+            asyncio.run(database.open())
+
+        assert pools[0].closed and pools[0].force_closed
+        assert database._pool is None
+
+    def test_close(self, pools, monkeypatch):
+        """close()는 pool을 닫고, 다시 호출해도 안전"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", False)
+        database = AsyncDatabase()
+
+        async def open_and_close():
+            await database.open()
+            await database.close()
+            await database.close()
+
+        asyncio.run(open_and_close())
+
+        assert pools[0].closed
+        assert database._pool is None
+
+    def test_pool_gauges_after_close(self, pools, monkeypatch):
+        """Pool 사용량 게이지는 scrape 시점 값을 보고, Pool 종료 후에는 0"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", True)
+        database = AsyncDatabase()
+
+        asyncio.run(database.open())
+        assert REGISTRY.get_sample_value("data_collection_db_pool_open") == DB_POOL_CONFIG["min"]
+
+        asyncio.run(database.close())
+        assert REGISTRY.get_sample_value("data_collection_db_pool_busy") == 0
+        assert REGISTRY.get_sample_value("data_collection_db_pool_open") == 0
@@ -0,0 +1,428 @@
+"""
+Database 일괄 저장 / 구간 조회 / Connection Pool 테스트
+
+Oracle 대신 content_hash unique 인덱스와 executemany(batcherrors=True) 동작을 흉내 내는
+메모리 테이블, range_query 바인딩으로 keyset 페이지를 돌려주는 cursor,
+create_pool 인자 및 연결 수를 기록하는 pool을 사용합니다.
+"""
+import oracledb
+import pytest
+from datetime import datetime, timedelta, timezone
+from prometheus_client import REGISTRY
+from typing import Dict, List, Optional
+from src.infrastructure import raw_data_sql as sql
+from src.infrastructure.database import Database
+from src.logger import get_logger
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+from config.database import DB_POOL_CONFIG
+
+
+class BatchError:
+    """cursor.getbatcherrors() 항목"""
+
+    def __init__(self, code: int, offset: int):
+        self.code = code
+        self.offset = offset
+        self.message = f"ORA-{code:05d}"
+
+
+class IdVar:
+    """RETURNING id INTO 배열 변수"""
+
+    def __init__(self):
+        self.values: Dict[int, int] = {}
+
+    def getvalue(self, index: int) -> List[int]:
+        return [self.values[index]]
+
+
+class RawDataTable:
+    """raw_data / raw_data_outbox 행과 실행 기록"""
+
+    def __init__(self, failing_links=()):
+        self.ids_by_hash: Dict[str, int] = {}
+        self.outbox: List[int] = []
+        self.failing_links = set(failing_links)
+        self.executemany_calls = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+
+class FakeCursor:
+    """INSERT_SQL / OUTBOX_INSERT_SQL만 처리하는 cursor"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.id_var = None
+        self.batch_errors: List[BatchError] = []
+
+    def var(self, type_, arraysize):
+        return IdVar()
+
+    def setinputsizes(self, id):
+        self.id_var = id
+
+    def executemany(self, query, params, batcherrors=False):
+        table = self.connection.table
+        table.executemany_calls += 1
+
+        if query == sql.OUTBOX_INSERT_SQL:
+            self.connection.outbox.extend(param["raw_data_id"] for param in params)
+            return
+
+        assert query == sql.INSERT_SQL
+        assert batcherrors
+        for offset, param in enumerate(params):
+            content_hash = param["content_hash"]
+            if param["link"] in table.failing_links:
+                self.batch_errors.append(BatchError(12899, offset))
+            elif content_hash in table.ids_by_hash or content_hash in self.connection.inserted:
+                self.batch_errors.append(BatchError(sql.UNIQUE_VIOLATION_CODE, offset))
+            else:
+                new_id = len(table.ids_by_hash) + len(self.connection.inserted) + 1
+                self.connection.inserted[content_hash] = new_id
+                self.id_var.values[offset] = new_id
+
+    def getbatcherrors(self):
+        return self.batch_errors
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """커밋 전까지 INSERT를 보류하는 connection"""
+
+    def __init__(self, table: RawDataTable):
+        self.table = table
+        self.inserted: Dict[str, int] = {}
+        self.outbox: List[int] = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.table.commits += 1
+        self.table.ids_by_hash.update(self.inserted)
+        self.table.outbox.extend(self.outbox)
+        self._release()
+
+    def rollback(self):
+        self.table.rollbacks += 1
+        self._release()
+
+    def close(self):
+        self._release()
+
+    def _release(self):
+        self.inserted = {}
+        self.outbox = []
+
+
+class FakePool:
+    """FakeConnection을 내주는 Connection Pool"""
+
+    def __init__(self, table: RawDataTable):
+        self.table = table
+
+    def acquire(self):
+        return FakeConnection(self.table)
+
+
+class RangeCursor:
+    """range_query 바인딩으로 (id, content, link, UTC published_at, channel) 행을 돌려주는 cursor"""
+
+    def __init__(self, rows: List[tuple], queries: List[Dict]):
+        self.rows = rows
+        self.queries = queries
+        self.arraysize = 100
+        self._result: List[tuple] = []
+
+    def execute(self, query, params, fetch_lobs=True):
+        # CLOB은 LOB 객체 대신 str로 받아야 함
+        assert not fetch_lobs
+        self.queries.append(params)
+
+        rows = sorted(self.rows, key=lambda row: (row[3], row[0]))
+        if "since" in params:
+            if "after_id" in params:
+                key = (params["since"], params["after_id"])
+                rows = [row for row in rows if (row[3], row[0]) > key]
+            else:
+                rows = [row for row in rows if row[3] >= params["since"]]
+        if "until" in params:
+            rows = [row for row in rows if row[3] < params["until"]]
+        if "channel" in params:
+            rows = [row for row in rows if row[4] == params["channel"]]
+        self._result = rows[:params["batch_size"]]
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class RangeConnection:
+    """RangeCursor를 내주는 connection"""
+
+    def __init__(self, rows: List[tuple], queries: List[Dict]):
+        self.rows = rows
+        self.queries = queries
+
+    def cursor(self):
+        return RangeCursor(self.rows, self.queries)
+
+    def close(self):
+        pass
+
+
+class RangePool:
+    """raw_data 행을 가진 Connection Pool"""
+
+    def __init__(self, rows: List[tuple]):
+        self.rows = rows
+        self.queries: List[Dict] = []
+
+    def acquire(self):
+        return RangeConnection(self.rows, self.queries)
+
+
+class SizedPool:
+    """create_pool 인자와 연결 수를 기록하는 Connection Pool"""
+
+    def __init__(self, **params):
+        self.params = params
+        self.max = params["max"]
+        self.opened = 0
+        self.busy = 0
+        self.closed = False
+
+    def acquire(self):
+        self.busy += 1
+        self.opened = max(self.opened, self.busy)
+        return PooledConnection(self)
+
+    def close(self):
+        self.closed = True
+
+
+class PooledConnection:
+    """close() 시 pool에 반환되는 connection"""
+
+    def __init__(self, pool: SizedPool):
+        self.pool = pool
+
+    def close(self):
+        self.pool.busy -= 1
+
+
+def create_database(table: Optional[RawDataTable] = None, outbox_enabled: bool = False, pool=None) -> Database:
+    """Connection Pool만 바꾼 Database"""
+    database = Database.__new__(Database)
+    database.logger = get_logger("test_database")
+    database.outbox_enabled = outbox_enabled
+    database._acquire_stats = sql.AcquireStats()
+    database._pool = pool or FakePool(table)
+    return database
+
+
+def raw_data_rows() -> List[tuple]:
+    """같은 발행 시간이 섞인 raw_data 행 (published_at은 드라이버처럼 UTC naive)"""
+    base = datetime(2025, 11, 21, 10, 0, 0)
+    minutes = [0, 0, 0, 1, 1, 2]
+    return [
+        (
+            row_id,
+            f"트럼프 발언 테스트 {row_id}",
+            f"https://example.com/{row_id}",
+            base + timedelta(minutes=minutes[row_id - 1]),
+            Channel.WHITE_HOUSE.value if row_id == 4 else Channel.TRUTH_SOCIAL.value,
+        )
+        for row_id in range(1, len(minutes) + 1)
+    ]
+
+
+def make_raw_data(index: int) -> RawData:
+    """테스트용 RawData (같은 index면 같은 content_hash)"""
+    return RawData(
+        content=f"트럼프 발언 테스트 {index}",
+        link=f"https://example.com/{index}",
+        published_at=datetime(2025, 11, 21, 10, index, 0, tzinfo=timezone.utc),
+        channel=Channel.DUMMY,
+    )
+
+
+class TestSaveRawDataBatch:
+    """Database.save_raw_data_batch 테스트 클래스"""
+
+    def test_single_round_trip(self):
+        """배치 전체를 executemany 1회 + 커밋 1회로 저장하고 입력 순서대로 id 할당"""
+        table = RawDataTable()
+        batch = [make_raw_data(index) for index in range(1, 4)]
+
+        saved_data = create_database(table).save_raw_data_batch(batch)
+
+        assert saved_data == batch
+        assert [raw_data.id for raw_data in saved_data] == [1, 2, 3]
+        assert table.executemany_calls == 1
+        assert table.commits == 1
+
+    def test_duplicates_skipped(self):
+        """content_hash 중복(ORA-00001) 행은 건너뛰고 나머지를 저장"""
+        table = RawDataTable()
+        database = create_database(table)
+        database.save_raw_data_batch([make_raw_data(1)])
+
+        duplicate = make_raw_data(1)
+        saved_data = database.save_raw_data_batch([duplicate, make_raw_data(2), make_raw_data(2)])
+
+        assert [raw_data.id for raw_data in saved_data] == [2]
+        assert duplicate.id is None
+        assert len(table.ids_by_hash) == 2
+
+    def test_row_error_rolls_back(self):
+        """중복 외의 행 오류는 배치 전체를 롤백하고 예외"""
+        table = RawDataTable(failing_links={"https://example.com/2"})
+
+        with pytest.raises(oracledb.DatabaseError):
+            create_database(table).save_raw_data_batch([make_raw_data(1), make_raw_data(2)])
+
+        assert table.ids_by_hash == {}
+        assert table.commits == 0
+        assert table.rollbacks == 1
+
+    def test_outbox_in_same_transaction(self):
+        """outbox 모드에서는 저장된 행만 같은 커밋에 outbox로 기록"""
+        table = RawDataTable()
+        database = create_database(table, outbox_enabled=True)
+        database.save_raw_data_batch([make_raw_data(1)])
+
+        database.save_raw_data_batch([make_raw_data(1), make_raw_data(2)])
+
+        assert table.outbox == [1, 2]
+        assert table.commits == 2
+
+    def test_empty_batch(self):
+        """빈 배치는 연결을 획득하지 않음"""
+        table = RawDataTable()
+
+        assert create_database(table).save_raw_data_batch([]) == []
+        assert table.executemany_calls == 0
+
+
+class TestConnectionPool:
+    """Database Connection Pool 설정 / 통계 테스트 클래스"""
+
+    @pytest.fixture
+    def pools(self, monkeypatch):
+        pools = []
+
+        def create_pool(**params):
+            pools.append(SizedPool(**params))
+            return pools[-1]
+
+        monkeypatch.setattr(oracledb, "create_pool", create_pool)
+        return pools
+
+    def test_pool_sized_from_config(self, pools, monkeypatch):
+        """DB_POOL_CONFIG 크기와 대기 한도로 pool을 만들고 최소 연결 수만큼 미리 연결"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "min", 3)
+        monkeypatch.setitem(DB_POOL_CONFIG, "max", 6)
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", True)
+
+        Database()
+
+        pool = pools[0]
+        assert pool.params["min"] == 3
+        assert pool.params["max"] == 6
+        assert pool.params["getmode"] == oracledb.POOL_GETMODE_TIMEDWAIT
+        assert pool.params["wait_timeout"] == DB_POOL_CONFIG["wait_timeout_ms"]
+        assert pool.opened == 3
+        assert pool.busy == 0
+
+    def test_prewarm_disabled(self, pools, monkeypatch):
+        """prewarm이 꺼져 있으면 시작 시 연결하지 않음"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", False)
+
+        Database()
+
+        assert pools[0].opened == 0
+
+    def test_pool_stats(self, pools, monkeypatch):
+        """pool_stats()는 연결 수와 acquire 대기 통계를 보고"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", False)
+        database = Database()
+
+        connection = database._get_connection()
+        stats = database.pool_stats()
+        connection.close()
+
+        assert stats["busy"] == 1
+        assert stats["open"] == 1
+        assert stats["max"] == DB_POOL_CONFIG["max"]
+        assert stats["acquire_count"] == 1
+        assert stats["acquire_wait_seconds_max"] >= 0
+
+        database.close()
+        assert pools[0].closed
+
+    def test_pool_gauges_after_close(self, pools, monkeypatch):
+        """Pool 사용량 게이지는 scrape 시점 값을 보고, Pool 종료 후에는 0 (두 번 닫아도 안전)"""
+        monkeypatch.setitem(DB_POOL_CONFIG, "prewarm", False)
+        database = Database()
+
+        connection = database._get_connection()
+        assert REGISTRY.get_sample_value("data_collection_db_pool_busy") == 1
+        assert REGISTRY.get_sample_value("data_collection_db_pool_open") == 1
+
+        database.close()
+        database.close()
+        assert REGISTRY.get_sample_value("data_collection_db_pool_busy") == 0
+        assert REGISTRY.get_sample_value("data_collection_db_pool_open") == 0
+        connection.close()
+
+
+class TestIterRawData:
+    """Database.iter_raw_data 테스트 클래스"""
+
+    @pytest.fixture
+    def pool(self):
+        return RangePool(raw_data_rows())
+
+    def test_pages_without_gaps_or_repeats(self, pool):
+        """같은 발행 시간이 페이지 경계에 걸려도 모든 행을 (published_at, id) 순서로 한 번씩 조회"""
+        pages = list(create_database(pool=pool).iter_raw_data(batch_size=2))
+
+        assert [[record.id for record in page] for page in pages] == [[1, 2], [3, 4], [5, 6]]
+        # 마지막 페이지가 batch_size와 같으면 빈 페이지를 한 번 더 조회하지만 돌려주지는 않음
+        assert len(pool.queries) == 4
+
+    def test_native_types(self, pool):
+        """published_at은 UTC timezone-aware datetime, content는 str로 변환"""
+        record = next(create_database(pool=pool).iter_raw_data(batch_size=1))[0]
+
+        assert record.published_at == datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc)
+        assert record.content == "트럼프 발언 테스트 1"
+        assert record.channel == Channel.TRUTH_SOCIAL
+
+    def test_range_and_channel(self, pool):
+        """since(포함) / until(미포함)은 UTC로 비교하고 channel로 거름"""
+        kst = timezone(timedelta(hours=9))
+        pages = create_database(pool=pool).iter_raw_data(
+            since=datetime(2025, 11, 21, 19, 1, 0, tzinfo=kst),
+            until=datetime(2025, 11, 21, 10, 2, 0, tzinfo=timezone.utc),
+            channel=Channel.TRUTH_SOCIAL,
+        )
+
+        assert [record.id for page in pages for record in page] == [5]
+        assert pool.queries[0]["since"] == datetime(2025, 11, 21, 10, 1, 0)
+
+    def test_resume_after_id(self, pool):
+        """after_id가 있으면 같은 발행 시간 중 그 id 다음부터 조회"""
+        pages = create_database(pool=pool).iter_raw_data(
+            since=datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc), after_id=2
+        )
+
+        assert [record.id for page in pages for record in page] == [3, 4, 5, 6]
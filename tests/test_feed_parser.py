@@ -0,0 +1,137 @@
+"""
+피드 파싱 함수 테스트
+"""
+import multiprocessing
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from src.collectors import truth_social, white_house
+from src.collectors.feed_parser import get_parse_executor, shutdown_parse_executor, start_parse_executor
+from config.parser import PARSER_CONFIG
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><link>https://example.com/2</link><pubDate>Fri, 21 Nov 2025 12:00:00 GMT</pubDate>
+<description>&lt;p&gt;Second post with &lt;b&gt;bold&lt;/b&gt; text&lt;/p&gt;</description></item>
+<item><link>https://example.com/1</link><pubDate>Fri, 21 Nov 2025 11:00:00 GMT</pubDate>
+<description>&lt;p&gt;First post with enough text&lt;/p&gt;</description></item>
+<item><link>https://example.com/0</link><pubDate>Fri, 21 Nov 2025 10:00:00 GMT</pubDate>
+<description>RT</description></item>
+</channel></rss>
+"""
+
+
+class TestFeedParser:
+    """모듈 수준 파싱 함수 테스트 클래스"""
+
+    def test_truth_social_parse_feed(self):
+        """checkpoint 및 유효성 필터 적용"""
+        checkpoint = datetime(2025, 11, 21, 11, 0, 0, tzinfo=timezone.utc)
+        parsed = truth_social.parse_feed(FEED, checkpoint)
+
+        assert [entry.link for entry in parsed.entries] == ["https://example.com/2"]
+        assert parsed.entries[0].content == "Second post with bold text"
+        assert parsed.filtered["checkpoint"] == 2
+
+    def test_white_house_parse_feed_sorted(self):
+        """발행 시간 오름차순 정렬"""
+        parsed = white_house.parse_feed(FEED, None)
+
+        published = [entry.published_at for entry in parsed.entries]
+        assert published == sorted(published)
+
+    def test_parse_feed_in_process_pool(self):
+        """프로세스 풀 워커에서도 같은 결과"""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            parsed = executor.submit(truth_social.parse_feed, FEED, None).result()
+
+        assert parsed.entries == truth_social.parse_feed(FEED, None).entries
+        assert parsed.filtered["invalid"] == 1
+
+    def test_parse_feed_uses_http_charset(self):
+        """XML 선언이 없으면 Content-Type 헤더의 문자셋으로 디코딩"""
+        body = (
+            "<rss version=\"2.0\"><channel><item><link>https://example.com/1</link>"
+            "<pubDate>Fri, 21 Nov 2025 12:00:00 GMT</pubDate>"
+            "<description>한국어 본문 테스트입니다</description></item></channel></rss>"
+        ).encode("euc-kr")
+
+        parsed = truth_social.parse_feed(body, None, {"content-type": "application/rss+xml; charset=euc-kr"})
+
+        assert parsed.entries[0].content == "한국어 본문 테스트입니다"
+
+    def test_ordered_feed_stops_at_checkpoint(self):
+        """정렬 피드 모드는 checkpoint 이전 항목에서 검사 중단"""
+        checkpoint = datetime(2025, 11, 21, 11, 30, 0, tzinfo=timezone.utc)
+
+        parsed = truth_social.parse_feed(FEED, checkpoint, ordered=True)
+
+        assert [entry.link for entry in parsed.entries] == ["https://example.com/2"]
+        assert parsed.filtered["checkpoint"] == 2
+        assert parsed.filtered["invalid"] == 0
+        assert not parsed.out_of_order
+
+    def test_ordered_feed_falls_back_when_unordered(self):
+        """내림차순이 아닌 피드는 전체 항목 검사"""
+        items = "".join(
+            f"<item><link>https://example.com/{hour}</link>"
+            f"<pubDate>Fri, 21 Nov 2025 {hour}:00:00 GMT</pubDate>"
+            f"<description>Post published at {hour}</description></item>"
+            for hour in (10, 11, 12)
+        )
+        ascending = f"<rss version=\"2.0\"><channel>{items}</channel></rss>".encode()
+        checkpoint = datetime(2025, 11, 21, 10, 30, 0, tzinfo=timezone.utc)
+
+        parsed = white_house.parse_feed(ascending, checkpoint, ordered=True)
+
+        assert [entry.link for entry in parsed.entries] == ["https://example.com/11", "https://example.com/12"]
+        assert parsed.out_of_order
+
+    def test_ordered_feed_ignores_pinned_entry(self):
+        """맨 앞의 오래된 고정 게시물에서 검사를 멈추지 않음"""
+        items = "".join(
+            f"<item><link>https://example.com/{hour}</link>"
+            f"<pubDate>Fri, 21 Nov 2025 {hour}:00:00 GMT</pubDate>"
+            f"<description>Post published at {hour}</description></item>"
+            for hour in (9, 12, 11, 10)
+        )
+        pinned = f"<rss version=\"2.0\"><channel>{items}</channel></rss>".encode()
+        checkpoint = datetime(2025, 11, 21, 10, 30, 0, tzinfo=timezone.utc)
+
+        parsed = truth_social.parse_feed(pinned, checkpoint, ordered=True)
+
+        assert [entry.link for entry in parsed.entries] == ["https://example.com/12", "https://example.com/11"]
+        assert parsed.filtered["checkpoint"] == 2
+        assert parsed.out_of_order
+
+
+class TestParseExecutor:
+    """파싱 프로세스 풀 테스트 클래스"""
+
+    @pytest.fixture
+    def process_workers(self, monkeypatch):
+        monkeypatch.setitem(PARSER_CONFIG, "process_workers", 1)
+        yield
+        shutdown_parse_executor()
+
+    def test_start_uses_safe_start_method(self, process_workers):
+        """시작 시 fork가 아닌 방식으로 풀을 만들고 이후 같은 풀을 사용"""
+        executor = start_parse_executor()
+
+        expected = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        assert executor._mp_context.get_start_method() == expected
+        assert get_parse_executor(PARSER_CONFIG["min_offload_bytes"]) is executor
+        assert executor.submit(truth_social.parse_feed, FEED, None).result().entries
+
+    def test_invalid_start_method(self, process_workers, monkeypatch):
+        """fork 등 지원하지 않는 시작 방식은 예외"""
+        monkeypatch.setitem(PARSER_CONFIG, "start_method", "fork")
+
+        with pytest.raises(ValueError):
+            start_parse_executor()
+
+    def test_disabled(self, monkeypatch):
+        """process_workers가 0이면 풀을 만들지 않음"""
+        monkeypatch.setitem(PARSER_CONFIG, "process_workers", 0)
+
+        assert start_parse_executor() is None
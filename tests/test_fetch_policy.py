@@ -0,0 +1,231 @@
+"""
+피드 요청 정책 테스트
+"""
+import asyncio
+import httpx
+import pytest
+from datetime import datetime, timezone
+from typing import List
+from src.collectors import base
+from src.collectors.dummy import DummyCollector
+from src.collectors.fetch_policy import CircuitBreaker, backoff_delay, parse_retry_after
+from config.http import FETCH_CONFIG
+
+FEED_URL = "https://example.com/feed"
+
+
+class _Clock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트 클래스"""
+
+    def test_opens_after_threshold(self):
+        """연속 실패가 임계값에 도달하면 열리고 cooldown 동안 요청 생략"""
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=60, clock=clock)
+
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is True
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow_request() is False
+
+        clock.now = 30
+        assert breaker.allow_request() is False
+        assert breaker.remaining_cooldown() == 30
+
+    def test_success_resets_failures(self):
+        """성공하면 연속 실패 횟수 초기화"""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+        breaker.record_failure()
+        breaker.record_success()
+
+        assert breaker.record_failure() is False
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_after_cooldown(self):
+        """cooldown 후 시험 요청: 성공하면 닫히고, 실패하면 다시 열림"""
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 60
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        assert breaker.record_failure() is True
+        assert breaker.allow_request() is False
+
+        clock.now = 120
+        assert breaker.allow_request() is True
+        assert breaker.record_success() is True
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_invalid_threshold(self):
+        """실패 임계값이 1 미만이면 예외"""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0, cooldown_seconds=60)
+
+
+class TestRetryDelay:
+    """재시도 지연 테스트 클래스"""
+
+    def test_retry_after_seconds(self):
+        """Retry-After 초 단위 값"""
+        assert parse_retry_after("120") == 120.0
+
+    def test_retry_after_http_date(self):
+        """Retry-After HTTP-date 값은 기준 시각과의 차이"""
+        now = datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Fri, 21 Nov 2025 10:00:30 GMT", now=now) == 30.0
+        assert parse_retry_after("Fri, 21 Nov 2025 09:59:00 GMT", now=now) == 0.0
+
+    def test_retry_after_invalid(self):
+        """없거나 해석할 수 없는 값은 None"""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_backoff_within_bounds(self):
+        """지연은 0 ~ min(max, base * 2^attempt) 범위"""
+        for attempt in range(6):
+            delay = backoff_delay(attempt, base_seconds=0.5, max_seconds=5.0)
+            assert 0 <= delay <= min(5.0, 0.5 * 2 ** attempt)
+
+
+class ScriptedTransport(httpx.MockTransport):
+    """미리 정한 응답(또는 연결 오류)을 순서대로 돌려주는 transport"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.requests: List[httpx.Request] = []
+        super().__init__(self.respond)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestFetch:
+    """BaseCollector._fetch / _fetch_async 테스트 클래스 (sync / async 공통)"""
+
+    @pytest.fixture(params=["sync", "async"])
+    def fetch(self, request, monkeypatch):
+        """transport로 요청하는 fetch(collector, transport) 함수"""
+        if request.param == "async":
+            async def fetch_async(collector, transport):
+                async with httpx.AsyncClient(transport=transport) as client:
+                    return await collector._fetch_async(client, FEED_URL, {})
+
+            return lambda collector, transport: asyncio.run(fetch_async(collector, transport))
+
+        def fetch_sync(collector, transport):
+            with httpx.Client(transport=transport) as client:
+                monkeypatch.setattr(httpx, "get", lambda url, **kwargs: client.get(url, **kwargs))
+                return collector._fetch(FEED_URL, {})
+
+        return fetch_sync
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """재시도 대기 시간 기록 (실제로 대기하지 않음)"""
+        sleeps = []
+
+        async def sleep_async(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        monkeypatch.setattr(base.asyncio, "sleep", sleep_async)
+        return sleeps
+
+    @pytest.fixture
+    def collector(self):
+        return DummyCollector()
+
+    def test_retry_then_success(self, fetch, collector, sleeps):
+        """5xx / 연결 오류는 백오프 후 재시도하고 성공하면 서킷 유지"""
+        transport = ScriptedTransport(
+            httpx.ConnectError("연결 실패"), httpx.Response(503), httpx.Response(200, text="ok")
+        )
+
+        response = fetch(collector, transport)
+
+        assert response.status_code == 200
+        assert len(transport.requests) == 3
+        assert len(sleeps) == 2
+        assert all(0 <= delay <= FETCH_CONFIG["backoff_max_seconds"] for delay in sleeps)
+        assert collector.circuit_breaker.consecutive_failures == 0
+
+    def test_honours_retry_after(self, fetch, collector, sleeps):
+        """429의 Retry-After 값만큼 대기 후 재시도"""
+        transport = ScriptedTransport(httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200))
+
+        assert fetch(collector, transport).status_code == 200
+        assert sleeps == [7.0]
+
+    def test_retry_after_too_long(self, fetch, collector, sleeps):
+        """Retry-After가 상한보다 길면 재시도하지 않고 실패로 기록"""
+        retry_after = str(int(FETCH_CONFIG["retry_after_max_seconds"]) + 1)
+        transport = ScriptedTransport(httpx.Response(429, headers={"Retry-After": retry_after}))
+
+        assert fetch(collector, transport).status_code == 429
+        assert len(transport.requests) == 1
+        assert sleeps == []
+        assert collector.circuit_breaker.consecutive_failures == 1
+
+    def test_gives_up_after_max_retries(self, fetch, collector, sleeps):
+        """재시도를 소진하면 마지막 응답을 돌려주고 서킷 브레이커에 실패 1회 기록"""
+        transport = ScriptedTransport(httpx.Response(503))
+
+        assert fetch(collector, transport).status_code == 503
+        assert len(transport.requests) == FETCH_CONFIG["max_retries"] + 1
+        assert collector.circuit_breaker.consecutive_failures == 1
+
+    def test_gives_up_on_connection_error(self, fetch, collector, sleeps):
+        """재시도를 소진한 연결 오류는 예외로 전달"""
+        transport = ScriptedTransport(httpx.ConnectError("연결 실패"))
+
+        with pytest.raises(httpx.ConnectError):
+            fetch(collector, transport)
+        assert len(transport.requests) == FETCH_CONFIG["max_retries"] + 1
+
+    @pytest.mark.parametrize("status_code", [404, 410])
+    def test_persistent_4xx_opens_breaker(self, fetch, collector, sleeps, status_code):
+        """사라진 피드(404 / 410)는 재시도하지 않지만 실패로 세어 서킷을 엶"""
+        transport = ScriptedTransport(httpx.Response(status_code))
+
+        for _ in range(FETCH_CONFIG["breaker_failure_threshold"]):
+            assert fetch(collector, transport).status_code == status_code
+
+        assert len(transport.requests) == FETCH_CONFIG["breaker_failure_threshold"]
+        assert sleeps == []
+        assert collector.circuit_breaker.state == CircuitBreaker.OPEN
+
+    def test_not_modified_is_success(self, fetch, collector, sleeps):
+        """304는 성공으로 기록"""
+        collector.circuit_breaker.record_failure()
+        transport = ScriptedTransport(httpx.Response(304))
+
+        assert fetch(collector, transport).status_code == 304
+        assert collector.circuit_breaker.consecutive_failures == 0
+
+    def test_open_breaker_skips_fetch(self, fetch, collector, sleeps):
+        """서킷이 열려 있으면 요청하지 않고 None"""
+        for _ in range(FETCH_CONFIG["breaker_failure_threshold"]):
+            collector.circuit_breaker.record_failure()
+        transport = ScriptedTransport(httpx.Response(200))
+
+        assert fetch(collector, transport) is None
+        assert transport.requests == []
@@ -0,0 +1,78 @@
+"""
+html_cleaner 테스트 - 기존 BeautifulSoup 구현과 결과 비교
+"""
+import random
+import pytest
+from benchmarks.bench_html_cleaner import (
+    clean_html_beautifulsoup,
+    make_truth_social_post,
+    make_white_house_article,
+)
+from src.collectors.html_cleaner import clean_html
+
+
+class TestCleanHtml:
+    """clean_html 테스트 클래스"""
+
+    @pytest.mark.parametrize("html_content", [
+        "",
+        "plain  text\n here",
+        "<p>Hello  <b>World</b></p>",
+        "Hello<b>World</b>",
+        "<p>one<br>two</p>",
+        "<p>x</p>\n\n<p>y</p>",
+        "x<!-- comment -->y",
+        "<!DOCTYPE html>w",
+        "<![CDATA[zz]]>q",
+        "a &amp; b &nbsp;c &#39;d",
+        "a < b > c",
+        "<p>a</p><script>var x = 1;</script><style>p {}</style>b",
+        "<template><p>x</p></template>u",
+        "<div><template></div>after",
+        "a<br></br>b",
+        make_truth_social_post(),
+        make_white_house_article(paragraphs=5),
+    ])
+    def test_same_as_beautifulsoup(self, html_content):
+        """BeautifulSoup get_text + 공백 정규화와 같은 결과"""
+        assert clean_html(html_content) == clean_html_beautifulsoup(html_content)
+
+    @pytest.mark.parametrize("html_content", [
+        # 세미콜론 없는 / 알 수 없는 이름 참조
+        "x &notanentity; y",
+        "x &not y",
+        "&amp",
+        "a &ampx b",
+        "&copy2025",
+        "&nbsp",
+        "&Amp; &AMP;",
+        "AT&T",
+        "x&y",
+        "<p>Tom &amp Jerry &copy; 2025 &reg</p>",
+        "<p>&unknown;entity</p>",
+        # 숫자 참조
+        "&#x41;&#65",
+        "&#X4A;&#x4a;",
+        "&#65a &#x41g;",
+        "&#0; &#xD800; &#x110000; &#99999999999;",
+        "&#128; &#x81; &#150; &#1;",
+        "a&#;b &#x; &# b",
+        # 참조가 많은 본문
+        "&lt;p&gt;&quot;quoted&quot; &amp;amp; &apos;s&lt;/p&gt;",
+        "&hellip;&mdash;&rsquo;&#8217;s &#x2019;",
+        "<p>a &lt; b &amp;&amp; c &gt; d</p><p>&#x1F600;&nbsp;&nbsp;done</p>",
+    ])
+    def test_entities_same_as_beautifulsoup(self, html_content):
+        """문자 참조 처리도 BeautifulSoup(html.parser)과 같은 결과"""
+        assert clean_html(html_content) == clean_html_beautifulsoup(html_content)
+
+    def test_random_markup_same_as_beautifulsoup(self):
+        """태그 / 참조 조각을 무작위로 이어 붙인 입력도 같은 결과"""
+        fragments = [
+            "&", "#", "x", ";", "amp", "not", "lt", "65", "4A", "a", " ", "<p>", "</p>",
+            "<b>", "</b>", "<br>", "<!--", "-->", "<script>", "</script>", "&#", "&amp;",
+        ]
+        rng = random.Random(0)
+        for _ in range(2000):
+            html_content = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            assert clean_html(html_content) == clean_html_beautifulsoup(html_content), html_content
@@ -0,0 +1,133 @@
+"""
+메시지 codec 테스트
+"""
+import json
+import pytest
+from datetime import datetime, timezone
+from src.infrastructure.message_codec import (
+    decode_message,
+    encode_message,
+    get_codec,
+    get_compressor,
+    resolve_references,
+)
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
+
+MESSAGE = RawData(
+    id=1,
+    content="트럼프 발언 Hello World",
+    link="https://example.com/1",
+    published_at=datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc),
+    channel=Channel.DUMMY,
+).to_dict()
+
+
+class TestMessageCodec:
+    """메시지 codec 테스트 클래스"""
+
+    @pytest.mark.parametrize("codec_name", ["json", "orjson", "msgpack"])
+    def test_round_trip(self, codec_name):
+        """인코딩한 메시지를 같은 값으로 디코딩"""
+        if codec_name != "json":
+            pytest.importorskip(codec_name)
+
+        fields = encode_message(MESSAGE, get_codec(codec_name))
+
+        assert fields["v"] == "1"
+        assert fields["codec"] == codec_name
+        assert decode_message(fields) == MESSAGE
+
+    def test_decode_bytes_fields(self):
+        """decode_responses=False로 읽은 bytes 필드도 디코딩"""
+        fields = encode_message(MESSAGE, get_codec("json"))
+        raw_fields = {key.encode(): value.encode() for key, value in fields.items()}
+
+        assert decode_message(raw_fields) == MESSAGE
+
+    def test_decode_legacy_message(self):
+        """버전 필드가 없는 이전 형식은 JSON으로 디코딩"""
+        assert decode_message({"data": json.dumps(MESSAGE, ensure_ascii=False)}) == MESSAGE
+
+    def test_unknown_codec(self):
+        """알 수 없는 codec은 ValueError"""
+        with pytest.raises(ValueError):
+            get_codec("xml")
+
+
+class TestCompression:
+    """payload 압축 테스트 클래스"""
+
+    @pytest.mark.parametrize("compression", ["zlib", "zstd"])
+    def test_round_trip(self, compression):
+        """임계 크기 이상 payload는 압축 후 같은 값으로 디코딩"""
+        if compression == "zstd":
+            pytest.importorskip("zstandard")
+
+        message = dict(MESSAGE, content="트럼프 발언 " * 1000)
+        fields = encode_message(message, get_codec("json"), get_compressor(compression), 1024)
+
+        assert fields["compression"] == compression
+        assert len(fields["data"]) < len(json.dumps(message, ensure_ascii=False).encode())
+        assert decode_message(fields) == message
+
+    def test_below_threshold_not_compressed(self):
+        """임계 크기 미만 payload는 압축하지 않음"""
+        fields = encode_message(MESSAGE, get_codec("json"), get_compressor("zlib"), 4096)
+
+        assert "compression" not in fields
+        assert decode_message(fields) == MESSAGE
+
+    def test_unknown_compression(self):
+        """알 수 없는 압축 방식은 ValueError"""
+        with pytest.raises(ValueError):
+            get_compressor("lz4")
+
+
+class TestReferenceMode:
+    """참조 모드 테스트 클래스"""
+
+    class _Database:
+        """get_raw_data_by_ids()만 제공하는 조회용 Database"""
+
+        def __init__(self, records):
+            self.records = {record.id: record for record in records}
+            self.calls = []
+
+        def get_raw_data_by_ids(self, ids):
+            self.calls.append(list(ids))
+            return {id: self.records[id] for id in ids if id in self.records}
+
+    def test_reference_message_has_no_content(self):
+        """참조 모드 메시지는 content 없이 id와 메타데이터만 포함"""
+        fields = encode_message(MESSAGE, get_codec("json"), reference=True)
+
+        assert fields["ref"] == "1"
+        assert "content" not in json.loads(fields["data"])
+
+        message = decode_message(fields)
+        assert message["content"] is None
+        assert message["id"] == MESSAGE["id"]
+        assert message["link"] == MESSAGE["link"]
+
+    def test_resolve_references(self):
+        """참조 메시지의 content를 한 번의 일괄 조회로 채움"""
+        record = RawRecord(
+            content=MESSAGE["content"],
+            link=MESSAGE["link"],
+            published_at=datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc),
+            channel=Channel.DUMMY,
+            id=MESSAGE["id"],
+        )
+        database = self._Database([record])
+        messages = [
+            decode_message(encode_message(MESSAGE, get_codec("json"), reference=True)),
+            decode_message(encode_message(dict(MESSAGE, id=2), get_codec("json"), reference=True)),
+        ]
+
+        resolved = resolve_references(messages, database)
+
+        assert database.calls == [[1, 2]]
+        assert resolved[0] == MESSAGE
+        assert resolved[1]["content"] is None
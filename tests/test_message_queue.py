@@ -0,0 +1,91 @@
+"""
+MessageQueue 일괄 발행 테스트 (fakeredis)
+"""
+import pytest
+import redis
+from datetime import datetime, timezone
+from src.infrastructure.message_codec import decode_message
+from src.infrastructure.message_queue import MessageQueue
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+from config.redis import STREAM_CONFIG
+
+
+def make_raw_data(index: int) -> RawData:
+    """테스트용 RawData"""
+    return RawData(
+        id=index,
+        content=f"트럼프 발언 테스트 {index}",
+        link=f"https://example.com/{index}",
+        published_at=datetime(2025, 11, 21, 10, index, 0, tzinfo=timezone.utc),
+        channel=Channel.DUMMY,
+    )
+
+
+def record_state(pipe):
+    """발행 후 상태 기록 콜백"""
+    pipe.set("checkpoint:dummy", "done")
+
+
+class TestPublishBatch:
+    """MessageQueue.publish_batch 테스트 클래스"""
+
+    @pytest.fixture
+    def message_queue(self, redis_client):
+        return MessageQueue(redis_client)
+
+    def test_publish_then_record_state(self, message_queue, redis_client):
+        """모든 메시지를 입력 순서로 발행한 뒤 상태 기록"""
+        batch = [make_raw_data(index) for index in range(3)]
+
+        message_ids = message_queue.publish_batch(batch, after_publish=record_state)
+
+        entries = redis_client.xrange(message_queue.stream_name)
+        assert [entry_id for entry_id, _ in entries] == message_ids
+        assert [decode_message(fields)["id"] for _, fields in entries] == [0, 1, 2]
+        assert redis_client.get("checkpoint:dummy") == "done"
+
+    def test_failed_xadd_skips_state(self, message_queue, redis_client):
+        """XADD가 실패하면 상태(Checkpoint 등)를 기록하지 않음"""
+        # 스트림 키를 문자열로 만들어 XADD가 WRONGTYPE으로 실패하게 함
+        redis_client.set(message_queue.stream_name, "not a stream")
+
+        with pytest.raises(redis.ResponseError):
+            message_queue.publish_batch([make_raw_data(1)], after_publish=record_state)
+
+        assert redis_client.get("checkpoint:dummy") is None
+
+    def test_state_only(self, message_queue, redis_client):
+        """발행할 메시지가 없어도 상태는 기록 (outbox 모드)"""
+        assert message_queue.publish_batch([], after_publish=record_state) == []
+
+        assert redis_client.exists(message_queue.stream_name) == 0
+        assert redis_client.get("checkpoint:dummy") == "done"
+
+
+class TestRetention:
+    """스트림 보존 정책 테스트 클래스"""
+
+    def test_default_keeps_unread_messages(self, redis_client):
+        """기본값(none)은 소비자 그룹이 읽지 않은 메시지를 트리밍하지 않음"""
+        message_queue = MessageQueue(redis_client)
+        redis_client.xgroup_create(message_queue.stream_name, "slow-group", id="0", mkstream=True)
+
+        message_queue.publish_batch([make_raw_data(index) for index in range(5)])
+
+        assert message_queue.trim() == 0
+        assert redis_client.xlen(message_queue.stream_name) == 5
+        assert len(redis_client.xreadgroup("slow-group", "consumer", {message_queue.stream_name: ">"})[0][1]) == 5
+
+    def test_maxlen_drops_unread_messages(self, redis_client, monkeypatch):
+        """maxlen 트리밍은 읽지 않은 메시지도 제거 (켜기 전 lag 확인 필요)"""
+        monkeypatch.setitem(STREAM_CONFIG, "retention", "maxlen")
+        monkeypatch.setitem(STREAM_CONFIG, "maxlen", 2)
+        message_queue = MessageQueue(redis_client)
+        redis_client.xgroup_create(message_queue.stream_name, "slow-group", id="0", mkstream=True)
+
+        # 근사(~) 트리밍은 내부 노드(100개) 단위로 제거하므로 그보다 많이 발행
+        message_queue.publish_batch([make_raw_data(1)] * 300)
+
+        assert redis_client.xlen(message_queue.stream_name) < 300
+        assert len(redis_client.xreadgroup("slow-group", "consumer", {message_queue.stream_name: ">"})[0][1]) < 300
@@ -0,0 +1,553 @@
+"""
+Orchestrator 저장 / 발행 흐름 테스트 (fakeredis)
+"""
+import asyncio
+import threading
+import httpx
+import pytest
+import redis
+from datetime import datetime, timezone
+from prometheus_client import REGISTRY
+from typing import Dict, List
+from src.collectors.dummy import DummyCollector
+from src.collectors.truth_social import TruthSocialCollector
+from src.collectors.white_house import WhiteHouseCollector
+from src.infrastructure.dedup_index import DedupIndex
+from src.infrastructure.message_codec import decode_message
+from src.infrastructure.message_queue import MessageQueue
+from src.infrastructure.state_store import StateStore
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+from src.models.raw_record import RawRecord
+from src.orchestrator import Orchestrator
+from config.redis import CHECKPOINT_CONFIG
+from config.scheduler import SCHEDULER_CONFIG
+
+
+class UniqueHashDatabase:
+    """content_hash unique 인덱스를 흉내 내는 Database 대체"""
+
+    def __init__(self):
+        self.ids_by_hash: Dict[str, int] = {}
+
+    def save_raw_data_batch(self, raw_data_list: List[RawData]) -> List[RawData]:
+        saved_data = []
+        for raw_data in raw_data_list:
+            content_hash = raw_data.content_hash()
+            if content_hash in self.ids_by_hash:
+                continue
+            raw_data.id = len(self.ids_by_hash) + 1
+            self.ids_by_hash[content_hash] = raw_data.id
+            saved_data.append(raw_data)
+        return saved_data
+
+    def get_raw_data_ids_by_hash(self, content_hashes: List[str]) -> Dict[str, int]:
+        return {h: self.ids_by_hash[h] for h in content_hashes if h in self.ids_by_hash}
+
+
+def make_raw_data(index: int) -> RawData:
+    """테스트용 RawData (같은 index면 같은 content_hash)"""
+    return RawData(
+        content=f"트럼프 발언 테스트 {index}",
+        link=f"https://example.com/{index}",
+        published_at=datetime(2025, 11, 21, 10, index, 0, tzinfo=timezone.utc),
+        channel=Channel.DUMMY,
+    )
+
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><link>https://example.com/1</link><pubDate>Fri, 21 Nov 2025 11:00:00 GMT</pubDate>
+<description>&lt;p&gt;First post with enough text&lt;/p&gt;</description></item>
+</channel></rss>
+"""
+ETAG = '"feed-v1"'
+LAST_MODIFIED = "Fri, 21 Nov 2025 11:00:00 GMT"
+
+
+def published_ids(redis_client, message_queue) -> List[int]:
+    """스트림에 발행된 raw_data id 목록"""
+    return [decode_message(fields)["id"] for _, fields in redis_client.xrange(message_queue.stream_name)]
+
+
+class BarrierCollector(DummyCollector):
+    """다른 Collector와 동시에 실행되어야 수집을 마치는 Collector"""
+
+    def __init__(self, channel: Channel, barrier: threading.Barrier):
+        self.channel = channel
+        self.barrier = barrier
+        super().__init__()
+
+    def collect_raw_data(self, checkpoint):
+        # 순차 실행이면 다른 Collector가 도착하지 않아 BrokenBarrierError
+        self.barrier.wait()
+        return [
+            RawData(
+                content=f"{self.channel.value} 발언",
+                link=f"https://example.com/{self.channel.value}",
+                published_at=datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc),
+                channel=self.channel,
+            )
+        ]
+
+    def get_channel(self) -> Channel:
+        return self.channel
+
+
+class FailingCollector(DummyCollector):
+    """수집 중 예외를 던지는 Collector"""
+
+    def collect_raw_data(self, checkpoint):
+        raise RuntimeError("수집 실패")
+
+
+class AsyncChannelCollector(DummyCollector):
+    """공유 HTTP 클라이언트와 동시 실행 수를 기록하는 비동기 Collector"""
+
+    def __init__(self, channel: Channel, activity: Dict):
+        self.channel = channel
+        self.activity = activity
+        super().__init__()
+
+    async def collect_raw_data_async(self, checkpoint, client):
+        self.activity["clients"].append(client)
+        self.activity["active"] += 1
+        self.activity["max_active"] = max(self.activity["max_active"], self.activity["active"])
+        await asyncio.sleep(0.05)
+        self.activity["active"] -= 1
+        return []
+
+    def get_channel(self) -> Channel:
+        return self.channel
+
+
+class FeedServer:
+    """ETag가 같으면 304, 아니면 FEED를 돌려주는 RSS 서버 (요청 헤더 기록)"""
+
+    def __init__(self):
+        self.requests: List[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == ETAG:
+            return httpx.Response(304)
+        return httpx.Response(200, content=FEED, headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED})
+
+
+class TestPublishAfterCommit:
+    """DB 커밋 후 발행 실패 복구 테스트 클래스"""
+
+    @pytest.fixture
+    def database(self):
+        return UniqueHashDatabase()
+
+    @pytest.fixture
+    def message_queue(self, redis_client):
+        return MessageQueue(redis_client)
+
+    @pytest.fixture
+    def orchestrator(self, redis_client, database, message_queue):
+        return Orchestrator(
+            state_store=StateStore(redis_client, write_behind=False),
+            database=database,
+            message_queue=message_queue,
+            dedup_index=DedupIndex(redis_client),
+        )
+
+    def test_republish_after_failed_publish(self, orchestrator, redis_client, message_queue, database):
+        """커밋 후 발행이 실패하면 다음 실행에서 중복 항목을 기존 id로 발행"""
+        # 스트림 키를 문자열로 만들어 XADD가 실패하게 함
+        redis_client.set(message_queue.stream_name, "not a stream")
+        with pytest.raises(redis.ResponseError):
+            orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1), make_raw_data(2)])
+
+        assert len(database.ids_by_hash) == 2
+        assert orchestrator.state_store.get_checkpoint(Channel.DUMMY) is None
+
+        # 다음 실행: 같은 항목 + 새 항목 수집
+        redis_client.delete(message_queue.stream_name)
+        orchestrator._store_and_publish(
+            Channel.DUMMY, None, [make_raw_data(1), make_raw_data(2), make_raw_data(3)]
+        )
+
+        assert published_ids(redis_client, message_queue) == [1, 2, 3]
+        assert orchestrator.state_store.get_checkpoint(Channel.DUMMY) == make_raw_data(3).published_at
+
+    def test_published_duplicates_not_republished(self, orchestrator, redis_client, message_queue):
+        """발행까지 끝난 항목은 다시 수집되어도 발행하지 않음"""
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1), make_raw_data(2)])
+
+        assert published_ids(redis_client, message_queue) == [1, 2]
+
+    def test_hot_path_uses_records(self, orchestrator, database, monkeypatch):
+        """수집된 RawData는 저장 / 발행 전에 RawRecord로 변환"""
+        saved_batches = []
+        save_raw_data_batch = database.save_raw_data_batch
+        monkeypatch.setattr(
+            database, "save_raw_data_batch", lambda batch: saved_batches.append(batch) or save_raw_data_batch(batch)
+        )
+
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+
+        assert all(isinstance(record, RawRecord) for record in saved_batches[0])
+
+    def test_expired_dedup_keys_not_republished(self, orchestrator, redis_client, message_queue):
+        """중복 제거 키가 만료 / 유실되어도 발행이 끝난 DB 중복은 다시 발행하지 않음"""
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+        for key in redis_client.keys("dedup:*"):
+            redis_client.delete(key)
+
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1), make_raw_data(2)])
+
+        assert published_ids(redis_client, message_queue) == [1, 2]
+
+    def test_no_dedup_index_not_republished(self, redis_client, database, message_queue):
+        """중복 제거 인덱스가 없으면 발행 여부를 알 수 없으므로 DB 중복은 다시 발행하지 않음"""
+        orchestrator = Orchestrator(
+            state_store=StateStore(redis_client, write_behind=False),
+            database=database,
+            message_queue=message_queue,
+        )
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1), make_raw_data(2)])
+
+        assert published_ids(redis_client, message_queue) == [1, 2]
+
+    def test_pending_marker_cleared_after_publish(self, orchestrator, redis_client):
+        """발행이 끝나면 DB 중복을 포함한 모든 저장 시도 항목의 발행 대기 표시를 지움"""
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+        redis_client.delete(f"dedup:{make_raw_data(1).content_hash()}")
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+
+        assert redis_client.keys("dedup:pending:*") == []
+        assert redis_client.exists(f"dedup:{make_raw_data(1).content_hash()}") == 1
+
+    def test_batch_duplicate_published_once(self, redis_client, database, message_queue):
+        """중복 제거 인덱스가 없어도 배치 내 중복은 한 번만 발행"""
+        orchestrator = Orchestrator(
+            state_store=StateStore(redis_client, write_behind=False),
+            database=database,
+            message_queue=message_queue,
+        )
+
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1), make_raw_data(1)])
+
+        assert published_ids(redis_client, message_queue) == [1]
+
+
+class TestScheduledCheckpoints:
+    """스케줄 실행 경로의 Checkpoint 조회 테스트 클래스"""
+
+    def test_start_prefetches_checkpoints(self, redis_client, monkeypatch):
+        """start()는 작업 등록 전에 모든 채널의 Checkpoint를 한 번에 조회"""
+        state_store = StateStore(redis_client, write_behind=False)
+        state_store.foreign_cache_ttl_seconds = 60
+        orchestrator = Orchestrator(
+            collectors=[DummyCollector()],
+            state_store=state_store,
+            database=UniqueHashDatabase(),
+            message_queue=MessageQueue(redis_client),
+        )
+        monkeypatch.setattr(orchestrator.scheduler, "start", lambda: None)
+        redis_client.set(f"checkpoint:{Channel.DUMMY.value}", "2025-11-21T10:00:00+00:00")
+
+        orchestrator.start()
+
+        # 일괄 조회 결과를 첫 수집에서 재사용 (Redis를 다시 조회하지 않음)
+        redis_client.delete(f"checkpoint:{Channel.DUMMY.value}")
+        assert state_store.get_checkpoint(Channel.DUMMY) == datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc)
+
+
+class TestWriteBehindCheckpoint:
+    """쓰기 지연 모드 Checkpoint 흐름 테스트 클래스"""
+
+    @pytest.fixture
+    def orchestrator(self, redis_client):
+        return Orchestrator(
+            collectors=[DummyCollector()],
+            state_store=StateStore(redis_client, write_behind=True),
+            database=UniqueHashDatabase(),
+            message_queue=MessageQueue(redis_client),
+        )
+
+    def test_checkpoint_written_on_flush(self, orchestrator, redis_client):
+        """발행 후 Checkpoint는 기록 대기에 추가되고 flush()에서 Redis에 기록"""
+        orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+
+        assert redis_client.get(f"checkpoint:{Channel.DUMMY.value}") is None
+        orchestrator.state_store.flush()
+        assert redis_client.get(f"checkpoint:{Channel.DUMMY.value}") == make_raw_data(1).published_at.isoformat()
+
+    def test_failed_publish_not_pending(self, orchestrator, redis_client):
+        """발행이 실패하면 Checkpoint를 기록 대기에 추가하지 않음"""
+        redis_client.set(orchestrator.message_queue.stream_name, "not a stream")
+        with pytest.raises(redis.ResponseError):
+            orchestrator._store_and_publish(Channel.DUMMY, None, [make_raw_data(1)])
+
+        orchestrator.state_store.flush()
+        assert redis_client.get(f"checkpoint:{Channel.DUMMY.value}") is None
+
+    def test_start_registers_flush_job(self, orchestrator, monkeypatch):
+        """start()는 flush_interval_seconds마다 실행되는 기록 작업을 등록"""
+        monkeypatch.setattr(orchestrator.scheduler, "start", lambda: None)
+
+        orchestrator.start()
+
+        job = orchestrator.scheduler.get_job("checkpoint_flush_job")
+        assert job is not None
+        assert job.trigger.interval.total_seconds() == CHECKPOINT_CONFIG["flush_interval_seconds"]
+
+    def test_invalid_flush_interval(self, redis_client, monkeypatch):
+        """쓰기 지연 모드에서 기록 주기가 1 미만이면 예외"""
+        monkeypatch.setitem(CHECKPOINT_CONFIG, "flush_interval_seconds", 0)
+
+        with pytest.raises(ValueError):
+            Orchestrator(state_store=StateStore(redis_client, write_behind=True))
+
+
+class TestConcurrentRun:
+    """run()의 Collector 병렬 실행 테스트 클래스"""
+
+    @pytest.fixture
+    def create_orchestrator(self, redis_client):
+        def create(collectors):
+            return Orchestrator(
+                collectors=collectors,
+                state_store=StateStore(redis_client, write_behind=False),
+                database=UniqueHashDatabase(),
+                message_queue=MessageQueue(redis_client),
+            )
+        return create
+
+    def test_collectors_run_concurrently(self, create_orchestrator, redis_client, monkeypatch):
+        """모든 Collector 파이프라인이 동시에 실행되어 각 채널을 발행"""
+        monkeypatch.setitem(SCHEDULER_CONFIG, "max_workers", 2)
+        barrier = threading.Barrier(2, timeout=5)
+        orchestrator = create_orchestrator(
+            [BarrierCollector(Channel.TRUTH_SOCIAL, barrier), BarrierCollector(Channel.WHITE_HOUSE, barrier)]
+        )
+
+        orchestrator.run()
+
+        assert not barrier.broken
+        for channel in (Channel.TRUTH_SOCIAL, Channel.WHITE_HOUSE):
+            assert orchestrator.state_store.get_checkpoint(channel) is not None
+        assert redis_client.xlen(orchestrator.message_queue.stream_name) == 2
+
+    def test_failure_isolated_per_channel(self, create_orchestrator, redis_client):
+        """한 채널의 실패가 다른 채널의 수집 / 발행을 막지 않음"""
+        orchestrator = create_orchestrator(
+            [FailingCollector(), BarrierCollector(Channel.WHITE_HOUSE, threading.Barrier(1))]
+        )
+
+        orchestrator.run()
+
+        assert orchestrator.state_store.get_checkpoint(Channel.DUMMY) is None
+        assert orchestrator.state_store.get_checkpoint(Channel.WHITE_HOUSE) is not None
+        assert redis_client.xlen(orchestrator.message_queue.stream_name) == 1
+
+
+class TestRunAsync:
+    """run_async()의 공유 클라이언트 / 동시 실행 테스트 클래스"""
+
+    @pytest.fixture
+    def activity(self):
+        return {"clients": [], "active": 0, "max_active": 0}
+
+    @pytest.fixture
+    def orchestrator(self, redis_client, activity):
+        return Orchestrator(
+            collectors=[
+                AsyncChannelCollector(Channel.TRUTH_SOCIAL, activity),
+                AsyncChannelCollector(Channel.WHITE_HOUSE, activity),
+            ],
+            state_store=StateStore(redis_client, write_behind=False),
+            database=UniqueHashDatabase(),
+            message_queue=MessageQueue(redis_client),
+        )
+
+    def test_collectors_share_one_client(self, orchestrator, activity):
+        """모든 Collector가 이번 실행의 공유 HTTP 클라이언트를 받고, 실행이 끝나면 닫힘"""
+        asyncio.run(orchestrator.run_async())
+
+        first, second = activity["clients"]
+        assert isinstance(first, httpx.AsyncClient)
+        assert first is second
+        assert first.is_closed
+        assert orchestrator._http_client is None
+
+    def test_collectors_run_concurrently(self, orchestrator, activity, monkeypatch):
+        """동시 실행 수는 max_workers로 제한"""
+        monkeypatch.setitem(SCHEDULER_CONFIG, "max_workers", 2)
+        asyncio.run(orchestrator.run_async())
+        assert activity["max_active"] == 2
+
+        activity["max_active"] = 0
+        monkeypatch.setitem(SCHEDULER_CONFIG, "max_workers", 1)
+        asyncio.run(orchestrator.run_async())
+        assert activity["max_active"] == 1
+
+
+class TestConditionalRequests:
+    """조건부 요청 검증자(ETag / Last-Modified) 흐름 테스트 클래스"""
+
+    @pytest.fixture(params=[TruthSocialCollector, WhiteHouseCollector])
+    def collector(self, request):
+        return request.param()
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        server = FeedServer()
+        client = httpx.Client(transport=httpx.MockTransport(server.handle))
+        monkeypatch.setattr(httpx, "get", lambda url, **kwargs: client.get(url, **kwargs))
+        return server
+
+    @pytest.fixture
+    def message_queue(self, redis_client):
+        return MessageQueue(redis_client)
+
+    @pytest.fixture
+    def create_orchestrator(self, redis_client, message_queue, collector):
+        def create():
+            return Orchestrator(
+                collectors=[collector],
+                state_store=StateStore(redis_client, write_behind=False),
+                database=UniqueHashDatabase(),
+                message_queue=message_queue,
+                dedup_index=DedupIndex(redis_client),
+            )
+        return create
+
+    def test_not_modified_returns_no_entries(self, collector):
+        """304 응답은 파싱 없이 빈 결과이고 검증자를 바꾸지 않음"""
+        collector.validators = {"etag": ETAG}
+
+        assert collector._parse_response(httpx.Response(304), None) == []
+        assert collector.commit_validators() is None
+        assert collector.validators == {"etag": ETAG}
+
+    def test_validators_sent_on_next_run(self, create_orchestrator, server, collector, redis_client, message_queue):
+        """발행 후 저장된 검증자를 다음 실행(재시작 포함)의 요청 헤더로 보냄"""
+        assert create_orchestrator()._run_collector(collector) == 1
+        assert "If-None-Match" not in server.requests[0].headers
+
+        state_store = StateStore(redis_client, write_behind=False)
+        assert state_store.get_validators(collector.get_channel()) == {"etag": ETAG, "last_modified": LAST_MODIFIED}
+
+        # 새 Collector 인스턴스: StateStore에서 검증자 복원
+        collector.validators = {}
+        assert create_orchestrator()._run_collector(collector) == 0
+
+        headers = server.requests[1].headers
+        assert headers["If-None-Match"] == ETAG
+        assert headers["If-Modified-Since"] == LAST_MODIFIED
+        assert len(published_ids(redis_client, message_queue)) == 1
+
+    def test_validators_not_saved_when_publish_fails(
+        self, create_orchestrator, server, collector, redis_client, message_queue
+    ):
+        """발행이 실패하면 검증자를 저장하지 않아 다음 요청은 전체 피드를 다시 받음"""
+        orchestrator = create_orchestrator()
+        # 스트림 키를 문자열로 만들어 XADD가 실패하게 함
+        redis_client.set(message_queue.stream_name, "not a stream")
+        with pytest.raises(redis.ResponseError):
+            orchestrator._run_collector(collector)
+
+        assert orchestrator.state_store.get_validators(collector.get_channel()) == {}
+        assert collector.validators == {}
+
+        redis_client.delete(message_queue.stream_name)
+        assert orchestrator._run_collector(collector) == 1
+        assert "If-None-Match" not in server.requests[1].headers
+        assert len(published_ids(redis_client, message_queue)) == 1
+
+
+class TestChannelScheduling:
+    """채널별 수집 작업 등록 및 적응형 주기 테스트 클래스"""
+
+    @pytest.fixture
+    def orchestrator(self, redis_client, monkeypatch):
+        orchestrator = Orchestrator(
+            collectors=[TruthSocialCollector(), WhiteHouseCollector(), DummyCollector()],
+            state_store=StateStore(redis_client, write_behind=False),
+            database=UniqueHashDatabase(),
+            message_queue=MessageQueue(redis_client),
+        )
+        monkeypatch.setattr(orchestrator.scheduler, "start", lambda: None)
+        return orchestrator
+
+    def interval_seconds(self, orchestrator, channel: Channel) -> float:
+        """채널 수집 작업의 현재 주기 (초)"""
+        return orchestrator.scheduler.get_job(f"collect:{channel.value}").trigger.interval.total_seconds()
+
+    def test_job_per_channel(self, orchestrator):
+        """채널마다 독립된 작업을 Collector의 최소 주기로 등록 (지정 없으면 SCHEDULER_CONFIG)"""
+        orchestrator.start()
+
+        assert self.interval_seconds(orchestrator, Channel.TRUTH_SOCIAL) == 30
+        assert self.interval_seconds(orchestrator, Channel.WHITE_HOUSE) == 120
+        assert self.interval_seconds(orchestrator, Channel.DUMMY) == SCHEDULER_CONFIG["min_interval_seconds"]
+
+        interval = orchestrator.poll_intervals[Channel.WHITE_HOUSE]
+        assert (interval.min_seconds, interval.max_seconds) == (120, 1800)
+
+    def test_backoff_and_reset(self, orchestrator, monkeypatch):
+        """빈 수집(실패 포함)이면 해당 채널만 주기를 늘리고, 새 데이터가 나오면 최소 주기로 복귀"""
+        orchestrator.start()
+        collector = orchestrator.collectors[0]
+        factor = SCHEDULER_CONFIG["backoff_factor"]
+
+        monkeypatch.setattr(orchestrator, "_run_collector", lambda collector: 0)
+        orchestrator._run_scheduled(collector)
+        assert self.interval_seconds(orchestrator, Channel.TRUTH_SOCIAL) == 30 * factor
+
+        def fail(collector):
+            raise RuntimeError("수집 실패")
+
+        monkeypatch.setattr(orchestrator, "_run_collector", fail)
+        orchestrator._run_scheduled(collector)
+        assert self.interval_seconds(orchestrator, Channel.TRUTH_SOCIAL) == 30 * factor * factor
+
+        # 다른 채널 주기는 그대로
+        assert self.interval_seconds(orchestrator, Channel.WHITE_HOUSE) == 120
+
+        monkeypatch.setattr(orchestrator, "_run_collector", lambda collector: 3)
+        orchestrator._run_scheduled(collector)
+        assert self.interval_seconds(orchestrator, Channel.TRUTH_SOCIAL) == 30
+
+
+class TestCollectorMetrics:
+    """Collector 실행 메트릭 테스트 클래스"""
+
+    def sample(self, name: str, **labels) -> float:
+        """현재 메트릭 값 (기록 전이면 0)"""
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+
+    def test_run_records_metrics(self, redis_client, monkeypatch):
+        """수집 1회로 수집/저장/발행 건수가 증가하고 요청·파싱 시간이 기록됨"""
+        server = FeedServer()
+        client = httpx.Client(transport=httpx.MockTransport(server.handle))
+        monkeypatch.setattr(httpx, "get", lambda url, **kwargs: client.get(url, **kwargs))
+        collector = TruthSocialCollector()
+        orchestrator = Orchestrator(
+            collectors=[collector],
+            state_store=StateStore(redis_client, write_behind=False),
+            database=UniqueHashDatabase(),
+            message_queue=MessageQueue(redis_client),
+        )
+        names = [
+            "data_collection_items_collected_total",
+            "data_collection_items_saved_total",
+            "data_collection_items_published_total",
+            "data_collection_fetch_seconds_count",
+            "data_collection_parse_seconds_count",
+        ]
+        before = {name: self.sample(name, channel=Channel.TRUTH_SOCIAL.value) for name in names}
+
+        orchestrator._run_collector(collector)
+
+        after = {name: self.sample(name, channel=Channel.TRUTH_SOCIAL.value) for name in names}
+        assert {name: after[name] - before[name] for name in names} == dict.fromkeys(names, 1)
+        assert self.sample("data_collection_fetch_seconds_sum", channel=Channel.TRUTH_SOCIAL.value) > 0
@@ -0,0 +1,225 @@
+"""
+OutboxRelay / Database.drain_outbox 테스트
+
+Oracle 대신 SELECT ... FOR UPDATE SKIP LOCKED 동작을 흉내 내는 메모리 outbox를 사용합니다.
+"""
+import asyncio
+import pytest
+import redis
+from datetime import datetime
+from typing import Dict, List, Set
+from src.infrastructure import raw_data_sql as sql
+from src.infrastructure.database import Database
+from src.infrastructure.message_codec import decode_message
+from src.infrastructure.message_queue import MessageQueue
+from src.infrastructure.outbox_relay import OutboxRelay
+from src.logger import get_logger
+from src.models.channel import Channel
+
+
+class OutboxTable:
+    """raw_data_outbox + raw_data 행과 행 잠금"""
+
+    def __init__(self, count: int):
+        self.rows: Dict[int, tuple] = {
+            outbox_id: (
+                outbox_id,
+                outbox_id,  # raw_data id
+                f"트럼프 발언 테스트 {outbox_id}",
+                f"https://example.com/{outbox_id}",
+                datetime(2025, 11, 21, 10, outbox_id, 0),
+                Channel.DUMMY.value,
+            )
+            for outbox_id in range(1, count + 1)
+        }
+        self.locked: Set[int] = set()
+
+
+class FakeCursor:
+    """OUTBOX_CLAIM_SQL / OUTBOX_DELETE_SQL만 처리하는 cursor"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.arraysize = 100
+        self._candidates: List[int] = []
+
+    def execute(self, query, params=None, fetch_lobs=True):
+        assert query == sql.OUTBOX_CLAIM_SQL
+        self._candidates = sorted(self.connection.table.rows)
+
+    def fetchmany(self, size):
+        # SKIP LOCKED: 다른 트랜잭션이 잠근 행은 건너뛰고, fetch한 행만 잠금
+        table = self.connection.table
+        claimed = [outbox_id for outbox_id in self._candidates if outbox_id not in table.locked][:size]
+        table.locked.update(claimed)
+        self.connection.locked.update(claimed)
+        return [table.rows[outbox_id] for outbox_id in claimed]
+
+    def executemany(self, query, params):
+        assert query == sql.OUTBOX_DELETE_SQL
+        self.connection.deleted.update(param["id"] for param in params)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """트랜잭션 단위로 잠금과 삭제를 관리하는 connection"""
+
+    def __init__(self, table: OutboxTable):
+        self.table = table
+        self.locked: Set[int] = set()
+        self.deleted: Set[int] = set()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        for outbox_id in self.deleted:
+            del self.table.rows[outbox_id]
+        self._release()
+
+    def rollback(self):
+        self._release()
+
+    def close(self):
+        # pool 반환 시 미완료 트랜잭션은 롤백
+        self._release()
+
+    def _release(self):
+        self.table.locked -= self.locked
+        self.locked.clear()
+        self.deleted.clear()
+
+
+class FakePool:
+    """FakeConnection을 내주는 Connection Pool"""
+
+    def __init__(self, table: OutboxTable):
+        self.table = table
+
+    def acquire(self):
+        return FakeConnection(self.table)
+
+
+def create_database(table: OutboxTable) -> Database:
+    """Connection Pool만 바꾼 Database"""
+    database = Database.__new__(Database)
+    database.logger = get_logger("test_outbox_relay")
+    database.outbox_enabled = True
+    database._acquire_stats = sql.AcquireStats()
+    database._pool = FakePool(table)
+    return database
+
+
+def published_ids(redis_client, message_queue) -> List[int]:
+    """스트림에 발행된 raw_data id 목록"""
+    return [decode_message(fields)["id"] for _, fields in redis_client.xrange(message_queue.stream_name)]
+
+
+class TestDrainOutbox:
+    """Database.drain_outbox 테스트 클래스"""
+
+    @pytest.fixture
+    def message_queue(self, redis_client):
+        return MessageQueue(redis_client)
+
+    def test_publish_then_delete(self, redis_client, message_queue):
+        """잠근 행을 outbox 순서로 발행한 뒤 삭제"""
+        table = OutboxTable(3)
+        relay = OutboxRelay(create_database(table), message_queue, batch_size=10)
+
+        assert relay.run_once() == 3
+        assert published_ids(redis_client, message_queue) == [1, 2, 3]
+        assert table.rows == {}
+        assert table.locked == set()
+
+    def test_publish_failure_keeps_rows(self, redis_client, message_queue):
+        """발행이 실패하면 outbox 행을 남기고 잠금을 풀어 다음 실행에서 발행"""
+        table = OutboxTable(2)
+        relay = OutboxRelay(create_database(table), message_queue, batch_size=10)
+
+        redis_client.set(message_queue.stream_name, "not a stream")
+        with pytest.raises(redis.ResponseError):
+            relay.run_once()
+
+        assert sorted(table.rows) == [1, 2]
+        assert table.locked == set()
+
+        redis_client.delete(message_queue.stream_name)
+        assert relay.run_once() == 2
+        assert published_ids(redis_client, message_queue) == [1, 2]
+
+    def test_concurrent_relays_do_not_double_publish(self, redis_client, message_queue):
+        """다른 relay가 잠근 행은 건너뛰므로 같은 행을 두 번 발행하지 않음"""
+        table = OutboxTable(4)
+        database = create_database(table)
+        other = OutboxRelay(database, message_queue, batch_size=2)
+        other_counts = []
+
+        def publish_while_other_runs(records):
+            # 첫 relay가 행을 잠근 채 발행하는 동안 다른 relay가 실행됨
+            if not other_counts:
+                other_counts.append(database.drain_outbox(other._publish, 2))
+            message_queue.publish_batch(records)
+
+        assert database.drain_outbox(publish_while_other_runs, 2) == 2
+        assert other_counts == [2]
+        assert sorted(published_ids(redis_client, message_queue)) == [1, 2, 3, 4]
+        assert table.rows == {}
+
+
+class CountingOutbox:
+    """drain_outbox 호출 횟수를 세고 정해진 건수를 돌려주는 Database 대체"""
+
+    def __init__(self, counts: List[int]):
+        self.counts = counts
+        self.calls = 0
+
+    def drain_outbox(self, publish, batch_size: int) -> int:
+        count = self.counts[min(self.calls, len(self.counts) - 1)]
+        self.calls += 1
+        return count
+
+
+class CountingAsyncOutbox(CountingOutbox):
+    """AsyncDatabase 대체"""
+
+    async def drain_outbox(self, publish, batch_size: int) -> int:
+        return super().drain_outbox(publish, batch_size)
+
+
+class TestOutboxRelayLoop:
+    """OutboxRelay 배치 반복 테스트 클래스"""
+
+    def test_stops_on_partial_batch(self):
+        """batch_size보다 적게 처리하면 반복 종료"""
+        database = CountingOutbox([2, 2, 1])
+        relay = OutboxRelay(database, message_queue=None, batch_size=2)
+
+        assert relay.run_once() == 5
+        assert database.calls == 3
+
+    def test_stops_on_empty_batch(self):
+        """batch_size의 배수만큼 남아 있어도 빈 배치에서 종료"""
+        database = CountingOutbox([2, 2, 0])
+        relay = OutboxRelay(database, message_queue=None, batch_size=2)
+
+        assert relay.run_once() == 4
+        assert database.calls == 3
+
+    def test_bounded_when_outbox_keeps_filling(self):
+        """outbox가 계속 차도 MAX_BATCHES_PER_RUN 배치에서 종료"""
+        database = CountingOutbox([2])
+        relay = OutboxRelay(database, message_queue=None, batch_size=2)
+
+        assert relay.run_once() == 2 * OutboxRelay.MAX_BATCHES_PER_RUN
+        assert database.calls == OutboxRelay.MAX_BATCHES_PER_RUN
+
+    def test_async_bounded(self):
+        """비동기 실행도 같은 규칙으로 종료"""
+        database = CountingAsyncOutbox([2])
+        relay = OutboxRelay(database, message_queue=None, batch_size=2)
+
+        assert asyncio.run(relay.run_once_async()) == 2 * OutboxRelay.MAX_BATCHES_PER_RUN
+        assert database.calls == OutboxRelay.MAX_BATCHES_PER_RUN
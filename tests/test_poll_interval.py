@@ -0,0 +1,32 @@
+"""
+PollInterval 테스트
+"""
+import pytest
+from src.poll_interval import PollInterval
+
+
+class TestPollInterval:
+    """PollInterval 테스트 클래스"""
+
+    def test_backoff_until_max(self):
+        """조용한 주기가 이어지면 최대 주기까지 지수적으로 증가"""
+        interval = PollInterval(min_seconds=30, max_seconds=200, backoff_factor=2.0)
+
+        assert interval.current == 30
+        assert interval.on_quiet() == 60
+        assert interval.on_quiet() == 120
+        assert interval.on_quiet() == 200
+        assert interval.on_quiet() == 200
+
+    def test_new_items_resets_to_min(self):
+        """새 데이터가 나오면 최소 주기로 복귀"""
+        interval = PollInterval(min_seconds=30, max_seconds=200)
+        interval.on_quiet()
+        interval.on_quiet()
+
+        assert interval.on_new_items() == 30
+
+    def test_invalid_range(self):
+        """최대 주기가 최소 주기보다 작으면 예외"""
+        with pytest.raises(ValueError):
+            PollInterval(min_seconds=60, max_seconds=30)
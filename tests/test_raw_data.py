@@ -0,0 +1,58 @@
+"""
+RawData 모델 테스트
+"""
+from datetime import datetime, timedelta, timezone
+from src.models.channel import Channel
+from src.models.raw_data import RawData
+
+
+class TestRawData:
+    """RawData 테스트 클래스"""
+
+    def _raw_data(self, content: str, link: str = "https://example.com/1") -> RawData:
+        return RawData(
+            content=content,
+            link=link,
+            published_at=datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc),
+            channel=Channel.DUMMY,
+        )
+
+    def test_content_hash_ignores_whitespace(self):
+        """공백만 다른 내용은 같은 해시"""
+        assert self._raw_data("Hello   World").content_hash() == self._raw_data("Hello\nWorld").content_hash()
+
+    def test_content_hash_differs_by_link(self):
+        """링크가 다르면 다른 해시"""
+        first = self._raw_data("Hello World", link="https://example.com/1")
+        second = self._raw_data("Hello World", link="https://example.com/2")
+        assert first.content_hash() != second.content_hash()
+
+    def test_record_to_dict_matches_model_dump(self):
+        """RawRecord.to_dict()는 Pydantic JSON 직렬화와 같은 결과"""
+        for published_at in (
+            datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc),
+            datetime(2025, 11, 21, 10, 0, 0, 123456, tzinfo=timezone(timedelta(hours=9))),
+            datetime(2025, 11, 21, 10, 0, 0),
+        ):
+            raw_data = RawData(id=1, content="Hello", link="https://example.com/1", published_at=published_at, channel=Channel.DUMMY)
+            assert raw_data.to_record().to_dict() == raw_data.model_dump(mode="json")
+
+    def test_record_round_trip(self):
+        """RawRecord 변환 후에도 같은 값과 해시"""
+        raw_data = self._raw_data("Hello World")
+        record = raw_data.to_record()
+
+        assert record.content_hash() == raw_data.content_hash()
+        assert RawData.from_record(record) == raw_data
+
+    def test_from_record_behaves_like_model(self):
+        """from_record() 결과도 직렬화, 필드 변경, 복사가 검증 생성과 같이 동작"""
+        raw_data = self._raw_data("Hello World")
+        converted = RawData.from_record(raw_data.to_record())
+
+        assert converted.model_dump(mode="json") == raw_data.model_dump(mode="json")
+        assert converted.model_fields_set == set(RawData.model_fields)
+
+        converted.id = 10
+        assert converted.model_copy().id == 10
+        assert raw_data.id != 10
@@ -0,0 +1,86 @@
+"""
+재발행(replay) 진행 위치 테스트 (fakeredis)
+"""
+import pytest
+from datetime import datetime, timezone
+from typing import List, Optional
+from replay import load_progress, replay
+from src.infrastructure.message_codec import decode_message
+from src.infrastructure.message_queue import MessageQueue
+from src.models.channel import Channel
+from src.models.raw_record import RawRecord
+
+PROGRESS_KEY = "replay:progress:test"
+
+
+class ReplayDatabase:
+    """iter_raw_data의 keyset 페이지를 흉내 내는 Database 대체"""
+
+    def __init__(self, count: int, fail_after_pages: Optional[int] = None):
+        self.records = [
+            RawRecord(
+                content=f"트럼프 발언 테스트 {index}",
+                link=f"https://example.com/{index}",
+                published_at=datetime(2025, 11, 21, 10, index, 0, tzinfo=timezone.utc),
+                channel=Channel.DUMMY,
+                id=index,
+            )
+            for index in range(1, count + 1)
+        ]
+        # 이 페이지 수만큼 넘긴 뒤 중단 (None이면 끝까지)
+        self.fail_after_pages = fail_after_pages
+
+    def iter_raw_data(self, since=None, channel=None, batch_size=500, until=None, after_id=None):
+        rows = [
+            record for record in self.records
+            if since is None
+            or record.published_at > since
+            or (record.published_at == since and (after_id is None or record.id > after_id))
+        ]
+        for page_index, start in enumerate(range(0, len(rows), batch_size)):
+            if self.fail_after_pages is not None and page_index >= self.fail_after_pages:
+                raise KeyboardInterrupt
+            yield rows[start:start + batch_size]
+
+
+def published_ids(message_queue: MessageQueue) -> List[int]:
+    """스트림에 발행된 raw_data id 목록"""
+    entries = message_queue.redis_client.xrange(message_queue.stream_name)
+    return [decode_message(fields)["id"] for _, fields in entries]
+
+
+class TestReplayProgress:
+    """replay 진행 위치 테스트 클래스"""
+
+    @pytest.fixture
+    def message_queue(self, redis_client):
+        return MessageQueue(redis_client)
+
+    def test_resume_after_interrupt(self, message_queue):
+        """중단되면 마지막으로 발행한 페이지 다음부터 이어서 실행"""
+        with pytest.raises(KeyboardInterrupt):
+            replay(ReplayDatabase(5, fail_after_pages=1), message_queue, PROGRESS_KEY, batch_size=2)
+
+        assert published_ids(message_queue) == [1, 2]
+        assert load_progress(message_queue.redis_client, PROGRESS_KEY)["id"] == "2"
+
+        assert replay(ReplayDatabase(5), message_queue, PROGRESS_KEY, batch_size=2) == 3
+        assert published_ids(message_queue) == [1, 2, 3, 4, 5]
+
+    def test_completed_job_not_replayed(self, message_queue):
+        """완료된 작업을 다시 실행하면 발행하지 않고 완료 상태 유지"""
+        assert replay(ReplayDatabase(3), message_queue, PROGRESS_KEY, batch_size=2) == 3
+
+        progress = load_progress(message_queue.redis_client, PROGRESS_KEY)
+        assert progress["count"] == "3"
+        assert "completed_at" in progress
+
+        assert replay(ReplayDatabase(3), message_queue, PROGRESS_KEY, batch_size=2) == 0
+        assert published_ids(message_queue) == [1, 2, 3]
+
+    def test_reset_replays_completed_job(self, message_queue):
+        """--reset(resume=False)이면 완료된 작업도 처음부터 다시 실행"""
+        replay(ReplayDatabase(3), message_queue, PROGRESS_KEY, batch_size=2)
+
+        assert replay(ReplayDatabase(3), message_queue, PROGRESS_KEY, batch_size=2, resume=False) == 3
+        assert published_ids(message_queue) == [1, 2, 3, 1, 2, 3]
@@ -0,0 +1,133 @@
+"""
+StateStore Checkpoint 캐시 테스트 (fakeredis)
+"""
+import pytest
+import redis
+from datetime import datetime, timezone
+from src.infrastructure.state_store import StateStore
+from src.models.channel import Channel
+
+CHECKPOINT_KEY = f"checkpoint:{Channel.DUMMY.value}"
+WRITER_KEY = f"checkpoint-writer:{Channel.DUMMY.value}"
+
+EARLIER = datetime(2025, 11, 21, 10, 0, 0, tzinfo=timezone.utc)
+LATER = datetime(2025, 11, 21, 11, 0, 0, tzinfo=timezone.utc)
+
+
+def write_as_other(redis_client, checkpoint: datetime):
+    """다른 인스턴스의 Checkpoint 기록"""
+    redis_client.set(CHECKPOINT_KEY, checkpoint.isoformat())
+    redis_client.set(WRITER_KEY, "other-instance")
+
+
+class TestCheckpointCache:
+    """Checkpoint 캐시 및 기록자 테스트 클래스"""
+
+    @pytest.fixture
+    def state_store(self, redis_client):
+        store = StateStore(redis_client, write_behind=False)
+        store.cache_ttl_seconds = 300
+        store.foreign_cache_ttl_seconds = 0
+        return store
+
+    def test_owned_checkpoint_cached(self, state_store, redis_client):
+        """직접 기록한 Checkpoint는 cache_ttl_seconds 동안 Redis를 조회하지 않음"""
+        state_store.save_checkpoint(Channel.DUMMY, EARLIER)
+        redis_client.set(CHECKPOINT_KEY, LATER.isoformat())
+
+        assert state_store.get_checkpoint(Channel.DUMMY) == EARLIER
+
+    def test_foreign_checkpoint_not_trusted(self, state_store, redis_client):
+        """다른 인스턴스가 기록한 Checkpoint는 foreign_cache_ttl_seconds가 지나면 다시 조회"""
+        write_as_other(redis_client, EARLIER)
+        assert state_store.get_checkpoint(Channel.DUMMY) == EARLIER
+
+        write_as_other(redis_client, LATER)
+        assert state_store.get_checkpoint(Channel.DUMMY) == LATER
+
+    def test_foreign_checkpoint_cached_briefly(self, state_store, redis_client):
+        """foreign_cache_ttl_seconds 안에서는 일괄 조회 결과를 재사용"""
+        state_store.foreign_cache_ttl_seconds = 60
+        write_as_other(redis_client, EARLIER)
+        state_store.get_checkpoints([Channel.DUMMY])
+
+        write_as_other(redis_client, LATER)
+        assert state_store.get_checkpoint(Channel.DUMMY) == EARLIER
+
+    def test_foreign_writer_invalidates_cache(self, state_store, redis_client):
+        """기록 직전 기록자가 다른 인스턴스면 캐시를 신뢰하지 않음"""
+        state_store.save_checkpoint(Channel.DUMMY, EARLIER)
+        write_as_other(redis_client, LATER)
+
+        # 다음 기록에서 다른 기록자를 감지
+        state_store.save_checkpoint(Channel.DUMMY, LATER)
+        assert redis_client.get(WRITER_KEY) == state_store.instance_id
+
+        write_as_other(redis_client, datetime(2025, 11, 21, 12, 0, 0, tzinfo=timezone.utc))
+        assert state_store.get_checkpoint(Channel.DUMMY).hour == 12
+
+    def test_pipeline_confirm(self, state_store, redis_client):
+        """pipeline 기록은 실행 결과로 확인 콜백을 호출한 뒤에 캐시 반영"""
+        pipe = redis_client.pipeline(transaction=True)
+        confirm = state_store.save_checkpoint(Channel.DUMMY, EARLIER, pipeline=pipe)
+        pipe.set("other-key", 1)
+        confirm(pipe.execute())
+
+        redis_client.set(CHECKPOINT_KEY, LATER.isoformat())
+        assert state_store.get_checkpoint(Channel.DUMMY) == EARLIER
+
+    def test_restart_takes_ownership(self, state_store, redis_client):
+        """재시작 직후(이전 프로세스 기록)에는 첫 기록 뒤 다음 기록부터 캐시 사용"""
+        write_as_other(redis_client, EARLIER)
+        state_store.get_checkpoint(Channel.DUMMY)
+
+        state_store.save_checkpoint(Channel.DUMMY, LATER)
+        state_store.save_checkpoint(Channel.DUMMY, LATER)
+        redis_client.set(CHECKPOINT_KEY, EARLIER.isoformat())
+
+        assert state_store.get_checkpoint(Channel.DUMMY) == LATER
+
+
+class TestWriteBehind:
+    """쓰기 지연 모드 테스트 클래스"""
+
+    @pytest.fixture
+    def state_store(self, redis_client):
+        return StateStore(redis_client, write_behind=True)
+
+    def test_pending_until_flush(self, state_store, redis_client):
+        """flush() 전에는 Redis에 기록하지 않고 조회는 기록 대기 값을 사용"""
+        state_store.save_checkpoint(Channel.DUMMY, EARLIER)
+
+        assert redis_client.get(CHECKPOINT_KEY) is None
+        assert state_store.get_checkpoint(Channel.DUMMY) == EARLIER
+
+        state_store.flush()
+
+        assert redis_client.get(CHECKPOINT_KEY) == EARLIER.isoformat()
+        assert redis_client.get(WRITER_KEY) == state_store.instance_id
+
+    def test_keeps_latest_pending(self, state_store, redis_client):
+        """같은 채널은 가장 최신 Checkpoint만 기록"""
+        state_store.save_checkpoint(Channel.DUMMY, LATER)
+        state_store.save_checkpoint(Channel.DUMMY, EARLIER)
+        state_store.flush()
+
+        assert redis_client.get(CHECKPOINT_KEY) == LATER.isoformat()
+
+    def test_failed_flush_requeued(self, state_store, redis_client, monkeypatch):
+        """flush() 실패 시 기록 대기 목록에 되돌려 다음 flush()에서 기록"""
+        state_store.save_checkpoint(Channel.DUMMY, EARLIER)
+
+        def broken_pipeline(*args, **kwargs):
+            raise redis.ConnectionError("연결 끊김")
+
+        monkeypatch.setattr(redis_client, "pipeline", broken_pipeline)
+        state_store.flush()
+        monkeypatch.undo()
+
+        assert redis_client.get(CHECKPOINT_KEY) is None
+        assert state_store.get_checkpoint(Channel.DUMMY) == EARLIER
+
+        state_store.flush()
+        assert redis_client.get(CHECKPOINT_KEY) == EARLIER.isoformat()
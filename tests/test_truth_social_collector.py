@@ -65,3 +65,29 @@ class TestTruthSocialCollector:
         result = collector._parse_published_date(entry)
 
         assert result is None
+
+    def test_conditional_headers_after_commit(self, collector):
+        """검증자는 commit_validators() 이후에만 조건부 요청 헤더에 반영"""
+        import httpx
+
+        response = httpx.Response(
+            200,
+            headers={"ETag": '"abc"', "Last-Modified": "Sun, 23 Nov 2025 12:00:00 GMT"},
+        )
+
+        assert collector._conditional_headers() == {}
+        collector._remember_validators(response)
+
+        # 확정 전에는 이전 검증자 사용
+        assert collector.validators == {}
+
+        committed = collector.commit_validators()
+        assert committed == {"etag": '"abc"', "last_modified": "Sun, 23 Nov 2025 12:00:00 GMT"}
+        assert collector._conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sun, 23 Nov 2025 12:00:00 GMT",
+        }
+
+        # 변경 없으면 다시 저장하지 않음
+        collector._remember_validators(response)
+        assert collector.commit_validators() is None